@@ -0,0 +1,190 @@
+# attacks.py
+
+"""
+Attack tables computed once at import time.
+
+Every table is indexed by square (row * 8 + col, see bitboard.py). The
+*_ATTACKS tables hold bitboards and the *_TARGETS tables hold the same
+squares as (row, col) tuples, for callers that work with Board.positions.
+"""
+
+from bitboard import square_bit
+
+KNIGHT_DELTAS = (
+    (2, 1), (2, -1), (-2, 1), (-2, -1),
+    (1, 2), (1, -2), (-1, 2), (-1, -2)
+)
+
+KING_DELTAS = (
+    (1, 1), (1, 0), (1, -1), (0, 1),
+    (0, -1), (-1, 1), (-1, 0), (-1, -1)
+)
+
+
+def _step_tables(deltas):
+    """
+    Builds the attack tables of a piece that jumps by fixed deltas.
+
+    Parameters:
+        deltas (tuple): The (row, column) offsets the piece can move by.
+
+    Returns:
+        tuple: A tuple (masks, targets) with one entry per square.
+    """
+    masks = []
+    targets = []
+    for row in range(8):
+        for col in range(8):
+            squares = tuple((row + dx, col + dy) for dx, dy in deltas
+                            if 0 <= row + dx < 8 and 0 <= col + dy < 8)
+            targets.append(squares)
+            masks.append(sum(square_bit(x, y) for x, y in squares))
+    return tuple(masks), tuple(targets)
+
+
+KNIGHT_ATTACKS, KNIGHT_TARGETS = _step_tables(KNIGHT_DELTAS)
+KING_ATTACKS, KING_TARGETS = _step_tables(KING_DELTAS)
+
+# Pawn captures, keyed by the row direction the pawn advances in (-1 white, 1 black)
+PAWN_ATTACKS = {
+    direction: _step_tables(((direction, 1), (direction, -1)))[0]
+    for direction in (-1, 1)
+}
+
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _ray_tables():
+    """
+    Builds, for every direction, the ray of squares from each square to the edge.
+
+    Returns:
+        dict: A mapping of (dx, dy) to a tuple of 64 ray bitboards.
+    """
+    rays = {}
+    for dx, dy in ROOK_DIRECTIONS + BISHOP_DIRECTIONS:
+        masks = []
+        for row in range(8):
+            for col in range(8):
+                mask = 0
+                x, y = row + dx, col + dy
+                while 0 <= x < 8 and 0 <= y < 8:
+                    mask |= square_bit(x, y)
+                    x += dx
+                    y += dy
+                masks.append(mask)
+        rays[(dx, dy)] = tuple(masks)
+    return rays
+
+
+RAYS = _ray_tables()
+
+# Rays whose square indexes grow away from the origin meet their first
+# blocker at the lowest set bit, the others at the highest one.
+_ASCENDING = {direction: direction[0] > 0 or (direction[0] == 0 and direction[1] > 0)
+              for direction in RAYS}
+
+
+def _slider_attacks(square, occupied, directions):
+    """
+    Returns the squares a sliding piece attacks along the given directions.
+
+    Parameters:
+        square (int): The square the piece stands on.
+        occupied (int): Bitboard of occupied squares.
+        directions (tuple): The (dx, dy) directions the piece slides along.
+
+    Returns:
+        int: Bitboard of attacked squares, including the first blocker on each ray.
+    """
+    attacks = 0
+    for direction in directions:
+        ray = RAYS[direction][square]
+        blockers = ray & occupied
+        if blockers:
+            if _ASCENDING[direction]:
+                blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                blocker = blockers.bit_length() - 1
+            ray ^= RAYS[direction][blocker]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(square, occupied):
+    """
+    Returns the squares a rook on 'square' attacks given the board occupancy.
+
+    Parameters:
+        square (int): The square the rook stands on.
+        occupied (int): Bitboard of occupied squares.
+
+    Returns:
+        int: Bitboard of attacked squares.
+    """
+    return _slider_attacks(square, occupied, ROOK_DIRECTIONS)
+
+
+def bishop_attacks(square, occupied):
+    """
+    Returns the squares a bishop on 'square' attacks given the board occupancy.
+
+    Parameters:
+        square (int): The square the bishop stands on.
+        occupied (int): Bitboard of occupied squares.
+
+    Returns:
+        int: Bitboard of attacked squares.
+    """
+    return _slider_attacks(square, occupied, BISHOP_DIRECTIONS)
+
+
+def queen_attacks(square, occupied):
+    """
+    Returns the squares a queen on 'square' attacks given the board occupancy.
+
+    Parameters:
+        square (int): The square the queen stands on.
+        occupied (int): Bitboard of occupied squares.
+
+    Returns:
+        int: Bitboard of attacked squares.
+    """
+    return (_slider_attacks(square, occupied, ROOK_DIRECTIONS)
+            | _slider_attacks(square, occupied, BISHOP_DIRECTIONS))
+
+
+# Squares reachable on an empty board, used to test alignment in one lookup
+ROOK_MOVES = tuple(rook_attacks(square, 0) for square in range(64))
+BISHOP_MOVES = tuple(bishop_attacks(square, 0) for square in range(64))
+QUEEN_MOVES = tuple(rook | bishop for rook, bishop in zip(ROOK_MOVES, BISHOP_MOVES))
+
+
+def _between_tables():
+    """
+    Builds the squares strictly between every pair of aligned squares.
+
+    Returns:
+        tuple: A tuple (masks, squares) of 64x64 tables. For squares that are
+        not on a common line the mask is 0 and the squares entry is None.
+    """
+    masks = [[0] * 64 for _ in range(64)]
+    squares = [[None] * 64 for _ in range(64)]
+    for origin in range(64):
+        row, col = divmod(origin, 8)
+        squares[origin][origin] = ()
+        for dx, dy in RAYS:
+            path = []
+            x, y = row + dx, col + dy
+            while 0 <= x < 8 and 0 <= y < 8:
+                target = x * 8 + y
+                squares[origin][target] = tuple(path)
+                masks[origin][target] = sum(square_bit(px, py) for px, py in path)
+                path.append((x, y))
+                x += dx
+                y += dy
+    return tuple(map(tuple, masks)), tuple(map(tuple, squares))
+
+
+BETWEEN, BETWEEN_SQUARES = _between_tables()
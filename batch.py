@@ -0,0 +1,204 @@
+# batch.py
+
+"""
+Batch replay and analysis of game collections over a process pool.
+
+A game is one line of moves in the notation Chess.move reads, each move
+written as origin and destination: "E7E5 B2B4 ..." (a dash, "E7-E5", is
+also accepted). Blank lines and lines starting with '#' are skipped. Games
+come from a stream with one game per line, or from a directory of '.txt'
+files read in name order.
+
+Games are sent to the workers in chunks, and at most 'max_pending' chunks
+are in flight at a time, so memory stays bounded however large the input.
+Results come back as soon as their chunk is done, one JSON object per game.
+
+    python batch.py games/ --workers 8 > results.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from chess import Chess
+from moves import ChessInvalid
+from piece import WHITE, BLACK
+from evaluation import score_board
+from search import search
+from sources import iter_lines, source_name
+
+
+def iter_games(source):
+    """
+    Yields the games of a file, stream or directory, one at a time.
+
+    Parameters:
+        source (str or file): A directory, a file path, '-' for standard input,
+            or an open text stream.
+
+    Yields:
+        tuple: (game_id, moves), where game_id is "<name>:<line>" and moves is a list of strings.
+    """
+    if isinstance(source, str) and os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith(".txt"):
+                yield from _iter_stream(iter_lines(os.path.join(source, name)), name)
+    else:
+        yield from _iter_stream(iter_lines(source), source_name(source))
+
+
+def _iter_stream(stream, name):
+    """
+    Yields the games of an open text stream.
+
+    Parameters:
+        stream (iterable): The lines, one game per line (see sources.iter_lines).
+        name (str): The name used in the game ids.
+
+    Yields:
+        tuple: (game_id, moves).
+    """
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield f"{name}:{number}", line.split()
+
+
+def analyze_game(game_id, moves, depth=0):
+    """
+    Replays one game through Chess.move and evaluates the final position.
+
+    Parameters:
+        game_id (str): The identifier reported with the result.
+        moves (list): The moves, e.g. ["E7E5", "B2B4"].
+        depth (int): If above 0, also search the final position to this depth.
+
+    Returns:
+        dict: The game id, the number of moves played, the game result (or None),
+        the first error (or None), the side to move, the material of each side,
+        the static evaluation (centipawns, white's point of view) and, with a
+        depth, the engine's best move and score.
+    """
+    chess = Chess()
+    played = 0
+    result = None
+    error = None
+    for move in moves:
+        move = move.replace("-", "")
+        try:
+            outcome = chess.move(move[:2], move[2:])
+        except (ChessInvalid, ValueError) as e:
+            error = f"move {played + 1} ({move}): {e}"
+            break
+        played += 1
+        if outcome is not True:
+            result = outcome
+            break
+
+    board = chess.board
+    record = {
+        "id": game_id,
+        "moves": played,
+        "result": result,
+        "error": error,
+        "turn": chess.turn,
+        "material": {WHITE: board.material(WHITE), BLACK: board.material(BLACK)},
+        "evaluation": score_board(board),
+    }
+    if depth > 0 and result is None:
+        found = search(chess, depth=depth)
+        record["best_move"] = found.move
+        record["score"] = found.score
+    return record
+
+
+def _analyze_chunk(chunk, depth):
+    """
+    Analyzes a chunk of games inside a worker process.
+
+    Parameters:
+        chunk (list): (game_id, moves) tuples.
+        depth (int): The search depth passed to analyze_game.
+
+    Returns:
+        list: One result dict per game.
+    """
+    return [analyze_game(game_id, moves, depth) for game_id, moves in chunk]
+
+
+def _chunks(games, size):
+    """
+    Groups an iterable of games into lists of at most 'size' games.
+
+    Parameters:
+        games (iterable): The games.
+        size (int): The chunk size.
+
+    Yields:
+        list: The next chunk.
+    """
+    games = iter(games)
+    while True:
+        chunk = list(islice(games, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def analyze_games(games, workers=None, chunk_size=32, max_pending=None, depth=0):
+    """
+    Analyzes games across a process pool, yielding results as they finish.
+
+    Parameters:
+        games (iterable): (game_id, moves) tuples, e.g. from iter_games.
+        workers (int): The number of worker processes; one per core if None.
+        chunk_size (int): How many games each task carries.
+        max_pending (int): How many chunks may be queued or running at once;
+            twice the number of workers if None.
+        depth (int): If above 0, also search each final position to this depth.
+
+    Yields:
+        dict: One result per game, in completion order.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    chunks = _chunks(games, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in islice(chunks, max_pending):
+            pending.add(pool.submit(_analyze_chunk, chunk, depth))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Refill before yielding so the workers stay busy while results are written
+            for chunk in islice(chunks, len(done)):
+                pending.add(pool.submit(_analyze_chunk, chunk, depth))
+            for future in done:
+                yield from future.result()
+
+
+def main(argv=None):
+    """
+    Analyzes the games named on the command line and writes JSON lines.
+
+    Parameters:
+        argv (list): Command line arguments; sys.argv[1:] if None.
+    """
+    parser = argparse.ArgumentParser(description="Replay and evaluate games in parallel.")
+    parser.add_argument("source", help="a directory of .txt files, a file, or - for stdin")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=32)
+    parser.add_argument("--depth", type=int, default=0, help="search depth for the final position")
+    args = parser.parse_args(argv)
+
+    for record in analyze_games(iter_games(args.source), workers=args.workers,
+                                chunk_size=args.chunk_size, depth=args.depth):
+        sys.stdout.write(json.dumps(record) + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
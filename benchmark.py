@@ -0,0 +1,200 @@
+# benchmark.py
+
+"""
+Benchmarks for the engine and the rules code.
+
+Run 'python benchmark.py <name>' to print the results of one benchmark.
+"""
+
+import argparse
+import gc
+import io
+import random
+import sys
+import time
+import tracemalloc
+from board import Board
+from chess import Chess
+from parallel import ParallelSearch
+from pgn import format_san, replay_games
+
+
+def smp_speedup(worker_counts=(1, 2, 4, 8), depth=5, size_mb=64):
+    """
+    Measures how parallel search scales with the number of workers.
+
+    Each worker count searches the initial position to a fixed depth with a
+    fresh shared table. The speedup is the one-worker time divided by the time
+    with n workers (time to depth), and the node rate shows how much total work
+    the workers get through.
+
+    Parameters:
+        worker_counts (tuple): The numbers of workers to try.
+        depth (int): The search depth in plies.
+        size_mb (float): The size of the shared table, in megabytes.
+
+    Returns:
+        list: One dict per worker count with 'workers', 'seconds', 'nodes', 'nps' and 'speedup'.
+    """
+    rows = []
+    for workers in worker_counts:
+        with ParallelSearch(workers, size_mb) as engine:
+            # Warm the pool up so process start-up is not timed
+            engine.search(Chess(), depth=1)
+            engine.memory.buf[:] = bytes(len(engine.memory.buf))
+            start = time.perf_counter()
+            result = engine.search(Chess(), depth=depth)
+            seconds = time.perf_counter() - start
+        rows.append({"workers": workers, "seconds": seconds, "nodes": result.nodes,
+                     "nps": result.nodes / seconds if seconds else 0.0})
+    for row in rows:
+        row["speedup"] = rows[0]["seconds"] / row["seconds"] if row["seconds"] else 0.0
+    return rows
+
+
+def print_smp_speedup(args):
+    """
+    Prints the parallel search speedup table.
+
+    Parameters:
+        args (Namespace): The parsed command line options.
+    """
+    print(f"{'workers':>8} {'seconds':>9} {'nodes':>10} {'nps':>9} {'speedup':>8}")
+    for row in smp_speedup(depth=args.depth):
+        print(f"{row['workers']:>8} {row['seconds']:>9.2f} {row['nodes']:>10} "
+              f"{row['nps']:>9.0f} {row['speedup']:>8.2f}")
+
+
+def board_memory(count=1000):
+    """
+    Measures the memory a Board in the initial position takes, with tracemalloc.
+
+    Parameters:
+        count (int): How many boards to allocate; the result is the average.
+
+    Returns:
+        dict: 'boards', 'bytes_per_board' and 'bytes_per_piece' (the size of one piece object).
+    """
+    Board()  # Import-time tables and caches are not part of a board
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        boards = [Board() for _ in range(count)]
+        total = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    piece = boards[0].get_piece(0, 0)
+    size = sys.getsizeof(piece)
+    if hasattr(piece, "__dict__"):
+        size += sys.getsizeof(piece.__dict__)
+    return {"boards": count, "bytes_per_board": total / count, "bytes_per_piece": size}
+
+
+def print_board_memory(args):
+    """
+    Prints the memory used per Board.
+
+    Parameters:
+        args (Namespace): The parsed command line options.
+    """
+    result = board_memory(args.count)
+    print(f"{result['boards']} boards: {result['bytes_per_board']:.0f} bytes per board, "
+          f"{result['bytes_per_piece']} bytes per piece")
+
+
+def random_pgn(games=200, plies=80, seed=0):
+    """
+    Writes games of random moves as PGN text, to benchmark the reader without an archive.
+
+    Parameters:
+        games (int): The number of games.
+        plies (int): The number of moves (plies) per game, fewer if a side runs out of moves.
+        seed (int): The random seed, so runs are comparable.
+
+    Returns:
+        str: The PGN text.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for number in range(1, games + 1):
+        board = Board()
+        moves = []
+        for ply in range(plies):
+            candidates = list(board.legal_moves(board.side_to_move))
+            if not candidates:
+                break
+            piece, destination = rng.choice(candidates)
+            san = format_san(board, piece, destination)
+            moves.append(f"{ply // 2 + 1}. {san}" if ply % 2 == 0 else san)
+            board.push((piece, destination))
+        lines.append(f'[Event "Random {number}"]\n[Result "*"]\n\n{" ".join(moves)} *\n')
+    return "\n".join(lines)
+
+
+def pgn_throughput(path=None, games=200, plies=80):
+    """
+    Measures how many games per second the PGN reader parses and replays.
+
+    Parameters:
+        path (str): A PGN file to read; random games if None.
+        games (int): The number of random games when no file is given.
+        plies (int): The length of the random games.
+
+    Returns:
+        dict: 'games', 'moves', 'errors', 'seconds' and 'games_per_second'.
+    """
+    source = path if path is not None else io.StringIO(random_pgn(games, plies))
+    count = moves = errors = 0
+    start = time.perf_counter()
+    for game, _, error in replay_games(source):
+        count += 1
+        moves += len(game.moves)
+        errors += error is not None
+    seconds = time.perf_counter() - start
+    return {"games": count, "moves": moves, "errors": errors, "seconds": seconds,
+            "games_per_second": count / seconds if seconds else 0.0}
+
+
+def print_pgn_throughput(args):
+    """
+    Prints the PGN replay throughput.
+
+    Parameters:
+        args (Namespace): The parsed command line options.
+    """
+    result = pgn_throughput(args.file, args.games, args.plies)
+    print(f"{result['games']} games, {result['moves']} moves, {result['errors']} errors "
+          f"in {result['seconds']:.2f}s: {result['games_per_second']:.1f} games/s")
+
+
+def main(argv=None):
+    """
+    Runs the benchmark named on the command line.
+
+    Parameters:
+        argv (list): Command line arguments; sys.argv[1:] if None.
+    """
+    parser = argparse.ArgumentParser(description="Engine and rules benchmarks.")
+    benchmarks = parser.add_subparsers(dest="benchmark", required=True)
+
+    smp = benchmarks.add_parser("smp", help="parallel search speedup at 1/2/4/8 workers")
+    smp.add_argument("--depth", type=int, default=5)
+    smp.set_defaults(run=print_smp_speedup)
+
+    memory = benchmarks.add_parser("memory", help="bytes per Board, measured with tracemalloc")
+    memory.add_argument("--count", type=int, default=1000)
+    memory.set_defaults(run=print_board_memory)
+
+    pgn = benchmarks.add_parser("pgn", help="PGN parse and replay throughput in games/s")
+    pgn.add_argument("file", nargs="?", help="a PGN file; random games if omitted")
+    pgn.add_argument("--games", type=int, default=200)
+    pgn.add_argument("--plies", type=int, default=80)
+    pgn.set_defaults(run=print_pgn_throughput)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
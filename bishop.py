@@ -1,12 +1,17 @@
 # game/bishop.py
 
 from piece import Piece, WHITE, BLACK
+from attacks import BISHOP_MOVES, bishop_attacks
+from bitboard import square_index
 
 class Bishop(Piece):
     """
     Represents a bishop chess piece, inheriting from the Piece base class.
     """
 
+    symbol = "b"
+    __slots__ = ()
+
     def __init__(self, color, position):
         """
         Initializes a Bishop instance with a color and position.
@@ -51,4 +56,20 @@ class Bishop(Piece):
         if destination_piece is not None and destination_piece.color == self.color:
             return False
 
-        return self.diagonal_move(positions, new_position)
+        # Verificar que la nueva posición esté en una diagonal del alfil
+        if not BISHOP_MOVES[square_index(current_x, current_y)] >> square_index(new_x, new_y) & 1:
+            return False
+
+        return self.is_path_clear(positions, self.position, new_position)
+
+    def attacks(self, occupied):
+        """
+        Returns the squares the bishop attacks, stopping at the first piece on each diagonal.
+
+        Parameters:
+            occupied (int): Bitboard of occupied squares.
+
+        Returns:
+            int: Bitboard of attacked squares.
+        """
+        return bishop_attacks(square_index(*self.position), occupied)
@@ -0,0 +1,94 @@
+# bitboard.py
+
+"""
+Helpers for working with 64-bit bitboards.
+
+Square indexes follow the layout of Board.positions: index = row * 8 + col,
+so bit 0 is (0, 0) and bit 63 is (7, 7).
+"""
+
+ALL_SQUARES = (1 << 64) - 1
+
+
+def square_index(row, col):
+    """
+    Converts board coordinates into a square index.
+
+    Parameters:
+        row (int): The row index (0-7).
+        col (int): The column index (0-7).
+
+    Returns:
+        int: The square index (0-63).
+    """
+    return row * 8 + col
+
+
+def square_position(index):
+    """
+    Converts a square index back into board coordinates.
+
+    Parameters:
+        index (int): The square index (0-63).
+
+    Returns:
+        tuple: The position as (row, column).
+    """
+    return divmod(index, 8)
+
+
+def square_bit(row, col):
+    """
+    Returns the bitboard with only the given square set.
+
+    Parameters:
+        row (int): The row index (0-7).
+        col (int): The column index (0-7).
+
+    Returns:
+        int: A mask with a single bit set.
+    """
+    return 1 << (row * 8 + col)
+
+
+def popcount(mask):
+    """
+    Counts the squares set in a bitboard.
+
+    Parameters:
+        mask (int): The bitboard.
+
+    Returns:
+        int: The number of bits set.
+    """
+    return mask.bit_count()
+
+
+def iter_squares(mask):
+    """
+    Yields the index of every square set in a bitboard, lowest first.
+
+    Parameters:
+        mask (int): The bitboard.
+
+    Yields:
+        int: Square indexes (0-63).
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def square_name(position):
+    """
+    Names a square the way Chess.translate_input reads it, e.g. (1, 0) -> 'A2'.
+
+    Parameters:
+        position (tuple): The position as (row, column).
+
+    Returns:
+        str: The column letter followed by the row number.
+    """
+    row, col = position
+    return f"{'ABCDEFGH'[col]}{row + 1}"
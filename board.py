@@ -1,11 +1,19 @@
-from piece import Piece
+from piece import Piece, WHITE, BLACK
 from bishop import Bishop
 from king import King
 from knight import Knight
 from pawn import Pawn
 from queen import Queen
 from rook import Rook
-from moves import PieceError, MoveError, MovePieceInvalid, KingError
+from moves import PieceError, MoveError, MovePieceInvalid, KingError, CheckError
+from bitboard import square_index, square_bit
+from legality import (
+    cached, find_attacks, find_checkers, find_pins, find_king_danger, legal_destinations
+)
+from zobrist import PIECE_KEYS, SIDE_KEY
+from evaluation import SQUARE_VALUES
+from encoding import Snapshot, piece_code, decode_piece
+from fen import parse_fen, format_fen, iter_fens
 
 class Board:
     """
@@ -21,6 +29,7 @@ class Board:
             for_test (bool): If True, the board will be empty for testing purposes.
         """
         self.positions = [[None for _ in range(8)] for _ in range(8)]
+        self.reset_state()
 
         if not for_test:
             self.setup_pieces()
@@ -29,29 +38,45 @@ class Board:
         """
         Sets up all the chess pieces on the board in their initial positions.
         """
-        # Black pieces
-        self.positions[0][0] = Rook("black", (0, 0))
-        self.positions[0][1] = Knight("black", (0, 1))
-        self.positions[0][2] = Bishop("black", (0, 2))
-        self.positions[0][3] = Queen("black", (0, 3))
-        self.positions[0][4] = King("black", (0, 4))
-        self.positions[0][5] = Bishop("black", (0, 5))
-        self.positions[0][6] = Knight("black", (0, 6))
-        self.positions[0][7] = Rook("black", (0, 7))
-
-        for i in range(8):
-            self.positions[1][i] = Pawn("black", (1, i))
-            self.positions[6][i] = Pawn("white", (6, i))
-
-        # White pieces
-        self.positions[7][0] = Rook("white", (7, 0))
-        self.positions[7][1] = Knight("white", (7, 1))
-        self.positions[7][2] = Bishop("white", (7, 2))
-        self.positions[7][3] = Queen("white", (7, 3))
-        self.positions[7][4] = King("white", (7, 4))
-        self.positions[7][5] = Bishop("white", (7, 5))
-        self.positions[7][6] = Knight("white", (7, 6))
-        self.positions[7][7] = Rook("white", (7, 7))
+        back_rank = (Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook)
+
+        for col, piece_class in enumerate(back_rank):
+            # Black pieces
+            self.set_piece_on_board(0, col, piece_class("black", (0, col)))
+            self.set_piece_on_board(1, col, Pawn("black", (1, col)))
+            # White pieces
+            self.set_piece_on_board(6, col, Pawn("white", (6, col)))
+            self.set_piece_on_board(7, col, piece_class("white", (7, col)))
+
+    def reset_state(self):
+        """
+        Resets the incrementally maintained board state to an empty board.
+
+        The board keeps one 64-bit mask per (color, piece symbol) in 'bitboards',
+        plus the occupancy of each color and of the whole board. Bit
+        row * 8 + col is set when that square holds a matching piece.
+        'piece_squares' maps every piece on the board to its (row, col) and
+        'piece_lists' holds the pieces of each (color, piece symbol), and
+        'piece_counts'/'color_counts' keep the running material counts.
+        'move_stack' records the moves made with push so pop can take them back.
+        'zobrist_key' is the position's 64-bit hash (see zobrist.py), covering
+        the pieces and 'side_to_move'. 'scores' holds each color's material
+        and piece-square value (see evaluation.py).
+        'cache' keeps what is derived from the current position, such as
+        attack maps, checkers and pins; any change to the pieces empties it.
+        """
+        self.bitboards = {}
+        self.occupancy = {WHITE: 0, BLACK: 0}
+        self.occupied = 0
+        self.piece_squares = {}
+        self.piece_lists = {}
+        self.piece_counts = {}
+        self.color_counts = {WHITE: 0, BLACK: 0}
+        self.move_stack = []
+        self.side_to_move = WHITE
+        self.zobrist_key = 0
+        self.scores = {WHITE: 0, BLACK: 0}
+        self.cache = {}
 
     def get_piece(self, row, col):
         """
@@ -75,7 +100,67 @@ class Board:
             col (int): The column index (0-7) where the piece will be placed.
             piece (Piece): The chess piece to place on the board.
         """
+        self.remove_piece(row, col)
+        if piece is not None:
+            self.add_piece(row, col, piece)
+
+    def add_piece(self, row, col, piece):
+        """
+        Puts a piece on an empty square and updates the bitboards.
+
+        A piece that is already on the board is taken off its old square first,
+        and the piece's own position is set to the new square.
+
+        Parameters:
+            row (int): The row index (0-7).
+            col (int): The column index (0-7).
+            piece (Piece): The chess piece to place on the board.
+        """
+        if piece in self.piece_squares:
+            self.remove_piece(*self.piece_squares[piece])
         self.positions[row][col] = piece
+        piece.position = (row, col)
+        self.cache.clear()
+        bit = 1 << square_index(row, col)
+        key = (piece.color, piece.symbol)
+        self.piece_squares[piece] = (row, col)
+        self.zobrist_key ^= PIECE_KEYS[key][square_index(row, col)]
+        self.scores[piece.color] = self.scores.get(piece.color, 0) + SQUARE_VALUES[key][square_index(row, col)]
+        self.piece_lists.setdefault(key, []).append(piece)
+        self.piece_counts[key] = self.piece_counts.get(key, 0) + 1
+        self.color_counts[piece.color] = self.color_counts.get(piece.color, 0) + 1
+        self.bitboards[key] = self.bitboards.get(key, 0) | bit
+        self.occupancy[piece.color] = self.occupancy.get(piece.color, 0) | bit
+        self.occupied |= bit
+
+    def remove_piece(self, row, col):
+        """
+        Takes the piece off a square and updates the bitboards.
+
+        Parameters:
+            row (int): The row index (0-7).
+            col (int): The column index (0-7).
+
+        Returns:
+            Piece or None: The piece that was on the square, or None if it was empty.
+        """
+        piece = self.positions[row][col]
+        if piece is None:
+            return None
+        self.positions[row][col] = None
+        self.cache.clear()
+        mask = ~(1 << square_index(row, col))
+        key = (piece.color, piece.symbol)
+        del self.piece_squares[piece]
+        self.zobrist_key ^= PIECE_KEYS[key][square_index(row, col)]
+        self.scores[piece.color] -= SQUARE_VALUES[key][square_index(row, col)]
+        self.piece_lists[key].remove(piece)
+        self.piece_counts[key] -= 1
+        self.color_counts[piece.color] -= 1
+        self.bitboards[key] &= mask
+        self.occupancy[piece.color] &= mask
+        self.occupied &= mask
+        return piece
 
     def find_piece(self, piece):
         """
@@ -87,11 +172,23 @@ class Board:
         Returns:
             tuple or None: A tuple (row, col) indicating the piece's position, or None if not found.
         """
-        for row in range(8):
-            for col in range(8):
-                if self.positions[row][col] == piece:
-                    return (row, col)
-        return None
+        return self.piece_squares.get(piece)
+
+    def pieces(self, color, symbol=None):
+        """
+        Lists the pieces of a color currently on the board.
+
+        Parameters:
+            color (str): The color of the pieces, "white" or "black".
+            symbol (str): Optional piece symbol (e.g. "n") to list only one piece type.
+
+        Returns:
+            list: The matching pieces.
+        """
+        if symbol is not None:
+            return list(self.piece_lists.get((color, symbol), ()))
+        return [piece for (piece_color, _), pieces in self.piece_lists.items()
+                if piece_color == color for piece in pieces]
 
     def move(self, piece, destination):
         """
@@ -127,21 +224,201 @@ class Board:
             MovePieceInvalid: If the move is invalid for the piece type.
             MoveError: If the destination is occupied by a friendly piece.
             KingError: If attempting to capture the opponent's king.
+            CheckError: If the move would leave the player's own king in check.
         """
         current_position = self.find_piece(piece)
         if current_position is None:
             raise PieceError("Piece not found on the board.")
 
-        if not piece.check_move(self.positions, destination):
+        if not self.can_reach(piece, destination):
             raise MovePieceInvalid("Invalid piece movement.")
 
-        dest_piece = self.get_piece(*destination)
-        if dest_piece is not None:
-            if dest_piece.color == piece.color:
+        bit = 1 << square_index(*destination)
+        if self.occupied & bit:
+            if self.occupancy[piece.color] & bit:
                 raise MoveError("You cannot move to a square occupied by your own piece.")
-            if isinstance(dest_piece, King):
+            if isinstance(self.get_piece(*destination), King):
                 raise KingError("You cannot capture the opponent's king.")
 
+        if not self.legal_mask(piece) & bit:
+            raise CheckError("This move would leave your king in check.")
+
+    def can_reach(self, piece, destination):
+        """
+        Checks whether a piece's movement rules allow it to reach a destination.
+
+        Pieces with attack tables are answered with a bitboard test against
+        the current occupancy; any other piece falls back to its check_move.
+
+        Parameters:
+            piece (Piece): The piece attempting to move.
+            destination (tuple): A tuple (row, col) representing the destination position.
+
+        Returns:
+            bool: True if the piece can move to the destination, False otherwise.
+        """
+        targets = piece.move_mask(self)
+        if targets is None:
+            return piece.check_move(self.positions, destination)
+        row, col = destination
+        if not (0 <= row < 8 and 0 <= col < 8):
+            return False
+        return bool(targets >> square_index(row, col) & 1)
+
+    def target_mask(self, piece):
+        """
+        Returns every square the piece can legally move to as a bitboard.
+
+        Starts from the piece's movement pattern and removes the squares
+        validate_move would reject, such as the opponent's king or a square
+        that leaves the piece's own king in check.
+
+        Parameters:
+            piece (Piece): A piece on this board.
+
+        Returns:
+            int: Bitboard of valid destinations.
+        """
+        targets = piece.move_mask(self)
+        if targets is None:
+            targets = 0
+            for row in range(8):
+                for col in range(8):
+                    if piece.check_move(self.positions, (row, col)):
+                        targets |= square_bit(row, col)
+        own = self.occupancy.get(piece.color, 0)
+        kings = self.bitboards.get((WHITE, "k"), 0) | self.bitboards.get((BLACK, "k"), 0)
+        return targets & ~own & ~kings & self.legal_mask(piece)
+
+    def attack_map(self, color):
+        """
+        Returns every square a side attacks, computed once per position.
+
+        Parameters:
+            color (str): The attacking side, "white" or "black".
+
+        Returns:
+            int: Bitboard of attacked squares, including squares holding pieces of either color.
+        """
+        return cached(self, "attacks", find_attacks, color)
+
+    def checkers(self, color):
+        """
+        Returns the enemy pieces giving check to a side's king, computed once per position.
+
+        Parameters:
+            color (str): The side whose king is looked at.
+
+        Returns:
+            int: Bitboard of the checking pieces; 0 if not in check or without a king.
+        """
+        return cached(self, "checkers", find_checkers, color)
+
+    def in_check(self, color):
+        """
+        Tells whether a side's king is attacked.
+
+        Parameters:
+            color (str): The side, "white" or "black".
+
+        Returns:
+            bool: True if the king is in check.
+        """
+        return bool(self.checkers(color))
+
+    def pins(self, color):
+        """
+        Finds a side's pinned pieces, computed once per position (see legality.find_pins).
+
+        Parameters:
+            color (str): The side whose pieces are looked at.
+
+        Returns:
+            dict: Square index of each pinned piece -> bitboard of the squares it may still move to.
+        """
+        return cached(self, "pins", find_pins, color)
+
+    def king_danger(self, color):
+        """
+        Returns the squares a side's king may not move to, computed once per position.
+
+        Parameters:
+            color (str): The side whose king is looked at.
+
+        Returns:
+            int: Bitboard of the squares attacked by the other side.
+        """
+        return cached(self, "danger", find_king_danger, color)
+
+    def legal_mask(self, piece):
+        """
+        Returns the squares a piece may move to without leaving its own king in check.
+
+        Parameters:
+            piece (Piece): A piece on this board.
+
+        Returns:
+            int: Bitboard of allowed destinations (see legality.legal_destinations).
+        """
+        return legal_destinations(self, piece)
+
+    def legal_moves(self, color):
+        """
+        Yields every valid move for one side, computed from the movement patterns.
+
+        The moves come from move_list, so they are generated once per position.
+
+        Parameters:
+            color (str): The side to generate moves for, "white" or "black".
+
+        Yields:
+            tuple: Moves as (piece, destination), where destination is (row, col).
+        """
+        yield from self.move_list(color)
+
+    def move_list(self, color):
+        """
+        Lists every valid move for one side, generated once per position.
+
+        The list is cached until the pieces change, so asking again (to
+        detect the end of the game, then to search, say) costs nothing.
+
+        Parameters:
+            color (str): The side to generate moves for, "white" or "black".
+
+        Returns:
+            list: Moves as (piece, destination); do not modify it.
+        """
+        key = ("moves", color)
+        if key not in self.cache:
+            self.cache[key] = [(piece, destination) for piece in self.pieces(color)
+                               for destination in piece.generate_moves(self)]
+        return self.cache[key]
+
+    def is_checkmate(self, color):
+        """
+        Tells whether a side is checkmated: in check with no valid move.
+
+        Parameters:
+            color (str): The side, "white" or "black".
+
+        Returns:
+            bool: True if the side is checkmated.
+        """
+        return self.in_check(color) and not self.move_list(color)
+
+    def is_stalemate(self, color):
+        """
+        Tells whether a side is stalemated: not in check but with no valid move.
+
+        Parameters:
+            color (str): The side, "white" or "black".
+
+        Returns:
+            bool: True if the side is stalemated.
+        """
+        return not self.in_check(color) and not self.move_list(color)
+
     def execute_move(self, piece, destination):
         """
         Executes a validated move on the board.
@@ -149,17 +426,69 @@ class Board:
         Parameters:
             piece (Piece): The piece to move.
             destination (tuple): The destination position as a tuple (row, col).
+
+        Returns:
+            Piece or None: The captured piece, or None if the destination was empty.
         """
         current_row, current_col = self.find_piece(piece)
         dest_row, dest_col = destination
-        captured_piece = self.get_piece(dest_row, dest_col)
+        captured_piece = self.remove_piece(dest_row, dest_col)
 
-        self.set_piece_on_board(dest_row, dest_col, piece)
-        self.set_piece_on_board(current_row, current_col, None)
-        piece.position = (dest_row, dest_col)
+        self.remove_piece(current_row, current_col)
+        self.add_piece(dest_row, dest_col, piece)
 
         if captured_piece is not None:
             captured_piece.position = None  # Remove the captured piece from the board
+        return captured_piece
+
+    def set_side_to_move(self, color):
+        """
+        Sets which side is to move, keeping the Zobrist key in sync.
+
+        Parameters:
+            color (str): The side to move, "white" or "black".
+        """
+        if color != self.side_to_move:
+            self.zobrist_key ^= SIDE_KEY
+            self.side_to_move = color
+
+    def push(self, move):
+        """
+        Makes a move and records it so it can be taken back with pop.
+
+        The move is not validated; it is meant for moves produced by legal_moves.
+        The turn passes to the other side.
+
+        Parameters:
+            move (tuple): The move as (piece, destination), destination being (row, col).
+        """
+        piece, destination = move
+        origin = self.find_piece(piece)
+        captured_piece = self.execute_move(piece, destination)
+        self.move_stack.append((piece, origin, destination, captured_piece))
+        self.set_side_to_move(BLACK if self.side_to_move == WHITE else WHITE)
+
+    def pop(self):
+        """
+        Takes back the last move made with push, restoring any captured piece.
+
+        Returns:
+            tuple: The move that was taken back, as (piece, destination).
+
+        Raises:
+            MoveError: If there is no move to take back.
+        """
+        if not self.move_stack:
+            raise MoveError("There is no move to take back.")
+        piece, origin, destination, captured_piece = self.move_stack.pop()
+        self.set_side_to_move(BLACK if self.side_to_move == WHITE else WHITE)
+
+        self.remove_piece(*destination)
+        self.add_piece(*origin, piece)
+
+        if captured_piece is not None:
+            self.add_piece(*destination, captured_piece)
+        return piece, destination
 
     def print_board(self):
         """
@@ -188,19 +517,35 @@ class Board:
         Returns:
             tuple: A tuple (white_pieces, black_pieces) representing the count of pieces for each color.
         """
-        white_pieces = 0
-        black_pieces = 0
-        for row in range(8):
-            for col in range(8):
-                piece = self.get_piece(row, col)
-                if piece is None:
-                    continue
-                else:
-                    if piece.color == "white":
-                        white_pieces += 1
-                    else:
-                        black_pieces += 1
-        return (white_pieces, black_pieces)
+        return (self.color_counts[WHITE], self.color_counts[BLACK])
+
+    def count_pieces(self, color, symbol=None):
+        """
+        Returns how many pieces of a color, optionally of one type, are on the board.
+
+        Parameters:
+            color (str): The color of the pieces, "white" or "black".
+            symbol (str): Optional piece symbol (e.g. "q") to count only one piece type.
+
+        Returns:
+            int: The number of matching pieces.
+        """
+        if symbol is None:
+            return self.color_counts.get(color, 0)
+        return self.piece_counts.get((color, symbol), 0)
+
+    def material(self, color):
+        """
+        Returns the material a color has on the board, by piece type.
+
+        Parameters:
+            color (str): The color of the pieces, "white" or "black".
+
+        Returns:
+            dict: A mapping of piece symbol to count, e.g. {"p": 8, "n": 2, ...}.
+        """
+        return {symbol: count for (piece_color, symbol), count in self.piece_counts.items()
+                if piece_color == color and count}
 
     def color_pieces(self, x, y):
         """
@@ -225,5 +570,104 @@ class Board:
     def clean_board(self):
         """
         Clears the board by removing all pieces.
+
+        The side to move is kept, and stays part of the Zobrist key.
         """
+        side = self.side_to_move
         self.positions = [[None for _ in range(8)] for _ in range(8)]
+        self.reset_state()
+        self.set_side_to_move(side)
+
+    def snapshot(self):
+        """
+        Captures the position as an immutable, hashable value.
+
+        Returns:
+            Snapshot: The 64 square bytes (see encoding.py) and the side to move.
+        """
+        squares = bytearray(64)
+        for piece, (row, col) in self.piece_squares.items():
+            squares[square_index(row, col)] = piece_code(piece)
+        return Snapshot(bytes(squares), self.side_to_move)
+
+    def restore(self, snapshot):
+        """
+        Resets the board to a snapshot's position.
+
+        The pieces are new objects, and the moves recorded with push are discarded.
+
+        Parameters:
+            snapshot (Snapshot): A value returned by snapshot().
+
+        Raises:
+            ValueError: If the snapshot holds an invalid piece code.
+        """
+        self.clean_board()
+        for index, code in enumerate(snapshot.squares):
+            if code:
+                row, col = divmod(index, 8)
+                self.add_piece(row, col, decode_piece(code, (row, col)))
+        self.set_side_to_move(snapshot.side)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Creates a board holding a snapshot's position.
+
+        Parameters:
+            snapshot (Snapshot): A value returned by snapshot().
+
+        Returns:
+            Board: The new board.
+
+        Raises:
+            ValueError: If the snapshot holds an invalid piece code.
+        """
+        board = cls(for_test=True)
+        board.restore(snapshot)
+        return board
+
+    @classmethod
+    def from_fen(cls, fen):
+        """
+        Creates a board from a FEN string.
+
+        Parameters:
+            fen (str): The FEN string; the side to move defaults to white.
+
+        Returns:
+            Board: The new board.
+
+        Raises:
+            ValueError: If the FEN string is malformed.
+        """
+        return cls.from_snapshot(parse_fen(fen))
+
+    def to_fen(self):
+        """
+        Writes the position as a FEN string.
+
+        Returns:
+            str: The FEN string, e.g. "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1".
+        """
+        return format_fen(self.snapshot())
+
+    @classmethod
+    def load_fens(cls, source):
+        """
+        Yields a board for every FEN line of a file, reading it lazily.
+
+        Parsing a line is much cheaper than building a board; iterate
+        fen.iter_fens directly when snapshots are enough.
+
+        Parameters:
+            source (str or file): A file path, '-' for standard input, or an open text stream.
+
+        Yields:
+            Board: A new board per line.
+
+        Raises:
+            ValueError: If a line is not a valid FEN.
+        """
+        for snapshot in iter_fens(source):
+            yield cls.from_snapshot(snapshot)
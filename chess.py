@@ -1,6 +1,7 @@
 # chess.py
 
 from board import Board
+from bitboard import square_name
 from moves import (
     PieceError, MoveError, PositionInvalid, MovePieceInvalid,
     KingError, LocationError, ChessInvalid
@@ -14,9 +15,41 @@ class Chess:
     def __init__(self):
         """
         Initializes the chess game with a new board and sets the starting turn to 'WHITE'.
+
+        'history' lists the moves played, as (origin, destination) square names.
         """
         self.board = Board()
         self.turn = "WHITE"
+        self.history = []
+
+    @classmethod
+    def from_fen(cls, fen):
+        """
+        Creates a game that starts from a FEN position, with the turn it gives.
+
+        Parameters:
+            fen (str): The FEN string; the side to move defaults to white.
+
+        Returns:
+            Chess: The new game.
+
+        Raises:
+            ValueError: If the FEN string is malformed.
+        """
+        chess = cls()
+        chess.board = Board.from_fen(fen)
+        chess.turn = chess.board.side_to_move.upper()
+        return chess
+
+    def to_fen(self):
+        """
+        Writes the game's position and turn as a FEN string.
+
+        Returns:
+            str: The FEN string.
+        """
+        self.board.set_side_to_move(self.turn.lower())
+        return self.board.to_fen()
 
     def move(self, from_input, to_input):
         """
@@ -36,6 +69,7 @@ class Chess:
             KingError: If attempting to capture the opponent's king.
             ValueError: If the input is incorrectly formatted.
             LocationError: If attempting to move a piece of the wrong color.
+            CheckError: If the move would leave the player's own king in check.
         """
         x, y = self.translate_input(from_input)
         x1, y1 = self.translate_input(to_input)
@@ -44,6 +78,7 @@ class Chess:
         destination = (x1, y1)
         
         self.board.move(piece, destination)
+        self.history.append((square_name((x, y)), square_name(destination)))
         return self.check_move()
 
     def check_move(self):
@@ -65,6 +100,7 @@ class Chess:
         Switches the turn to the next player.
         """
         self.turn = "BLACK" if self.turn == "WHITE" else "WHITE"
+        self.board.set_side_to_move(self.turn.lower())
 
     def next_turn(self):
         """
@@ -148,6 +184,11 @@ class Chess:
         """
         Checks the current game state to determine if there is a winner or a draw.
 
+        Called after the current player's move: if the opponent, who moves
+        next, has no valid move, it is checkmate when their king is in check
+        and stalemate (a draw) otherwise. The opponent's moves are cached on
+        the board, so they are not generated again for their turn.
+
         Returns:
             str or bool: "White wins", "Black wins", "Draw", or True if the game continues.
         """
@@ -159,4 +200,10 @@ class Chess:
             return "Black wins"
         elif white_pieces + black_pieces == 2:
             return "Draw"
+
+        opponent = self.next_turn().lower()
+        if not self.board.move_list(opponent):
+            if self.board.in_check(opponent):
+                return "White wins" if self.turn == "WHITE" else "Black wins"
+            return "Draw"
         return True
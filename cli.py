@@ -1,10 +1,18 @@
 from chess import Chess
+from board import Board
+from perft import run_perft
+from search import search
+from bitboard import square_name
 from moves import (
     PieceError, MoveError, PositionInvalid, MovePieceInvalid,
     KingError, LocationError, ChessInvalid
 )
+import argparse
 import os
 
+# Time the computer opponent may think per move, in milliseconds
+ENGINE_TIME_MS = 2000
+
 class CLI:
     """
     Provides a command-line interface (CLI) for playing a chess game.
@@ -65,8 +73,10 @@ class CLI:
             
         elif menu_type == "continue_game":
        
-            if option not in ["1", "2", "3"]:
+            if option not in ["1", "2", "3", "4"]:
                 result = "Invalid option"
+            elif option == "4":
+                result = "Computer move"
             elif option == "3":
                 result = "Resign"
             elif option == "2":
@@ -84,12 +94,16 @@ class CLI:
             bool: False when the game ends.
         """
         while True:
-            if not self.turn_menu(): 
+            option = self.turn_menu()
+            if not option: 
                 break
-            self.display_board_and_turn()
 
-            from_input, to_input = self.get_move_input() 
-            result = self.attempt_move(from_input, to_input) 
+            if option == "Computer move":
+                result = self.computer_move()
+            else:
+                self.display_board_and_turn()
+                from_input, to_input = self.get_move_input() 
+                result = self.attempt_move(from_input, to_input) 
 
             if result in ["Black wins", "White wins", "Draw"]: 
                 print(f'\n{result}')
@@ -145,12 +159,30 @@ class CLI:
             print("An unexpected error occurred.")
             return None
 
+    def computer_move(self):
+        """
+        Lets the engine choose and play the move for the side to move.
+
+        Returns:
+            str or None: The result of the move, or None if no move could be played.
+        """
+        result = search(self.chess_game, time_ms=ENGINE_TIME_MS)
+        if result.move is None:
+            print("\nThe computer has no move to play")
+            return None
+        from_input, to_input = (square_name(position) for position in result.move)
+        move_result = self.attempt_move(from_input, to_input)
+        print(f"Computer plays {from_input} {to_input} "
+              f"(depth {result.depth}, {result.nodes} nodes, {result.nps:.0f} nps)")
+        return move_result
+
     def turn_menu(self):
         """
         Displays the menu for the player's turn and handles their selection.
 
         Returns:
-            bool: True if the player chooses to move a piece, False if the game ends.
+            bool or str: True if the player chooses to move a piece, "Computer move"
+            if the engine should play, False if the game ends.
         """
         while True:
             self.display_turn_menu()
@@ -167,6 +199,8 @@ class CLI:
                     break
             elif option == "Move piece": 
                 return True
+            elif option == "Computer move":
+                return option
         return False
 
     def display_turn_menu(self):
@@ -177,10 +211,13 @@ class CLI:
         self.chess_game.print_board()
         print('\n')
         print(f"Turn: {self.chess_game.turn}")
+        if self.chess_game.board.in_check(self.chess_game.turn.lower()):
+            print("Check!")
         print('\nSelect an Option')
         print('1. Move piece')
         print('2. Draw')
         print('3. Finish')
+        print('4. Computer move')
 
     def handle_invalid_option(self, selection):
         """
@@ -250,6 +287,52 @@ class CLI:
         os.system('cls' if os.name == 'nt' else 'clear')
 
 
+def print_perft(depth, split=False, fen=None):
+    """
+    Runs perft and prints the node count and speed.
+
+    Parameters:
+        depth (int): The number of moves (plies) to look ahead.
+        split (bool): If True, also print the count for each root move (perft divide).
+        fen (str): The starting position as a FEN string; the initial setup if None.
+    """
+    board = Board.from_fen(fen) if fen is not None else None
+    result = run_perft(depth, board=board, split=split)
+    if split:
+        for move, nodes in sorted(result["divide"].items()):
+            print(f"{move}: {nodes}")
+        print()
+    print(f"Nodes: {result['nodes']}")
+    print(f"Time: {result['seconds']:.3f}s")
+    print(f"NPS: {result['nps']:.0f}")
+
+
+def main(argv=None):
+    """
+    Entry point: starts the interactive game, or runs a tool given on the command line.
+
+    Parameters:
+        argv (list): Command line arguments; sys.argv[1:] if None.
+    """
+    parser = argparse.ArgumentParser(description="Play chess or run the rules tools.")
+    commands = parser.add_subparsers(dest="command")
+    for name, help_text in (("perft", "count leaf nodes to a depth"),
+                            ("divide", "perft split by root move")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("depth", type=int)
+        command.add_argument("--divide", action="store_true", help="print the count of each root move")
+        command.add_argument("--fen", help="start from this position instead of the initial one")
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        cli = CLI()
+        cli.menu()
+    else:
+        try:
+            print_perft(args.depth, split=args.divide or args.command == "divide", fen=args.fen)
+        except ValueError as e:
+            parser.error(str(e))
+
+
 if __name__ == "__main__":
-    cli = CLI()
-    cli.menu()
+    main()
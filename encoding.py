@@ -0,0 +1,90 @@
+# encoding.py
+
+"""
+Compact encoding of positions as bytes.
+
+Every square is one byte holding a signed piece code: pawn, knight, bishop,
+rook, queen and king are 1 to 6 for white and -1 to -6 for black, stored in
+two's complement (so -1 is the byte 255), and 0 is an empty square. The 64
+bytes follow the square indexes of bitboard.py (row * 8 + col), and read
+directly as an int8 array.
+
+A Snapshot is the 64 bytes plus the side to move. It is an immutable
+namedtuple, so snapshots compare by value and can be used as dict keys or
+set members.
+"""
+
+from collections import namedtuple
+from piece import WHITE, BLACK
+from pawn import Pawn
+from knight import Knight
+from bishop import Bishop
+from rook import Rook
+from queen import Queen
+from king import King
+
+PIECE_CLASSES = (Pawn, Knight, Bishop, Rook, Queen, King)
+
+EMPTY = 0
+
+# (color, symbol) -> byte, e.g. ("white", "p") -> 1 and ("black", "p") -> 255
+CODES = {}
+# byte -> (color, piece class), None for empty squares and unused bytes
+PIECES_BY_CODE = [None] * 256
+
+for _value, _piece_class in enumerate(PIECE_CLASSES, start=1):
+    CODES[(WHITE, _piece_class.symbol)] = _value
+    CODES[(BLACK, _piece_class.symbol)] = -_value & 0xFF
+    PIECES_BY_CODE[_value] = (WHITE, _piece_class)
+    PIECES_BY_CODE[-_value & 0xFF] = (BLACK, _piece_class)
+
+Snapshot = namedtuple("Snapshot", ["squares", "side"])
+
+
+def signed(code):
+    """
+    Reads a stored byte as its signed piece code.
+
+    Parameters:
+        code (int): The byte (0-255).
+
+    Returns:
+        int: The piece code (-6 to 6), positive for white.
+    """
+    return code - 256 if code > 127 else code
+
+
+def piece_code(piece):
+    """
+    Gets the byte a piece is stored as.
+
+    Parameters:
+        piece (Piece): The piece.
+
+    Returns:
+        int: The byte (0-255).
+    """
+    return CODES[(piece.color, piece.symbol)]
+
+
+def decode_piece(code, position):
+    """
+    Creates the piece a byte stands for.
+
+    Parameters:
+        code (int): The byte (0-255).
+        position (tuple): The position of the new piece as (row, column).
+
+    Returns:
+        Piece or None: A new piece, or None for an empty square.
+
+    Raises:
+        ValueError: If the byte is not a piece code.
+    """
+    if code == EMPTY:
+        return None
+    entry = PIECES_BY_CODE[code]
+    if entry is None:
+        raise ValueError(f"Invalid piece code: {signed(code)}")
+    color, piece_class = entry
+    return piece_class(color, position)
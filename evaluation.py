@@ -0,0 +1,165 @@
+# evaluation.py
+
+"""
+Static evaluation of positions: material plus piece-square tables.
+
+Each piece is worth its material value plus a bonus or penalty for the
+square it stands on. The tables are written from white's side, rank 8
+first, which is also the order of Board.positions rows 0 to 7; a black
+piece reads the table with its row mirrored. Scores are in centipawns.
+
+Board keeps each side's total up to date as pieces are added and removed
+(see Board.scores), so evaluate is O(1). vectorized.evaluate_batch scores
+many positions at once from the same tables.
+"""
+
+from piece import WHITE, BLACK
+
+PIECE_VALUES = {"p": 100, "n": 320, "b": 330, "r": 500, "q": 900, "k": 0, "?": 0}
+
+PAWN_TABLE = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    10,  10,  20,  30,  30,  20,  10,  10,
+     5,   5,  10,  25,  25,  10,   5,   5,
+     0,   0,   0,  20,  20,   0,   0,   0,
+     5,  -5, -10,   0,   0, -10,  -5,   5,
+     5,  10,  10, -20, -20,  10,  10,   5,
+     0,   0,   0,   0,   0,   0,   0,   0,
+)
+
+KNIGHT_TABLE = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)
+
+BISHOP_TABLE = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)
+
+ROOK_TABLE = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+     5,  10,  10,  10,  10,  10,  10,   5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+     0,   0,   0,   5,   5,   0,   0,   0,
+)
+
+QUEEN_TABLE = (
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+     -5,   0,   5,   5,   5,   5,   0,  -5,
+      0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+
+KING_TABLE = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+     20,  20,   0,   0,   0,   0,  20,  20,
+     20,  30,  10,   0,   0,  10,  30,  20,
+)
+
+PIECE_SQUARE_TABLES = {
+    "p": PAWN_TABLE, "n": KNIGHT_TABLE, "b": BISHOP_TABLE,
+    "r": ROOK_TABLE, "q": QUEEN_TABLE, "k": KING_TABLE, "?": (0,) * 64,
+}
+
+# SQUARE_VALUES[(color, symbol)][square]: the piece's material and square value for its own side
+SQUARE_VALUES = {}
+for _symbol, _table in PIECE_SQUARE_TABLES.items():
+    SQUARE_VALUES[(WHITE, _symbol)] = tuple(PIECE_VALUES[_symbol] + bonus for bonus in _table)
+    SQUARE_VALUES[(BLACK, _symbol)] = tuple(
+        PIECE_VALUES[_symbol] + _table[(7 - square // 8) * 8 + square % 8] for square in range(64)
+    )
+
+# SQUARE_SCORES[(color, symbol)][square]: what the piece adds to white's score there
+SQUARE_SCORES = {
+    (color, symbol): values if color == WHITE else tuple(-value for value in values)
+    for (color, symbol), values in SQUARE_VALUES.items()
+}
+
+
+def piece_score(color, symbol, row, col):
+    """
+    Scores one piece on one square.
+
+    Parameters:
+        color (str): The color of the piece, "white" or "black".
+        symbol (str): The piece symbol, e.g. "n".
+        row (int): The row index (0-7).
+        col (int): The column index (0-7).
+
+    Returns:
+        int: The piece's material and square value, positive for white and negative for black.
+    """
+    return SQUARE_SCORES[(color, symbol)][row * 8 + col]
+
+
+def compute_scores(board):
+    """
+    Computes each side's material and square value from scratch.
+
+    Board keeps these incrementally in 'scores'; this is the reference used
+    to check them.
+
+    Parameters:
+        board (Board): The position to score.
+
+    Returns:
+        dict: The value of each color's pieces, e.g. {"white": 3905, "black": 3905}.
+    """
+    scores = {WHITE: 0, BLACK: 0}
+    for piece, (row, col) in board.piece_squares.items():
+        scores[piece.color] += SQUARE_VALUES[(piece.color, piece.symbol)][row * 8 + col]
+    return scores
+
+
+def score_board(board):
+    """
+    Scores a position from white's point of view, from the board's running scores.
+
+    Parameters:
+        board (Board): The position to score.
+
+    Returns:
+        int: The score in centipawns, positive when white is better.
+    """
+    return board.scores[WHITE] - board.scores[BLACK]
+
+
+def evaluate(board):
+    """
+    Scores a position for the search.
+
+    Parameters:
+        board (Board): The position to score.
+
+    Returns:
+        int: The score in centipawns from the side to move's point of view.
+    """
+    score = score_board(board)
+    return score if board.side_to_move == WHITE else -score
@@ -0,0 +1,149 @@
+# fen.py
+
+"""
+Reading and writing positions in Forsyth-Edwards Notation (FEN).
+
+FEN lists the ranks from black's back rank to white's, which is the order
+of Board.positions rows 0 to 7, and files a to h are columns 0 to 7. So the
+standard starting FEN is the position Board.setup_pieces builds.
+
+The board has no castling, en passant or move counters, so those fields are
+read but ignored, and written as "- - 0 1".
+"""
+
+from piece import WHITE, BLACK
+from sources import iter_lines
+from encoding import CODES, Snapshot
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+SIDES = {"w": WHITE, "b": BLACK}
+
+# FEN letter -> square byte of encoding.py, e.g. 'P' -> white pawn, 'p' -> black pawn
+FEN_CODES = {}
+# square byte -> FEN letter
+FEN_LETTERS = {}
+
+for (_color, _symbol), _code in CODES.items():
+    _letter = _symbol.upper() if _color == WHITE else _symbol
+    FEN_CODES[_letter] = _code
+    FEN_LETTERS[_code] = _letter
+
+_EMPTY_RUNS = {str(n): n for n in range(1, 9)}
+
+
+def parse_fen(fen):
+    """
+    Reads the position of a FEN string in a single pass over its characters.
+
+    Parameters:
+        fen (str): The FEN string. Only the piece placement is required;
+            the side to move defaults to white.
+
+    Returns:
+        Snapshot: The 64 square bytes (see encoding.py) and the side to move.
+
+    Raises:
+        ValueError: If the placement or the side to move is malformed.
+    """
+    fields = fen.split()
+    if not fields:
+        raise ValueError("Empty FEN string.")
+    placement = fields[0]
+    side = SIDES.get(fields[1]) if len(fields) > 1 else WHITE
+    if side is None:
+        raise ValueError(f"Invalid side to move in FEN: {fields[1]}")
+
+    squares = bytearray(64)
+    index = 0
+    row_end = 8
+    for char in placement:
+        if char == "/":
+            if index != row_end:
+                raise ValueError(f"FEN rank {row_end // 8} does not have 8 squares: {placement}")
+            row_end += 8
+        elif char in _EMPTY_RUNS:
+            index += _EMPTY_RUNS[char]
+        else:
+            code = FEN_CODES.get(char)
+            if code is None:
+                raise ValueError(f"Invalid piece letter in FEN: {char}")
+            if index >= row_end:
+                raise ValueError(f"FEN rank {row_end // 8} does not have 8 squares: {placement}")
+            squares[index] = code
+            index += 1
+    if index != 64 or row_end != 64:
+        raise ValueError(f"FEN placement must describe 8 ranks of 8 squares: {placement}")
+    return Snapshot(bytes(squares), side)
+
+
+def format_fen(snapshot):
+    """
+    Writes a position as a FEN string.
+
+    Parameters:
+        snapshot (Snapshot): The position, e.g. from Board.snapshot().
+
+    Returns:
+        str: The FEN string.
+    """
+    ranks = []
+    for start in range(0, 64, 8):
+        rank = ""
+        empty = 0
+        for code in snapshot.squares[start:start + 8]:
+            if code:
+                if empty:
+                    rank += str(empty)
+                    empty = 0
+                rank += FEN_LETTERS[code]
+            else:
+                empty += 1
+        if empty:
+            rank += str(empty)
+        ranks.append(rank)
+    side = "w" if snapshot.side == WHITE else "b"
+    return f"{'/'.join(ranks)} {side} - - 0 1"
+
+
+def iter_fens(source):
+    """
+    Yields the positions of a file with one FEN per line, reading it lazily.
+
+    Blank lines and lines starting with '#' are skipped, so a file of any
+    size is read in constant memory.
+
+    Parameters:
+        source (str or file): A file path, '-' for standard input, or an open text stream.
+
+    Yields:
+        Snapshot: The position of each line; Board.from_snapshot turns it into a board.
+
+    Raises:
+        ValueError: If a line is not a valid FEN; the message gives the line number.
+    """
+    yield from _iter_stream(iter_lines(source))
+
+
+def _iter_stream(stream):
+    """
+    Yields the positions of an open text stream with one FEN per line.
+
+    Parameters:
+        stream (iterable): The lines, e.g. from sources.iter_lines or an open text stream.
+
+    Yields:
+        Snapshot: The position of each line.
+
+    Raises:
+        ValueError: If a line is not a valid FEN.
+    """
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            snapshot = parse_fen(line)
+        except ValueError as e:
+            raise ValueError(f"Line {number}: {e}") from None
+        yield snapshot
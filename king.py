@@ -1,12 +1,17 @@
 # king.py
 
 from piece import Piece, WHITE, BLACK
+from attacks import KING_ATTACKS
+from bitboard import square_index
 
 class King(Piece):
     """
     Represents a king chess piece, inheriting from the Piece base class.
     """
 
+    symbol = "k"
+    __slots__ = ()
+
     def __init__(self, color, position):
         """
         Initializes a King instance with a color and position.
@@ -39,8 +44,20 @@ class King(Piece):
         """
         new_x, new_y, current_x, current_y = self.get_coordinates(new_position)
 
-        if abs(new_x - current_x) <= 1 and abs(new_y - current_y) <= 1:
-            destination_piece = positions[new_x][new_y]
-            if destination_piece is None or destination_piece.color != self.color:
-                return True
-        return False
+        if not self.is_in_bounds(new_x, new_y):
+            return False
+        if not KING_ATTACKS[square_index(current_x, current_y)] >> square_index(new_x, new_y) & 1:
+            return False
+        return self.can_move_to(positions, new_x, new_y)
+
+    def attacks(self, occupied):
+        """
+        Returns the squares the king attacks.
+
+        Parameters:
+            occupied (int): Bitboard of occupied squares (unused by the king).
+
+        Returns:
+            int: Bitboard of attacked squares.
+        """
+        return KING_ATTACKS[square_index(*self.position)]
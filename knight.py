@@ -1,12 +1,17 @@
 # knight.py
 
 from piece import Piece, WHITE
+from attacks import KNIGHT_ATTACKS
+from bitboard import square_index
 
 class Knight(Piece):
     """
     Represents a knight chess piece, inheriting from the Piece base class.
     """
 
+    symbol = "n"
+    __slots__ = ()
+
     def __init__(self, color, position):
         """
         Initializes a Knight instance with a color and position.
@@ -39,16 +44,21 @@ class Knight(Piece):
         """
         new_x, new_y, current_x, current_y = self.get_coordinates(new_position)
 
-        # Definir los movimientos posibles para un caballo
-        possible_moves = [
-            (2, 1), (2, -1), (-2, 1), (-2, -1),
-            (1, 2), (1, -2), (-1, 2), (-1, -2)
-        ]
-
-        for dx, dy in possible_moves:
-            target_x = current_x + dx
-            target_y = current_y + dy
-            if (new_x, new_y) == (target_x, target_y):
-                if self.can_move_to(positions, new_x, new_y):
-                    return True
-        return False
+        # Los movimientos posibles del caballo vienen de la tabla precalculada
+        if not self.is_in_bounds(new_x, new_y):
+            return False
+        if not KNIGHT_ATTACKS[square_index(current_x, current_y)] >> square_index(new_x, new_y) & 1:
+            return False
+        return self.can_move_to(positions, new_x, new_y)
+
+    def attacks(self, occupied):
+        """
+        Returns the squares the knight attacks.
+
+        Parameters:
+            occupied (int): Bitboard of occupied squares (unused, knights jump).
+
+        Returns:
+            int: Bitboard of attacked squares.
+        """
+        return KNIGHT_ATTACKS[square_index(*self.position)]
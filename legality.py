@@ -0,0 +1,229 @@
+# legality.py
+
+"""
+Checks, pins and king safety, computed from a Board's bitboards.
+
+These functions read a board's incrementally maintained state (bitboards,
+occupancy, piece lists) and return bitboards indexed like the tables of
+attacks.py (row * 8 + col). Board exposes them as cached accessors
+(attack_map, checkers, pins, king_danger, legal_mask): each result is
+kept in Board.cache, which is emptied whenever a piece is added or removed,
+so a position's checks and pins are worked out once however many moves
+are validated against them.
+"""
+
+from piece import WHITE, BLACK
+from bitboard import ALL_SQUARES, square_index, iter_squares, popcount
+from attacks import (
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, ROOK_MOVES, BISHOP_MOVES,
+    BETWEEN, rook_attacks, bishop_attacks
+)
+
+
+def cached(board, name, compute, color):
+    """
+    Gets a value derived from the position, computing it once per position.
+
+    Parameters:
+        board (Board): The board.
+        name (str): The name the value is cached under.
+        compute (function): Called as compute(board, color) when the value is not cached.
+        color (str): The side the value is about.
+
+    Returns:
+        object: The cached value.
+    """
+    key = (name, color)
+    if key not in board.cache:
+        board.cache[key] = compute(board, color)
+    return board.cache[key]
+
+
+def opponent(color):
+    """
+    Gets the other side.
+
+    Parameters:
+        color (str): "white" or "black".
+
+    Returns:
+        str: The other color.
+    """
+    return BLACK if color == WHITE else WHITE
+
+
+def king_square(board, color):
+    """
+    Finds a side's king.
+
+    Parameters:
+        board (Board): The board.
+        color (str): The side, "white" or "black".
+
+    Returns:
+        int or None: The king's square index, or None if the side has no king.
+    """
+    kings = board.bitboards.get((color, "k"), 0)
+    return kings.bit_length() - 1 if kings else None
+
+
+def attacks_of(board, color, occupied):
+    """
+    Returns every square a side's pieces attack for a given occupancy.
+
+    Parameters:
+        board (Board): The board.
+        color (str): The attacking side.
+        occupied (int): Bitboard of the squares that block sliding pieces.
+
+    Returns:
+        int: Bitboard of attacked squares.
+    """
+    attacked = 0
+    for (piece_color, _), pieces in board.piece_lists.items():
+        if piece_color == color:
+            for piece in pieces:
+                attacked |= piece.attacks(occupied) or 0
+    return attacked
+
+
+def find_attacks(board, color):
+    """
+    Returns every square a side attacks on the board as it is.
+
+    Parameters:
+        board (Board): The board.
+        color (str): The attacking side.
+
+    Returns:
+        int: Bitboard of attacked squares, including squares holding pieces of either color.
+    """
+    return attacks_of(board, color, board.occupied)
+
+
+def find_checkers(board, color):
+    """
+    Finds the pieces attacking a side's king by looking outwards from the king.
+
+    Parameters:
+        board (Board): The board.
+        color (str): The side whose king is looked at.
+
+    Returns:
+        int: Bitboard of the checking pieces; 0 if not in check or without a king.
+    """
+    king = king_square(board, color)
+    if king is None:
+        return 0
+    enemy = opponent(color)
+    bitboards = board.bitboards
+    direction = -1 if color == WHITE else 1
+    straight = bitboards.get((enemy, "r"), 0) | bitboards.get((enemy, "q"), 0)
+    diagonal = bitboards.get((enemy, "b"), 0) | bitboards.get((enemy, "q"), 0)
+    return (KNIGHT_ATTACKS[king] & bitboards.get((enemy, "n"), 0)
+            | PAWN_ATTACKS[direction][king] & bitboards.get((enemy, "p"), 0)
+            | KING_ATTACKS[king] & bitboards.get((enemy, "k"), 0)
+            | rook_attacks(king, board.occupied) & straight
+            | bishop_attacks(king, board.occupied) & diagonal)
+
+
+def find_pins(board, color):
+    """
+    Finds a side's pinned pieces by looking along the lines from its king.
+
+    A piece is pinned when it is the only piece between its king and an
+    enemy rook, bishop or queen on that line; it may only move along it.
+
+    Parameters:
+        board (Board): The board.
+        color (str): The side whose pieces are looked at.
+
+    Returns:
+        dict: Square index of each pinned piece -> bitboard of the squares it may
+        still move to (the squares between king and attacker, plus the attacker).
+    """
+    king = king_square(board, color)
+    if king is None:
+        return {}
+    enemy = opponent(color)
+    bitboards = board.bitboards
+    queens = bitboards.get((enemy, "q"), 0)
+    snipers = (ROOK_MOVES[king] & (bitboards.get((enemy, "r"), 0) | queens)
+               | BISHOP_MOVES[king] & (bitboards.get((enemy, "b"), 0) | queens))
+    own = board.occupancy.get(color, 0)
+    pins = {}
+    for sniper in iter_squares(snipers):
+        blockers = BETWEEN[king][sniper] & board.occupied
+        if popcount(blockers) == 1 and blockers & own:
+            pins[blockers.bit_length() - 1] = BETWEEN[king][sniper] | 1 << sniper
+    return pins
+
+
+def find_king_danger(board, color):
+    """
+    Returns the squares a side's king may not move to.
+
+    When the king is in check, the enemy attacks are taken with the king
+    itself off the board, so it cannot step back along the line of a rook,
+    bishop or queen checking it.
+
+    Parameters:
+        board (Board): The board.
+        color (str): The side whose king is looked at.
+
+    Returns:
+        int: Bitboard of the squares attacked by the other side.
+    """
+    enemy = opponent(color)
+    if not board.checkers(color):
+        return board.attack_map(enemy)
+    king_bit = board.bitboards.get((color, "k"), 0)
+    return attacks_of(board, enemy, board.occupied & ~king_bit)
+
+
+def find_evasions(board, color):
+    """
+    Returns the squares a side's pieces other than the king may move to, given any check.
+
+    Parameters:
+        board (Board): The board.
+        color (str): The side.
+
+    Returns:
+        int or None: Every square when not in check, the checker and the squares
+        between it and the king in single check, none in double check, or None
+        if the side has no king.
+    """
+    king = king_square(board, color)
+    if king is None:
+        return None
+    checkers = board.checkers(color)
+    if not checkers:
+        return ALL_SQUARES
+    if checkers & (checkers - 1):
+        return 0  # Double check: only the king can move
+    return checkers | BETWEEN[king][checkers.bit_length() - 1]
+
+
+def legal_destinations(board, piece):
+    """
+    Returns the squares a piece may move to without leaving its own king in check.
+
+    The mask comes from the cached checkers, pins and attack maps, so it
+    only restricts the piece's movement pattern; it does not include it.
+
+    Parameters:
+        board (Board): The board holding the piece.
+        piece (Piece): A piece on the board.
+
+    Returns:
+        int: Bitboard of allowed destinations; every square if the side has no king.
+    """
+    color = piece.color
+    evasions = cached(board, "evasions", find_evasions, color)
+    if evasions is None:
+        return ALL_SQUARES
+    if piece.symbol == "k":
+        return ALL_SQUARES & ~board.king_danger(color)
+    pin = board.pins(color).get(square_index(*board.piece_squares[piece]))
+    return evasions if pin is None else evasions & pin
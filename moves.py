@@ -53,6 +53,13 @@ class MovePieceInvalid(MoveError):
     pass
 
 
+class CheckError(MoveError):
+    """
+    Exception raised when a move would leave the player's own king in check.
+    """
+    pass
+
+
 class KingError(ChessInvalid):
     """
     Exception raised when attempting to capture the opponent's king.
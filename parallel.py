@@ -0,0 +1,177 @@
+# parallel.py
+
+"""
+Lazy SMP: one search spread over a pool of worker processes.
+
+Every worker searches the same root position with its own Searcher, and all
+of them read and write one TranspositionTable kept in shared memory. The
+helpers try quiet moves in different orders and every other one aims one ply
+deeper, so they fill the table with results the others pick up. When the
+main worker finishes, the helpers are told to stop, and the result of the
+deepest completed search within the depth limit, if any, is returned.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from search import Searcher, SearchResult
+from tt import TranspositionTable, DEPTH_PREFERRED, ENTRY_SIZE
+
+# The shared block starts with a stop flag, followed by the table entries
+CONTROL_SIZE = 8
+
+
+def _attach(name):
+    """
+    Attaches to an existing shared memory block without taking ownership of it.
+
+    Parameters:
+        name (str): The name of the block.
+
+    Returns:
+        SharedMemory: The attached block.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no 'track' argument
+        return shared_memory.SharedMemory(name=name)
+
+
+def _search_worker(memory_name, size_mb, policy, chess, worker_id, depth, time_ms):
+    """
+    Runs one worker's search against the shared table.
+
+    Parameters:
+        memory_name (str): The shared memory block holding the stop flag and the table.
+        size_mb (float): The size of the table, in megabytes.
+        policy (str): The table's replacement policy.
+        chess (Chess): The game to search.
+        worker_id (int): 0 for the main worker, 1 and up for helpers.
+        depth (int): The maximum depth in plies, or None.
+        time_ms (int): The time limit in milliseconds, or None.
+
+    Returns:
+        tuple: (worker_id, move, score, depth reached, nodes).
+    """
+    memory = _attach(memory_name)
+    control = memory.buf[:CONTROL_SIZE]
+    table = TranspositionTable(size_mb, policy, buffer=memory.buf[CONTROL_SIZE:])
+    try:
+        board = chess.board
+        board.set_side_to_move(chess.turn.lower())
+        searcher = Searcher(board, table, seed=worker_id if worker_id else None)
+        searcher.stop = lambda: control[0] != 0
+        if depth is not None and worker_id % 2:
+            depth += 1
+        result = searcher.search(depth=depth, time_ms=time_ms)
+        if worker_id == 0:
+            control[0] = 1
+        return worker_id, result.move, result.score, result.depth, result.nodes
+    finally:
+        table.release()
+        control.release()
+        memory.close()
+
+
+class ParallelSearch:
+    """
+    A pool of search processes sharing one transposition table.
+    """
+
+    def __init__(self, workers=None, size_mb=64, policy=DEPTH_PREFERRED):
+        """
+        Starts the worker pool and allocates the shared table.
+
+        Parameters:
+            workers (int): The number of worker processes; one per core if None.
+            size_mb (float): The size of the shared table, in megabytes.
+            policy (str): The table's replacement policy.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.size_mb = size_mb
+        self.policy = policy
+        table_bytes = int(size_mb * 1024 * 1024) // ENTRY_SIZE * ENTRY_SIZE
+        self.memory = shared_memory.SharedMemory(create=True, size=CONTROL_SIZE + table_bytes)
+        self.memory.buf[:CONTROL_SIZE] = bytes(CONTROL_SIZE)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def search(self, chess, time_ms=None, depth=None):
+        """
+        Searches the game's position with every worker.
+
+        Parameters:
+            chess (Chess): The game to search; it is not modified.
+            time_ms (int): The time limit in milliseconds.
+            depth (int): The maximum depth in plies.
+
+        Returns:
+            SearchResult: The deepest completed result, with the nodes of all workers.
+
+        Raises:
+            ValueError: If neither a depth nor a time limit is given.
+        """
+        if depth is None and time_ms is None:
+            raise ValueError("A search needs a depth or a time limit.")
+        self.memory.buf[0] = 0
+        start = time.perf_counter()
+        futures = [
+            self.pool.submit(_search_worker, self.memory.name, self.size_mb, self.policy,
+                             chess, worker_id, depth, time_ms)
+            for worker_id in range(self.workers)
+        ]
+        results = [future.result() for future in futures]
+        seconds = time.perf_counter() - start
+
+        # Deepest completed search wins; on a tie the main worker's result is kept.
+        # Helpers searching past the depth limit only fill the table: their results
+        # would break the limit, so they are left out.
+        completed = [result for result in results
+                     if result[1] is not None and (depth is None or result[3] <= depth)]
+        if not completed:
+            return SearchResult(None, 0, 0, sum(result[4] for result in results), seconds)
+        _, move, score, reached, _ = max(completed, key=lambda result: (result[3], -result[0]))
+        nodes = sum(result[4] for result in results)
+        return SearchResult(move, score, reached, nodes, seconds)
+
+    def close(self):
+        """
+        Stops the workers and frees the shared table.
+        """
+        self.pool.shutdown()
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self):
+        """
+        Returns the pool for use in a with statement.
+
+        Returns:
+            ParallelSearch: This instance.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Closes the pool at the end of a with statement.
+        """
+        self.close()
+
+
+def parallel_search(chess, workers=None, time_ms=None, depth=None, size_mb=64):
+    """
+    Runs a single parallel search with a temporary worker pool.
+
+    Parameters:
+        chess (Chess): The game to search.
+        workers (int): The number of worker processes; one per core if None.
+        time_ms (int): The time limit in milliseconds.
+        depth (int): The maximum depth in plies.
+        size_mb (float): The size of the shared table, in megabytes.
+
+    Returns:
+        SearchResult: The best move found and the combined statistics.
+    """
+    with ParallelSearch(workers, size_mb) as engine:
+        return engine.search(chess, time_ms=time_ms, depth=depth)
@@ -1,4 +1,6 @@
 from piece import Piece
+from attacks import PAWN_ATTACKS
+from bitboard import square_index, square_bit
 
 WHITE = "white"
 BLACK = "black"
@@ -8,6 +10,9 @@ class Pawn(Piece):
     Represents a pawn chess piece, inheriting from the Piece base class.
     """
 
+    symbol = "p"
+    __slots__ = ()
+
     def __init__(self, color, position):
         """
         Initializes a Pawn instance with a color and position.
@@ -46,6 +51,53 @@ class Pawn(Piece):
             valid = False
         return valid
 
+    def direction(self):
+        """
+        Returns the direction the pawn advances in and its initial row.
+
+        Returns:
+            tuple: (-1, 6) for white pawns, (1, 1) for black pawns.
+        """
+        return (-1, 6) if self.__color__ == WHITE else (1, 1)
+
+    def attacks(self, occupied):
+        """
+        Returns the squares the pawn attacks (its two forward diagonals).
+
+        Parameters:
+            occupied (int): Bitboard of occupied squares (unused by the pawn).
+
+        Returns:
+            int: Bitboard of attacked squares.
+        """
+        direction, _ = self.direction()
+        return PAWN_ATTACKS[direction][square_index(*self.position)]
+
+    def move_mask(self, board):
+        """
+        Returns the squares the pawn can move to: forward pushes onto empty
+        squares and diagonal captures of enemy pieces.
+
+        Parameters:
+            board (Board): The board the pawn is on.
+
+        Returns:
+            int: Bitboard of reachable squares.
+        """
+        if self.__color__ not in (WHITE, BLACK):
+            return 0
+        direction, initial_row = self.direction()
+        row, col = self.position
+        enemies = board.occupied & ~board.occupancy.get(self.__color__, 0)
+        targets = self.attacks(board.occupied) & enemies
+
+        ahead = row + direction
+        if 0 <= ahead < 8 and not board.occupied & square_bit(ahead, col):
+            targets |= square_bit(ahead, col)
+            if row == initial_row and not board.occupied & square_bit(ahead + direction, col):
+                targets |= square_bit(ahead + direction, col)
+        return targets
+
     def is_valid_pawn_move(self, positions, new_position, direction, initial_row):
         """
         Checks if the pawn move is valid based on its direction and initial row.
@@ -0,0 +1,89 @@
+# perft.py
+
+"""
+Perft: counts the leaf nodes of the move tree to a fixed depth.
+
+The counts check the move generator against known values and the timing
+measures how fast the rules code runs.
+"""
+
+import time
+from board import Board
+from bitboard import square_name
+
+
+def perft(board, depth):
+    """
+    Counts the positions reachable from the board in exactly 'depth' moves.
+
+    The side to move is board.side_to_move; the board is left unchanged.
+
+    Parameters:
+        board (Board): The starting position.
+        depth (int): The number of moves (plies) to look ahead.
+
+    Returns:
+        int: The number of leaf nodes.
+    """
+    if depth == 0:
+        return 1
+    moves = board.move_list(board.side_to_move)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        board.push(move)
+        nodes += perft(board, depth - 1)
+        board.pop()
+    return nodes
+
+
+def divide(board, depth):
+    """
+    Splits the perft count by root move, to find where two generators disagree.
+
+    Parameters:
+        board (Board): The starting position.
+        depth (int): The number of moves (plies) to look ahead, at least 1.
+
+    Returns:
+        dict: A mapping of move name (e.g. 'B8C6') to its leaf node count.
+    """
+    counts = {}
+    for piece, destination in board.legal_moves(board.side_to_move):
+        name = square_name(piece.position) + square_name(destination)
+        board.push((piece, destination))
+        counts[name] = perft(board, depth - 1)
+        board.pop()
+    return counts
+
+
+def run_perft(depth, board=None, split=False):
+    """
+    Runs perft and measures its speed.
+
+    Parameters:
+        depth (int): The number of moves (plies) to look ahead.
+        board (Board): The starting position; the initial setup if None.
+        split (bool): If True, also collect the per-move counts of divide.
+
+    Returns:
+        dict: 'nodes', 'seconds', 'nps' (nodes per second) and, with split,
+        'divide' holding the per-move counts.
+    """
+    if board is None:
+        board = Board()
+
+    start = time.perf_counter()
+    if split:
+        counts = divide(board, depth)
+        nodes = sum(counts.values())
+    else:
+        nodes = perft(board, depth)
+    seconds = time.perf_counter() - start
+
+    result = {"nodes": nodes, "seconds": seconds, "nps": nodes / seconds if seconds else 0.0}
+    if split:
+        result["divide"] = counts
+    return result
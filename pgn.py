@@ -0,0 +1,271 @@
+# pgn.py
+
+"""
+Streaming reader and replayer for Portable Game Notation (PGN) files.
+
+iter_games reads a PGN file line by line and yields one game at a time, so
+an archive of any size is replayed in constant memory. Comments, variations,
+move numbers and annotation glyphs are skipped while reading.
+
+Moves are in Standard Algebraic Notation (SAN) with standard square names:
+file a to h is column 0 to 7 and rank 8 to 1 is row 0 to 7, so white's
+pawns start on rank 2 (row 6). The rules in Board have no castling,
+promotion or en passant, so games that use them stop with an error at
+that move.
+"""
+
+import re
+from bitboard import square_bit
+from chess import Chess
+from moves import ChessInvalid
+from piece import WHITE, BLACK
+from sources import iter_lines
+
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+
+_TAG = re.compile(r'\[\s*(\w+)\s+"(.*)"\s*\]')
+_TOKEN = re.compile(r"[{}();]|[^\s{}();]+")
+_MOVE_NUMBER = re.compile(r"^\d+\.*")
+_SAN = re.compile(r"^([NBRQK])?([a-h])?([1-8])?(x)?([a-h][1-8])(=[NBRQ])?$")
+
+
+class PgnGame:
+    """
+    One game read from a PGN file: its tags, its moves and its result.
+    """
+
+    def __init__(self, tags=None, moves=None, result=None):
+        """
+        Initializes a PgnGame.
+
+        Parameters:
+            tags (dict): The tag pairs, e.g. {"White": "Carlsen", "Result": "1-0"}.
+            moves (list): The moves in SAN, e.g. ["e4", "e5", "Nf3"].
+            result (str): The result token ("1-0", "0-1", "1/2-1/2" or "*"), or None.
+        """
+        self.tags = tags if tags is not None else {}
+        self.moves = moves if moves is not None else []
+        self.result = result
+
+    def __repr__(self):
+        """
+        Returns a summary of the game.
+
+        Returns:
+            str: The players, the number of moves and the result.
+        """
+        return (f"PgnGame({self.tags.get('White', '?')} - {self.tags.get('Black', '?')}, "
+                f"{len(self.moves)} moves, {self.result})")
+
+
+def iter_games(source):
+    """
+    Yields the games of a PGN file one at a time.
+
+    Parameters:
+        source (str or file): A file path, '-' for standard input, or an open text stream.
+
+    Yields:
+        PgnGame: The next game.
+    """
+    yield from _iter_stream(iter_lines(source, errors="replace"))
+
+
+def _iter_stream(stream):
+    """
+    Yields the games of an open PGN text stream.
+
+    A game ends at its result token, or when a tag pair follows its moves.
+
+    Parameters:
+        stream (iterable): The lines, e.g. from sources.iter_lines or an open text stream.
+
+    Yields:
+        PgnGame: The next game.
+    """
+    game = PgnGame()
+    in_moves = False
+    in_comment = False
+    variation_depth = 0
+
+    for line in stream:
+        if not in_comment and line.startswith("["):
+            tag = _TAG.match(line)
+            if tag is not None:
+                if in_moves:
+                    yield game
+                    game, in_moves = PgnGame(), False
+                game.tags[tag.group(1)] = tag.group(2)
+                continue
+        if line.startswith("%"):
+            continue
+
+        for token in _TOKEN.findall(line):
+            if in_comment:
+                in_comment = token != "}"
+            elif token == "{":
+                in_comment = True
+            elif token == ";":
+                break
+            elif token == "(":
+                variation_depth += 1
+            elif token == ")":
+                variation_depth -= 1
+            elif variation_depth or token.startswith("$"):
+                continue
+            elif token in RESULTS:
+                game.result = token
+                yield game
+                game, in_moves = PgnGame(), False
+            else:
+                move = _MOVE_NUMBER.sub("", token)
+                if move:
+                    game.moves.append(move)
+                    in_moves = True
+
+    if in_moves or game.tags:
+        yield game
+
+
+def parse_square(name):
+    """
+    Converts a standard square name into board coordinates.
+
+    Parameters:
+        name (str): The square, e.g. "e4".
+
+    Returns:
+        tuple: The position as (row, column), e.g. (4, 4).
+    """
+    return 8 - int(name[1]), ord(name[0]) - ord("a")
+
+
+def format_square(position):
+    """
+    Converts board coordinates into a standard square name.
+
+    Parameters:
+        position (tuple): The position as (row, column).
+
+    Returns:
+        str: The square, e.g. "e4" for (4, 4).
+    """
+    row, col = position
+    return f"{'abcdefgh'[col]}{8 - row}"
+
+
+def resolve_san(board, san, color):
+    """
+    Finds the piece and destination a SAN move refers to.
+
+    Parameters:
+        board (Board): The position the move is played in.
+        san (str): The move, e.g. "Nbd7" or "exd5+".
+        color (str): The side playing it, "white" or "black".
+
+    Returns:
+        tuple: The move as (piece, destination), destination being (row, col).
+
+    Raises:
+        ValueError: If the move is malformed, unsupported (castling or promotion),
+        or does not match exactly one piece that can make it.
+    """
+    move = san.rstrip("+#!?")
+    if move.startswith(("O-O", "0-0")):
+        raise ValueError(f"Castling is not supported: {san}")
+    match = _SAN.match(move)
+    if match is None:
+        raise ValueError(f"Invalid SAN move: {san}")
+    letter, file, rank, _, square, promotion = match.groups()
+    if promotion:
+        raise ValueError(f"Promotion is not supported: {san}")
+
+    destination = parse_square(square)
+    bit = square_bit(*destination)
+    candidates = [
+        piece for piece in board.pieces(color, letter.lower() if letter else "p")
+        if (file is None or piece.position[1] == ord(file) - ord("a"))
+        and (rank is None or piece.position[0] == 8 - int(rank))
+        and board.target_mask(piece) & bit
+    ]
+    if not candidates:
+        raise ValueError(f"No {color} piece can play {san}")
+    if len(candidates) > 1:
+        raise ValueError(f"Ambiguous move: {san}")
+    return candidates[0], destination
+
+
+def format_san(board, piece, destination):
+    """
+    Writes a move in SAN, adding the origin file or rank only when needed.
+
+    Parameters:
+        board (Board): The position the move is played in.
+        piece (Piece): The piece to move.
+        destination (tuple): The destination as (row, col).
+
+    Returns:
+        str: The move, e.g. "Nf3", "exd5" or "Rae1".
+    """
+    row, col = piece.position
+    capture = "x" if board.get_piece(*destination) is not None else ""
+    if piece.symbol == "p":
+        origin = "abcdefgh"[col] if capture else ""
+        return f"{origin}{capture}{format_square(destination)}"
+
+    bit = square_bit(*destination)
+    rivals = [other.position for other in board.pieces(piece.color, piece.symbol)
+              if other is not piece and board.target_mask(other) & bit]
+    origin = ""
+    if rivals:
+        if all(other_col != col for _, other_col in rivals):
+            origin = "abcdefgh"[col]
+        elif all(other_row != row for other_row, _ in rivals):
+            origin = str(8 - row)
+        else:
+            origin = format_square((row, col))
+    return f"{piece.symbol.upper()}{origin}{capture}{format_square(destination)}"
+
+
+def replay_game(game):
+    """
+    Plays a game's moves through Board.move from the initial position.
+
+    Parameters:
+        game (PgnGame): The game to replay.
+
+    Returns:
+        Chess: The game after its last move.
+
+    Raises:
+        ValueError: If a move cannot be played; the message gives the move number.
+    """
+    chess = Chess()
+    for ply, san in enumerate(game.moves):
+        color = WHITE if ply % 2 == 0 else BLACK
+        try:
+            piece, destination = resolve_san(chess.board, san, color)
+            chess.board.move(piece, destination)
+        except (ValueError, ChessInvalid) as e:
+            raise ValueError(f"Move {ply // 2 + 1}{'.' if color == WHITE else '...'} {san}: {e}") from None
+        if chess.check_move() is not True:
+            break
+    return chess
+
+
+def replay_games(source):
+    """
+    Replays every game of a PGN file, one game in memory at a time.
+
+    Parameters:
+        source (str or file): A file path, '-' for standard input, or an open text stream.
+
+    Yields:
+        tuple: (game, chess, error): the PgnGame, the Chess reached (None if
+        a move failed) and the error message (None if the game replayed).
+    """
+    for game in iter_games(source):
+        try:
+            yield game, replay_game(game), None
+        except ValueError as e:
+            yield game, None, str(e)
@@ -1,6 +1,8 @@
 # piece.py
 
 from abc import ABC, abstractmethod
+from attacks import BETWEEN_SQUARES
+from bitboard import square_index, iter_squares, square_position
 
 WHITE = "white"
 BLACK = "black"
@@ -10,6 +12,12 @@ class Piece(ABC):
     Base class for all chess pieces.
     """
 
+    # Letter identifying the piece type (lowercase, as in FEN), used to key the board's bitboards
+    symbol = "?"
+
+    # No per-instance __dict__: a board holds 32 pieces and many boards may be alive at once
+    __slots__ = ("__color__", "__position__")
+
     def __init__(self, color, position):
         """
         Initializes a Piece with a color and position.
@@ -75,6 +83,50 @@ class Piece(ABC):
         """
         pass
 
+    def attacks(self, occupied):
+        """
+        Returns the squares the piece attacks as a bitboard.
+
+        Pieces whose movement comes from the precomputed tables in attacks.py
+        override this; the base implementation returns None, meaning callers
+        have to fall back to check_move.
+
+        Parameters:
+            occupied (int): Bitboard of occupied squares on the board.
+
+        Returns:
+            int or None: Bitboard of attacked squares, or None if not available.
+        """
+        return None
+
+    def move_mask(self, board):
+        """
+        Returns the squares the piece can move to on a board as a bitboard.
+
+        Parameters:
+            board (Board): The board the piece is on.
+
+        Returns:
+            int or None: Bitboard of reachable squares, or None if the piece has no attack table.
+        """
+        attacks = self.attacks(board.occupied)
+        if attacks is None:
+            return None
+        return attacks & ~board.occupancy.get(self.color, 0)
+
+    def generate_moves(self, board):
+        """
+        Yields every destination the piece can legally move to on a board.
+
+        Parameters:
+            board (Board): The board the piece is on.
+
+        Yields:
+            tuple: Destination positions as (row, column).
+        """
+        for square in iter_squares(board.target_mask(self)):
+            yield square_position(square)
+
     def get_coordinates(self, new_position):
         """
         Returns the coordinates for the current and new positions.
@@ -101,32 +153,18 @@ class Piece(ABC):
         Returns:
             bool: True si el camino está libre, False de lo contrario.
         """
-        current_x, current_y = current_position
         new_x, new_y = new_position
+        if not self.is_in_bounds(new_x, new_y):
+            return False
 
-        # Calcular la dirección del movimiento
-        step_x = 0
-        step_y = 0
-
-        if new_x > current_x:
-            step_x = 1
-        elif new_x < current_x:
-            step_x = -1
-
-        if new_y > current_y:
-            step_y = 1
-        elif new_y < current_y:
-            step_y = -1
-
-        x, y = current_x + step_x, current_y + step_y
+        # Las casillas intermedias vienen de la tabla precalculada (None si no están alineadas)
+        between = BETWEEN_SQUARES[square_index(*current_position)][square_index(new_x, new_y)]
+        if between is None:
+            return False
 
-        while (x, y) != (new_x, new_y):
-            if not self.is_in_bounds(x, y):
-                return False
+        for x, y in between:
             if positions[x][y] is not None:
                 return False
-            x += step_x
-            y += step_y
 
         return True
 
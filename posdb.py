@@ -0,0 +1,442 @@
+# posdb.py
+
+"""
+On-disk database of positions in fixed-size binary records.
+
+A database file is a 16-byte header followed by 56-byte records:
+
+    key       8 bytes   Zobrist key of the position (Board.zobrist_key)
+    board    32 bytes   the squares of encoding.py, two per byte (4 bits each)
+    side      1 byte    0 if white is to move, 1 if black is
+    padding   7 bytes
+    meta      8 bytes   free for the caller, e.g. a game id or an evaluation
+
+Numbers are little-endian. Record n starts at byte 16 + 56 * n, so a
+PositionDB reads it straight from the memory-mapped file, and a whole file
+is scanned without reading it into memory.
+
+An index file holds (key, record number) pairs sorted by key, 16 bytes each,
+and is searched by bisection to find a position by its key in O(log n).
+"""
+
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from board import Board
+from encoding import Snapshot
+from piece import WHITE, BLACK
+
+MAGIC = b"CHESSPDB"
+VERSION = 1
+
+HEADER = struct.Struct("<8sHH4x")
+RECORD = struct.Struct("<Q32sB7xQ")
+INDEX_ENTRY = struct.Struct("<QQ")
+
+SIDES = (WHITE, BLACK)
+
+# A square byte keeps its low 4 bits in the file: -1 (255) is stored as 15
+_TO_NIBBLE = bytes(code & 0xF for code in range(256))
+_TO_HIGH_NIBBLE = bytes((code & 0xF) << 4 for code in range(256))
+# And the 4 bits are sign-extended back: 15 is read as 255 (-1)
+_FROM_LOW_NIBBLE = bytes((n & 0xF) | (0xF0 if n & 0x8 else 0) for n in range(256))
+_FROM_HIGH_NIBBLE = bytes((n >> 4) | (0xF0 if n & 0x80 else 0) for n in range(256))
+
+
+def pack_squares(squares):
+    """
+    Packs the 64 square bytes of a snapshot into 32 bytes.
+
+    Parameters:
+        squares (bytes): The 64 square bytes.
+
+    Returns:
+        bytes: Two squares per byte, the lower square index in the low 4 bits.
+    """
+    low = squares[0::2].translate(_TO_NIBBLE)
+    high = squares[1::2].translate(_TO_HIGH_NIBBLE)
+    return (int.from_bytes(low, "little") | int.from_bytes(high, "little")).to_bytes(32, "little")
+
+
+def unpack_squares(packed):
+    """
+    Unpacks 32 bytes written by pack_squares into the 64 square bytes.
+
+    Parameters:
+        packed (bytes): The packed squares.
+
+    Returns:
+        bytes: The 64 square bytes.
+    """
+    squares = bytearray(64)
+    squares[0::2] = packed.translate(_FROM_LOW_NIBBLE)
+    squares[1::2] = packed.translate(_FROM_HIGH_NIBBLE)
+    return bytes(squares)
+
+
+class PositionWriter:
+    """
+    Writes positions to a new database file, one record at a time.
+    """
+
+    def __init__(self, path):
+        """
+        Creates the file (replacing any existing one) and writes its header.
+
+        Parameters:
+            path (str): The database file.
+        """
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self.count = 0
+
+    def add(self, board, meta=0):
+        """
+        Appends a position.
+
+        Parameters:
+            board (Board): The position to store.
+            meta (int): A 64-bit unsigned value stored with it.
+
+        Returns:
+            int: The record number of the position.
+        """
+        snapshot = board.snapshot()
+        self.file.write(RECORD.pack(board.zobrist_key, pack_squares(snapshot.squares),
+                                    SIDES.index(snapshot.side), meta))
+        self.count += 1
+        return self.count - 1
+
+    def close(self):
+        """
+        Flushes and closes the file.
+        """
+        self.file.close()
+
+    def __enter__(self):
+        """
+        Returns the writer for use in a with statement.
+
+        Returns:
+            PositionWriter: This instance.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Closes the file when the with statement ends.
+
+        Parameters:
+            exc_type (type): The exception type, if one was raised.
+            exc_value (Exception): The exception, if one was raised.
+            traceback (traceback): The exception's traceback, if one was raised.
+        """
+        self.close()
+
+
+class PositionDB:
+    """
+    Read-only, memory-mapped access to a database file and its optional index.
+    """
+
+    def __init__(self, path, index_path=None):
+        """
+        Maps the database file, and the index file if given.
+
+        Parameters:
+            path (str): The database file.
+            index_path (str): An index written by build_index, or None.
+
+        Raises:
+            ValueError: If the file is not a position database of this version.
+        """
+        self.index = None
+        self.file = open(path, "rb")
+        # Checked before mapping: mmap cannot map an empty file
+        if os.fstat(self.file.fileno()).st_size < HEADER.size:
+            self.file.close()
+            raise ValueError(f"{path} is not a position database.")
+        self.memory = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = HEADER.unpack_from(self.memory, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} position database.")
+        self.size = (len(self.memory) - HEADER.size) // RECORD.size
+        self.index = PositionIndex(index_path) if index_path is not None else None
+
+    def __len__(self):
+        """
+        Counts the records in the database.
+
+        Returns:
+            int: The number of records.
+        """
+        return self.size
+
+    def record(self, number):
+        """
+        Reads a record without decoding its board.
+
+        Parameters:
+            number (int): The record number (negative numbers count from the end).
+
+        Returns:
+            tuple: (key, packed squares, side, meta), the side as "white" or "black".
+
+        Raises:
+            IndexError: If there is no such record.
+        """
+        if number < 0:
+            number += self.size
+        if not 0 <= number < self.size:
+            raise IndexError(f"Record {number} out of range.")
+        key, packed, side, meta = RECORD.unpack_from(self.memory, HEADER.size + number * RECORD.size)
+        return key, packed, SIDES[side], meta
+
+    def snapshot(self, number):
+        """
+        Reads a record's position as a snapshot.
+
+        Parameters:
+            number (int): The record number.
+
+        Returns:
+            Snapshot: The position.
+        """
+        _, packed, side, _ = self.record(number)
+        return Snapshot(unpack_squares(packed), side)
+
+    def board(self, number):
+        """
+        Reads a record's position into a new Board.
+
+        Parameters:
+            number (int): The record number.
+
+        Returns:
+            Board: The position.
+        """
+        return Board.from_snapshot(self.snapshot(number))
+
+    def meta(self, number):
+        """
+        Reads a record's metadata slot.
+
+        Parameters:
+            number (int): The record number.
+
+        Returns:
+            int: The value stored with the position.
+        """
+        return self.record(number)[3]
+
+    def __iter__(self):
+        """
+        Scans every record in file order.
+
+        Yields:
+            tuple: (key, packed squares, side, meta), as returned by record().
+        """
+        memory = self.memory
+        for offset in range(HEADER.size, HEADER.size + self.size * RECORD.size, RECORD.size):
+            key, packed, side, meta = RECORD.unpack_from(memory, offset)
+            yield key, packed, SIDES[side], meta
+
+    def keys(self):
+        """
+        Gets the key of every record, in file order.
+
+        Returns:
+            list: The 64-bit keys.
+        """
+        return [key for key, _, _, _ in self]
+
+    def lookup(self, key):
+        """
+        Finds the records holding a position, through the index.
+
+        Parameters:
+            key (int): The position's Zobrist key.
+
+        Returns:
+            list: The record numbers, in file order.
+
+        Raises:
+            ValueError: If the database was opened without an index.
+        """
+        if self.index is None:
+            raise ValueError("The database was opened without an index.")
+        return self.index.lookup(key)
+
+    def find(self, key):
+        """
+        Reads every stored board with a given key.
+
+        Parameters:
+            key (int): The position's Zobrist key.
+
+        Returns:
+            list: The boards, in file order.
+        """
+        return [self.board(number) for number in self.lookup(key)]
+
+    def close(self):
+        """
+        Unmaps and closes the files.
+        """
+        if self.index is not None:
+            self.index.close()
+        self.memory.close()
+        self.file.close()
+
+    def __enter__(self):
+        """
+        Returns the database for use in a with statement.
+
+        Returns:
+            PositionDB: This instance.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Unmaps and closes the files when the with statement ends.
+
+        Parameters:
+            exc_type (type): The exception type, if one was raised.
+            exc_value (Exception): The exception, if one was raised.
+            traceback (traceback): The exception's traceback, if one was raised.
+        """
+        self.close()
+
+
+class PositionIndex:
+    """
+    A memory-mapped index of (key, record number) pairs sorted by key.
+    """
+
+    def __init__(self, path):
+        """
+        Maps the index file.
+
+        Parameters:
+            path (str): An index written by build_index.
+        """
+        self.file = open(path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size // INDEX_ENTRY.size
+        # mmap cannot map an empty file
+        self.memory = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.keys = _Keys(self)
+
+    def __len__(self):
+        """
+        Counts the entries in the index.
+
+        Returns:
+            int: The number of (key, record number) pairs.
+        """
+        return self.size
+
+    def lookup(self, key):
+        """
+        Finds the record numbers stored under a key by bisection.
+
+        Parameters:
+            key (int): The position's Zobrist key.
+
+        Returns:
+            list: The record numbers, in file order.
+        """
+        numbers = []
+        for entry in range(bisect_left(self.keys, key), self.size):
+            entry_key, number = INDEX_ENTRY.unpack_from(self.memory, entry * INDEX_ENTRY.size)
+            if entry_key != key:
+                break
+            numbers.append(number)
+        return numbers
+
+    def close(self):
+        """
+        Unmaps and closes the file.
+        """
+        if self.size:
+            self.memory.close()
+        self.file.close()
+
+
+class _Keys:
+    """
+    The keys of a PositionIndex as a read-only sequence, for bisect.
+    """
+
+    def __init__(self, index):
+        """
+        Wraps an index.
+
+        Parameters:
+            index (PositionIndex): The index whose keys are read.
+        """
+        self.index = index
+
+    def __len__(self):
+        """
+        Counts the keys.
+
+        Returns:
+            int: The number of entries in the index.
+        """
+        return self.index.size
+
+    def __getitem__(self, entry):
+        """
+        Reads one key.
+
+        Parameters:
+            entry (int): The entry number, in key order.
+
+        Returns:
+            int: The entry's key.
+        """
+        return INDEX_ENTRY.unpack_from(self.index.memory, entry * INDEX_ENTRY.size)[0]
+
+
+def write_positions(path, boards, metas=None):
+    """
+    Writes a database file from an iterable of boards.
+
+    Parameters:
+        path (str): The database file.
+        boards (iterable): The positions.
+        metas (iterable): The metadata of each position; 0 for all if None.
+
+    Returns:
+        int: The number of records written.
+    """
+    with PositionWriter(path) as writer:
+        if metas is None:
+            for board in boards:
+                writer.add(board)
+        else:
+            for board, meta in zip(boards, metas):
+                writer.add(board, meta)
+        return writer.count
+
+
+def build_index(path, index_path):
+    """
+    Writes the sorted key index of a database file.
+
+    Parameters:
+        path (str): The database file.
+        index_path (str): The index file to create.
+
+    Returns:
+        int: The number of entries written.
+    """
+    with PositionDB(path) as db:
+        entries = sorted((key, number) for number, key in enumerate(db.keys()))
+    with open(index_path, "wb") as f:
+        for key, number in entries:
+            f.write(INDEX_ENTRY.pack(key, number))
+    return len(entries)
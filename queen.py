@@ -1,12 +1,17 @@
 # queen.py
 
 from piece import Piece, WHITE, BLACK
+from attacks import QUEEN_MOVES, queen_attacks
+from bitboard import square_index
 
 class Queen(Piece):
     """
     Represents a queen chess piece, inheriting from the Piece base class.
     """
 
+    symbol = "q"
+    __slots__ = ()
+
     def __init__(self, color, position):
         """
         Initializes a Queen instance with a color and position.
@@ -44,31 +49,25 @@ class Queen(Piece):
         if not self.is_in_bounds(new_x, new_y):
             return False
 
-        # Verificar si la reina intenta moverse a su posición actual
-        if (new_x, new_y) == (current_x, current_y):
-            return False
-
         destination_piece = positions[new_x][new_y]
         if destination_piece is not None and destination_piece.color == self.color:
             return False
 
-        # Determinar la dirección del movimiento
-        delta_x = new_x - current_x
-        delta_y = new_y - current_y
-
-        # Normalizar los pasos para dirección
-        step_x = (delta_x > 0) - (delta_x < 0)
-        step_y = (delta_y > 0) - (delta_y < 0)
-
-        # Verificar si el movimiento es válido (horizontal, vertical o diagonal)
-        if step_x != 0 and step_y != 0:
-            # Movimiento diagonal
-            if abs(delta_x) != abs(delta_y):
-                return False
-        elif step_x == 0 and step_y == 0:
-            # No se mueve
+        # Verificar si el movimiento es horizontal, vertical o diagonal (excluye su posición actual)
+        if not QUEEN_MOVES[square_index(current_x, current_y)] >> square_index(new_x, new_y) & 1:
             return False
-        # Si solo uno de step_x o step_y es diferente de cero, es horizontal o vertical
 
         # Verificar si el camino está libre utilizando el método de la clase base
         return self.is_path_clear(positions, self.position, new_position)
+
+    def attacks(self, occupied):
+        """
+        Returns the squares the queen attacks, stopping at the first piece on each line.
+
+        Parameters:
+            occupied (int): Bitboard of occupied squares.
+
+        Returns:
+            int: Bitboard of attacked squares.
+        """
+        return queen_attacks(square_index(*self.position), occupied)
@@ -1,12 +1,17 @@
 # rook.py
 
 from piece import Piece
+from attacks import ROOK_MOVES, rook_attacks
+from bitboard import square_index
 
 class Rook(Piece):
     """
     Represents a rook chess piece, inheriting from the Piece base class.
     """
 
+    symbol = "r"
+    __slots__ = ()
+
     def __init__(self, color, position):
         """
         Initializes a Rook instance with a color and position.
@@ -37,12 +42,28 @@ class Rook(Piece):
         Returns:
             bool: True if the move is valid, False otherwise.
         """
-        if self.horizontal_move(positions, new_position) or self.vertical_move(positions, new_position):
-            # Check if destination is within the board boundaries
-            if not self.is_in_bounds(*new_position):
-                return False
-            # Check if the destination is occupied by a friendly piece
-            destination_piece = positions[new_position[0]][new_position[1]]
-            if destination_piece is None or destination_piece.__color__ != self.__color__:
-                return True
-        return False
+        new_x, new_y, current_x, current_y = self.get_coordinates(new_position)
+
+        # Check if destination is within the board boundaries
+        if not self.is_in_bounds(new_x, new_y):
+            return False
+        # Check that the destination shares the rook's row or column
+        if not ROOK_MOVES[square_index(current_x, current_y)] >> square_index(new_x, new_y) & 1:
+            return False
+        # Check if the destination is occupied by a friendly piece
+        destination_piece = positions[new_x][new_y]
+        if destination_piece is not None and destination_piece.__color__ == self.__color__:
+            return False
+        return self.is_path_clear(positions, self.position, new_position)
+
+    def attacks(self, occupied):
+        """
+        Returns the squares the rook attacks, stopping at the first piece on each ray.
+
+        Parameters:
+            occupied (int): Bitboard of occupied squares.
+
+        Returns:
+            int: Bitboard of attacked squares.
+        """
+        return rook_attacks(square_index(*self.position), occupied)
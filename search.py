@@ -0,0 +1,420 @@
+# search.py
+
+"""
+Alpha-beta search engine for choosing a move.
+
+search() runs a negamax alpha-beta search with iterative deepening on the
+game's Board, using push/pop to walk the tree and a TranspositionTable to
+reuse results between iterations. It stops at a depth limit, a time limit
+or both, and always returns the best move of the deepest search so far.
+Positions are scored with evaluation.evaluate. A side with no valid move
+is checkmated (scored MATE minus the distance from the root, so shorter
+mates score higher) or stalemated (scored 0).
+"""
+
+import random
+import time
+from evaluation import PIECE_VALUES, evaluate
+from tt import TranspositionTable, EXACT, LOWER, UPPER
+
+INFINITY = 1000000
+MAX_DEPTH = 64
+
+# Checkmate scores lie within MAX_DEPTH of +/-MATE, well inside the table's 16-bit scores
+MATE = 30000
+MATE_BOUND = MATE - MAX_DEPTH * 2
+
+# How many nodes to search between looks at the clock
+CHECK_INTERVAL = 256
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the deadline passes, to unwind the tree.
+    """
+    pass
+
+
+class SearchResult:
+    """
+    The outcome of a search: the chosen move and how much work it took.
+    """
+
+    def __init__(self, move, score, depth, nodes, seconds):
+        """
+        Initializes a SearchResult.
+
+        Parameters:
+            move (tuple or None): The best move as ((row, col), (row, col)), or None if there is none.
+            score (int): The score in centipawns, from the side to move's point of view.
+            depth (int): The deepest iteration that completed.
+            nodes (int): The number of positions searched.
+            seconds (float): The time the search took.
+        """
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.seconds = seconds
+
+    @property
+    def nps(self):
+        """
+        Gets the search speed.
+
+        Returns:
+            float: Nodes searched per second.
+        """
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    @property
+    def mate(self):
+        """
+        Gets the distance to a forced checkmate, if the score is one.
+
+        Returns:
+            int or None: Moves until the side to move mates (positive) or is
+            mated (negative), or None if the score is not a mate score.
+        """
+        if abs(self.score) <= MATE_BOUND:
+            return None
+        plies = MATE - abs(self.score)
+        return (plies + 1) // 2 if self.score > 0 else -(plies // 2)
+
+    def __repr__(self):
+        """
+        Returns a summary of the result.
+
+        Returns:
+            str: The move, score, depth, nodes and speed.
+        """
+        return (f"SearchResult(move={self.move}, score={self.score}, depth={self.depth}, "
+                f"nodes={self.nodes}, nps={self.nps:.0f})")
+
+
+def score_to_table(score, ply):
+    """
+    Converts a mate score from distance-to-root into distance-to-node for the table.
+
+    Parameters:
+        score (int): The score found at the node.
+        ply (int): The node's distance from the root.
+
+    Returns:
+        int: The score to store.
+    """
+    if score > MATE_BOUND:
+        return score + ply
+    if score < -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    """
+    Converts a stored mate score back into distance-to-root.
+
+    Parameters:
+        score (int): The stored score.
+        ply (int): The distance from the root of the node probing the table.
+
+    Returns:
+        int: The score for this node.
+    """
+    if score > MATE_BOUND:
+        return score - ply
+    if score < -MATE_BOUND:
+        return score + ply
+    return score
+
+
+def move_squares(move):
+    """
+    Converts a (piece, destination) move into its squares.
+
+    Parameters:
+        move (tuple): The move as (piece, destination).
+
+    Returns:
+        tuple: The move as ((row, col), (row, col)).
+    """
+    piece, destination = move
+    return piece.position, destination
+
+
+class Searcher:
+    """
+    Runs iterative deepening alpha-beta searches over one Board.
+    """
+
+    def __init__(self, board, table=None, seed=None):
+        """
+        Initializes the searcher.
+
+        Parameters:
+            board (Board): The position to search; it is restored after every search.
+            table (TranspositionTable): The table to share results through; a 16 MB one if None.
+            seed (int): If given, quiet moves are tried in a random order drawn
+                from this seed, so parallel searchers explore different trees.
+        """
+        self.board = board
+        self.table = table if table is not None else TranspositionTable(16)
+        self.rng = random.Random(seed) if seed is not None else None
+        # Optional callable polled during the search; returning True ends it early
+        self.stop = None
+        self.nodes = 0
+        self.deadline = None
+        self.root_best = (0, None)
+
+    def search(self, depth=None, time_ms=None):
+        """
+        Searches the position for the side to move.
+
+        Parameters:
+            depth (int): The maximum depth in plies.
+            time_ms (int): The time limit in milliseconds.
+
+        Returns:
+            SearchResult: The best move found and the search statistics.
+
+        Raises:
+            ValueError: If neither a depth nor a time limit is given.
+        """
+        if depth is None and time_ms is None:
+            raise ValueError("A search needs a depth or a time limit.")
+        max_depth = depth if depth is not None else MAX_DEPTH
+        start = time.perf_counter()
+        self.deadline = start + time_ms / 1000 if time_ms is not None else None
+        self.nodes = 0
+
+        best_move, best_score, completed = None, 0, 0
+        for current_depth in range(1, max_depth + 1):
+            try:
+                best_score, best_move = self.search_root(current_depth, best_move)
+            except SearchTimeout:
+                # The previous best is searched first, so a move the unfinished
+                # iteration preferred has been compared against it
+                if self.root_best[1] is not None:
+                    best_score, best_move = self.root_best
+                elif best_move is None:
+                    best_move = self.fallback_move()
+                break
+            completed = current_depth
+            # Nothing to play, or a forced mate: searching deeper cannot change the result
+            if best_move is None or abs(best_score) > MATE_BOUND:
+                break
+
+        seconds = time.perf_counter() - start
+        return SearchResult(best_move, best_score, completed, self.nodes, seconds)
+
+    def fallback_move(self):
+        """
+        Chooses a move without searching, for when time runs out before any
+        root move has been searched: the hash move, else the best capture by
+        MVV/LVA, else the first valid move.
+
+        Returns:
+            tuple: The move as ((row, col), (row, col)), or None if there is no valid move.
+        """
+        entry = self.table.probe(self.board.zobrist_key)
+        moves = self.ordered_moves(entry[3] if entry is not None else None)
+        return move_squares(moves[0]) if moves else None
+
+    def search_root(self, depth, previous_best):
+        """
+        Searches every root move to the given depth.
+
+        Parameters:
+            depth (int): The depth in plies.
+            previous_best (tuple): The best move of the previous iteration, searched first.
+
+        Returns:
+            tuple: (score, move), the move as ((row, col), (row, col)) or None.
+
+        Raises:
+            SearchTimeout: If the deadline passes; 'root_best' then holds the
+            best (score, move) of the moves searched so far.
+        """
+        board = self.board
+        alpha, beta = -INFINITY, INFINITY
+        best_score, best_move = -INFINITY, None
+        self.root_best = (0, None)
+        for move in self.ordered_moves(previous_best):
+            board.push(move)
+            try:
+                score = -self.negamax(depth - 1, -beta, -alpha, 1)
+            finally:
+                board.pop()
+            if score > best_score:
+                best_score, best_move = score, move_squares(move)
+                alpha = max(alpha, score)
+                self.root_best = (best_score, best_move)
+
+        if best_move is None:
+            return self.no_moves_score(0), None
+        self.table.store(board.zobrist_key, depth, best_score, EXACT, best_move)
+        return best_score, best_move
+
+    def visit(self):
+        """
+        Counts a searched node and, every CHECK_INTERVAL nodes, checks the
+        clock and the 'stop' callback.
+
+        Raises:
+            SearchTimeout: If the deadline has passed or 'stop' returned True.
+        """
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                raise SearchTimeout()
+            if self.stop is not None and self.stop():
+                raise SearchTimeout()
+
+    def no_moves_score(self, ply):
+        """
+        Scores a position where the side to move has no valid move.
+
+        Parameters:
+            ply (int): The distance from the root.
+
+        Returns:
+            int: -MATE plus the distance if checkmated, 0 if stalemated.
+        """
+        return -(MATE - ply) if self.board.in_check(self.board.side_to_move) else 0
+
+    def negamax(self, depth, alpha, beta, ply):
+        """
+        Searches a position with alpha-beta pruning.
+
+        Parameters:
+            depth (int): The remaining depth in plies.
+            alpha (int): The score the side to move is already guaranteed.
+            beta (int): The score the opponent is already guaranteed.
+            ply (int): The distance from the root, to score mates by length.
+
+        Returns:
+            int: The score from the side to move's point of view.
+        """
+        self.visit()
+        board = self.board
+        key = board.zobrist_key
+        entry = self.table.probe(key)
+        hash_move = None
+        if entry is not None:
+            score, entry_depth, bound, hash_move = entry
+            score = score_from_table(score, ply)
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return score
+                if bound == LOWER and score >= beta:
+                    return score
+                if bound == UPPER and score <= alpha:
+                    return score
+
+        if depth <= 0:
+            return self.quiescence(alpha, beta)
+
+        original_alpha = alpha
+        best_score, best_move = -INFINITY, None
+        for move in self.ordered_moves(hash_move):
+            board.push(move)
+            try:
+                score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                board.pop()
+            if score > best_score:
+                best_score, best_move = score, move_squares(move)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_move is None:
+            return self.no_moves_score(ply)
+
+        if best_score <= original_alpha:
+            bound = UPPER
+        elif best_score >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table.store(key, depth, score_to_table(best_score, ply), bound, best_move)
+        return best_score
+
+    def quiescence(self, alpha, beta):
+        """
+        Extends the search through captures so the horizon is not mid-exchange.
+
+        Parameters:
+            alpha (int): The score the side to move is already guaranteed.
+            beta (int): The score the opponent is already guaranteed.
+
+        Returns:
+            int: The score from the side to move's point of view.
+        """
+        self.visit()
+        board = self.board
+        stand_pat = evaluate(board)
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+
+        for move in self.ordered_moves(None, captures_only=True):
+            board.push(move)
+            try:
+                score = -self.quiescence(-beta, -alpha)
+            finally:
+                board.pop()
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def ordered_moves(self, first_move, captures_only=False):
+        """
+        Lists the side to move's moves, best candidates first.
+
+        The hash (or previous best) move goes first, then captures ordered by
+        most valuable victim and least valuable attacker, then quiet moves.
+
+        Parameters:
+            first_move (tuple): A move as ((row, col), (row, col)) to try first, or None.
+            captures_only (bool): If True, leave out moves that capture nothing.
+
+        Returns:
+            list: Moves as (piece, destination).
+        """
+        board = self.board
+        scored = []
+        for piece, destination in board.legal_moves(board.side_to_move):
+            victim = board.get_piece(*destination)
+            if victim is None and captures_only:
+                continue
+            if first_move is not None and (piece.position, destination) == first_move:
+                order = INFINITY
+            elif victim is not None:
+                order = 10 * PIECE_VALUES.get(victim.symbol, 0) - PIECE_VALUES.get(piece.symbol, 0) + 10000
+            elif self.rng is not None:
+                order = self.rng.random()
+            else:
+                order = 0
+            scored.append((order, piece, destination))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [(piece, destination) for _, piece, destination in scored]
+
+
+def search(chess, time_ms=None, depth=None, table=None):
+    """
+    Chooses a move for the side to move in a game.
+
+    Parameters:
+        chess (Chess): The game to search; its board is left unchanged.
+        time_ms (int): The time limit in milliseconds.
+        depth (int): The maximum depth in plies.
+        table (TranspositionTable): A table to reuse between searches, or None for a new one.
+
+    Returns:
+        SearchResult: The best move found with its score, the depth reached,
+        the nodes searched and the speed.
+    """
+    chess.board.set_side_to_move(chess.turn.lower())
+    return Searcher(chess.board, table).search(depth=depth, time_ms=time_ms)
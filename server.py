@@ -0,0 +1,421 @@
+# server.py
+
+"""
+A TCP server hosting many games in one asyncio event loop.
+
+Each connection plays its own Chess game. The client sends one command per
+line and gets one reply line per command, in order, so commands can be
+pipelined: a client may send several lines before reading the replies.
+
+    NEW                 start a new game
+    MOVE <from> <to>    move a piece, e.g. "MOVE E7 E5" (as CLI.attempt_move)
+    COMPUTER            let the engine play the side to move
+    DRAW                offer a draw; the next ACCEPT or REJECT answers it
+    ACCEPT / REJECT     answer a draw offer
+    RESIGN              the side to move resigns
+    BOARD               the position as FEN
+    TURN                the side to move, WHITE or BLACK
+    QUIT                close the connection
+
+Replies start with "OK" or "ERROR". A reply ending the game carries the
+result as CLI prints it: "OK White wins", "OK Black wins" or "OK Draw".
+
+Replies are written without waiting for the client to read them; the
+server only waits (StreamWriter.drain) once the connection's send buffer
+passes its high-water mark. Engine searches run in a worker thread so the
+other games keep going while one is thinking.
+
+The games live in a sessions.SessionStore, so the games of idle
+connections are packed away once the store's memory budget is full and
+revived on their next command.
+
+    python server.py --port 8765
+"""
+
+import argparse
+import asyncio
+from chess import Chess
+from bitboard import square_name
+from moves import ChessInvalid
+from search import search
+from sessions import SessionStore, DEFAULT_MEMORY_BUDGET
+
+DEFAULT_PORT = 8765
+
+# Time the computer opponent may think per move, in milliseconds
+ENGINE_TIME_MS = 1000
+
+# Longest command line accepted, in bytes
+MAX_LINE = 1024
+
+# Connections the operating system may queue before the server accepts them
+BACKLOG = 1024
+
+RESULTS = ("White wins", "Black wins", "Draw")
+
+# Number of arguments of each command
+COMMANDS = {
+    "NEW": 0, "MOVE": 2, "COMPUTER": 0, "DRAW": 0, "ACCEPT": 0,
+    "REJECT": 0, "RESIGN": 0, "BOARD": 0, "TURN": 0, "QUIT": 0,
+}
+
+
+class GameSession:
+    """
+    The game of one connection and the commands that act on it.
+    """
+
+    def __init__(self, engine_time_ms=ENGINE_TIME_MS, store=None):
+        """
+        Starts a session with a new game.
+
+        Parameters:
+            engine_time_ms (int): The time the engine may think per move, in milliseconds.
+            store (SessionStore): The store keeping the game; a store of its own if None.
+        """
+        self.engine_time_ms = engine_time_ms
+        self.store = store if store is not None else SessionStore()
+        self.game_id = None
+        self.new_game()
+
+    @property
+    def chess(self):
+        """
+        Gets the session's game from the store, reviving it if it was packed.
+
+        Returns:
+            Chess: The game.
+        """
+        return self.store.get(self.game_id)
+
+    def new_game(self):
+        """
+        Replaces the game with a new one.
+        """
+        self.close()
+        self.game_id = self.store.create(Chess())
+        self.result = None
+        self.draw_offer = None
+
+    def close(self):
+        """
+        Removes the game from the store.
+        """
+        if self.game_id is not None:
+            self.store.remove(self.game_id)
+            self.game_id = None
+
+    async def execute(self, line):
+        """
+        Runs one command line.
+
+        Parameters:
+            line (str): The command and its arguments, separated by spaces.
+
+        Returns:
+            str: The reply line, without the line break.
+        """
+        words = line.split()
+        if not words:
+            return "ERROR Empty command"
+        command, args = words[0].upper(), words[1:]
+        if command not in COMMANDS:
+            return f"ERROR Unknown command: {words[0]}"
+        if len(args) != COMMANDS[command]:
+            return f"ERROR {command} takes {COMMANDS[command]} arguments"
+        try:
+            return await getattr(self, f"command_{command.lower()}")(*args)
+        except (ValueError, ChessInvalid) as e:
+            return f"ERROR {e}"
+
+    def check_playing(self):
+        """
+        Makes sure the game has not ended.
+
+        Raises:
+            ValueError: If the game is over.
+        """
+        if self.result is not None:
+            raise ValueError(f"The game is over: {self.result}")
+
+    def finish(self, result):
+        """
+        Records the outcome of a move or an answer.
+
+        Parameters:
+            result (str or bool): The value returned by Chess.move, or a result string.
+
+        Returns:
+            str: The reply, "OK" followed by the result if the game ended.
+        """
+        self.draw_offer = None
+        if result in RESULTS:
+            self.result = result
+            return f"OK {result}"
+        return "OK"
+
+    async def command_new(self):
+        """
+        NEW: starts a new game, dropping the current one.
+
+        Returns:
+            str: "OK".
+        """
+        self.new_game()
+        return "OK"
+
+    async def command_move(self, from_input, to_input):
+        """
+        MOVE: moves a piece, as CLI.attempt_move does.
+
+        Parameters:
+            from_input (str): The starting square, e.g. "E7".
+            to_input (str): The destination square.
+
+        Returns:
+            str: "OK", followed by the result if the move ended the game.
+
+        Raises:
+            ValueError: If the game is over or a square is malformed.
+            ChessInvalid: If the move is not valid (see Chess.move).
+        """
+        self.check_playing()
+        return self.finish(self.chess.move(from_input.upper(), to_input.upper()))
+
+    async def command_computer(self):
+        """
+        COMPUTER: lets the engine choose and play the move for the side to move.
+
+        Returns:
+            str: "OK", the result if the move ended the game, and the move's
+            origin and destination, e.g. "OK E7 E5".
+
+        Raises:
+            ValueError: If the game is over or the engine has no move to play.
+        """
+        self.check_playing()
+        # The session runs one command at a time, and the hold keeps the store from
+        # packing the game while the search plays moves on its board
+        with self.store.hold(self.game_id) as chess:
+            found = await asyncio.to_thread(search, chess, time_ms=self.engine_time_ms)
+            if found.move is None:
+                raise ValueError("The computer has no move to play")
+            from_input, to_input = (square_name(position) for position in found.move)
+            reply = self.finish(chess.move(from_input, to_input))
+        return f"{reply} {from_input} {to_input}"
+
+    async def command_draw(self):
+        """
+        DRAW: offers a draw, to be answered with ACCEPT or REJECT.
+
+        Returns:
+            str: "OK".
+
+        Raises:
+            ValueError: If the game is over.
+        """
+        self.check_playing()
+        self.draw_offer = self.chess.turn
+        return "OK"
+
+    async def command_accept(self):
+        """
+        ACCEPT: accepts the draw offer, ending the game.
+
+        Returns:
+            str: "OK Draw".
+
+        Raises:
+            ValueError: If the game is over or no draw was offered.
+        """
+        self.check_draw_offer()
+        return self.finish("Draw")
+
+    async def command_reject(self):
+        """
+        REJECT: rejects the draw offer; the game goes on.
+
+        Returns:
+            str: "OK".
+
+        Raises:
+            ValueError: If the game is over or no draw was offered.
+        """
+        self.check_draw_offer()
+        self.draw_offer = None
+        return "OK"
+
+    def check_draw_offer(self):
+        """
+        Makes sure there is a draw offer to answer.
+
+        Raises:
+            ValueError: If the game is over or no draw was offered.
+        """
+        self.check_playing()
+        if self.draw_offer is None:
+            raise ValueError("There is no draw offer to answer")
+
+    async def command_resign(self):
+        """
+        RESIGN: the side to move resigns, and the other side wins.
+
+        Returns:
+            str: "OK White wins" or "OK Black wins".
+
+        Raises:
+            ValueError: If the game is over.
+        """
+        self.check_playing()
+        return self.finish("White wins" if self.chess.next_turn() == "WHITE" else "Black wins")
+
+    async def command_board(self):
+        """
+        BOARD: writes the position.
+
+        Returns:
+            str: "OK" followed by the position as FEN.
+        """
+        return f"OK {self.chess.to_fen()}"
+
+    async def command_turn(self):
+        """
+        TURN: tells whose turn it is.
+
+        Returns:
+            str: "OK WHITE" or "OK BLACK".
+        """
+        return f"OK {self.chess.turn}"
+
+    async def command_quit(self):
+        """
+        QUIT: ends the session; the server closes the connection after the reply.
+
+        Returns:
+            str: "OK".
+        """
+        return "OK"
+
+
+class ChessServer:
+    """
+    Accepts connections and gives each one a GameSession.
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, engine_time_ms=ENGINE_TIME_MS,
+                 store=None):
+        """
+        Configures the server; start() opens the socket.
+
+        Parameters:
+            host (str): The address to listen on.
+            port (int): The port to listen on; 0 picks a free one.
+            engine_time_ms (int): The time the engine may think per move, in milliseconds.
+            store (SessionStore): The store keeping the games; a new one if None.
+        """
+        self.host = host
+        self.port = port
+        self.engine_time_ms = engine_time_ms
+        self.store = store if store is not None else SessionStore()
+        # The writer of each open connection, by its handler task
+        self.clients = {}
+        self.server = None
+
+    async def start(self):
+        """
+        Starts listening.
+
+        Returns:
+            int: The port the server listens on.
+        """
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                                 limit=MAX_LINE, backlog=BACKLOG)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self):
+        """
+        Starts listening and serves until cancelled.
+        """
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        """
+        Stops accepting connections, closes the open ones and waits for their games to end.
+        """
+        self.server.close()
+        for writer in self.clients.values():
+            writer.close()
+        # A closed connection reads as end of file, so each handler returns
+        await asyncio.gather(*self.clients, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        """
+        Runs the commands of one connection until it sends QUIT or disconnects.
+
+        Parameters:
+            reader (StreamReader): The connection's input.
+            writer (StreamWriter): The connection's output.
+        """
+        session = GameSession(self.engine_time_ms, self.store)
+        task = asyncio.current_task()
+        self.clients[task] = writer
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line is longer than MAX_LINE: there is no way to find the next command
+                    writer.write(b"ERROR Line too long\n")
+                    break
+                if not line:
+                    break
+                command = line.decode("utf-8", "replace").strip()
+                reply = await session.execute(command)
+                writer.write(reply.encode() + b"\n")
+                # Returns at once unless the client has fallen behind reading replies
+                await writer.drain()
+                if command.upper() == "QUIT":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            del self.clients[task]
+            session.close()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main(argv=None):
+    """
+    Runs the server until interrupted.
+
+    Parameters:
+        argv (list): Command line arguments; sys.argv[1:] if None.
+    """
+    parser = argparse.ArgumentParser(description="Serve chess games over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--engine-time", type=int, default=ENGINE_TIME_MS,
+                        help="milliseconds the computer may think per move")
+    parser.add_argument("--memory", type=int, default=DEFAULT_MEMORY_BUDGET // 2**20,
+                        help="megabytes of live games; idle games beyond it are packed")
+    args = parser.parse_args(argv)
+
+    server = ChessServer(args.host, args.port, args.engine_time,
+                         SessionStore(memory_budget=args.memory * 2**20))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
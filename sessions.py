@@ -0,0 +1,343 @@
+# sessions.py
+
+"""
+A store of many games that keeps only the recently used ones in memory.
+
+A live game is a Chess object: a Board with its piece objects, bitboards
+and caches, about GAME_BYTES of memory. Most hosted games sit idle waiting
+for a player, so SessionStore keeps live only as many games as fit in its
+memory budget. When a game is needed and the budget is full, the least
+recently used live game is packed into a compact record:
+
+    board     32 bytes   the squares of encoding.py, two per byte (posdb.pack_squares)
+    turn       1 byte    0 for white, 1 for black
+    length     2 bytes   the number of moves played
+    history    2 bytes per move: origin and destination square indexes
+
+A packed game is turned back into a Chess object the next time it is used
+(get or move), so callers do not see the difference. Packed records can
+also be spilled to files once they take more than a second budget.
+
+A revived game keeps its position, turn and history, but not the board's
+undo stack (Board.push/pop): the game continues from where it was.
+"""
+
+import os
+import struct
+from collections import OrderedDict, Counter
+from contextlib import contextmanager
+from itertools import count
+from board import Board
+from chess import Chess
+from encoding import Snapshot
+from bitboard import square_index, square_name
+from posdb import pack_squares, unpack_squares
+from piece import WHITE, BLACK
+
+# Estimated memory of one live game in bytes, measured with tracemalloc
+GAME_BYTES = 16 * 1024
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+HEADER = struct.Struct("<32sBH")
+
+TURNS = ("WHITE", "BLACK")
+SIDES = {"WHITE": WHITE, "BLACK": BLACK}
+
+
+def pack_game(chess):
+    """
+    Packs a game's position, turn and history into a compact record.
+
+    Parameters:
+        chess (Chess): The game.
+
+    Returns:
+        bytes: The record, 35 bytes plus 2 per move.
+    """
+    squares = chess.board.snapshot().squares
+    moves = bytearray()
+    for origin, destination in chess.history:
+        moves.append(square_index(*chess.translate_input(origin)))
+        moves.append(square_index(*chess.translate_input(destination)))
+    return HEADER.pack(pack_squares(squares), TURNS.index(chess.turn), len(chess.history)) + moves
+
+
+def unpack_game(record):
+    """
+    Rebuilds a game from a record written by pack_game.
+
+    Parameters:
+        record (bytes): The record.
+
+    Returns:
+        Chess: The game, with a new board.
+
+    Raises:
+        ValueError: If the record is malformed.
+    """
+    if len(record) < HEADER.size:
+        raise ValueError("The game record is too short.")
+    packed, turn, length = HEADER.unpack_from(record)
+    moves = record[HEADER.size:]
+    if turn > 1 or len(moves) != 2 * length:
+        raise ValueError("The game record is malformed.")
+    chess = Chess()
+    chess.turn = TURNS[turn]
+    chess.board = Board.from_snapshot(Snapshot(unpack_squares(packed), SIDES[chess.turn]))
+    chess.history = [(square_name(divmod(moves[i], 8)), square_name(divmod(moves[i + 1], 8)))
+                     for i in range(0, len(moves), 2)]
+    return chess
+
+
+class SessionStore:
+    """
+    Games by id, the least recently used ones packed or spilled to disk.
+    """
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, packed_budget=None,
+                 spill_dir=None, game_bytes=GAME_BYTES):
+        """
+        Creates an empty store.
+
+        Parameters:
+            memory_budget (int): The memory live games may take, in bytes; at
+                least one game is always kept live.
+            packed_budget (int): The memory packed games may take before they
+                are spilled to 'spill_dir', in bytes; None to never spill.
+            spill_dir (str): The directory for spilled games; needed with 'packed_budget'.
+            game_bytes (int): The estimated memory of one live game.
+
+        Raises:
+            ValueError: If 'packed_budget' is given without 'spill_dir'.
+        """
+        if packed_budget is not None and spill_dir is None:
+            raise ValueError("Spilling packed games needs a spill directory.")
+        self.max_live = max(1, memory_budget // game_bytes)
+        self.packed_budget = packed_budget
+        self.spill_dir = spill_dir
+        # Both in least recently used first order
+        self.live = OrderedDict()
+        self.packed = OrderedDict()
+        self.packed_bytes = 0
+        self.spilled = set()
+        self.holds = Counter()
+        self.ids = count()
+
+    def __len__(self):
+        """
+        Counts the games in the store, live, packed or spilled.
+
+        Returns:
+            int: The number of games.
+        """
+        return len(self.live) + len(self.packed) + len(self.spilled)
+
+    def __contains__(self, game_id):
+        """
+        Tells whether a game is in the store, live, packed or spilled.
+
+        Parameters:
+            game_id (int): The game's id.
+
+        Returns:
+            bool: True if the store holds the game.
+        """
+        return game_id in self.live or game_id in self.packed or game_id in self.spilled
+
+    def create(self, chess=None):
+        """
+        Adds a game to the store.
+
+        Parameters:
+            chess (Chess): The game; a new one if None.
+
+        Returns:
+            int: The game's id.
+        """
+        game_id = next(self.ids)
+        self.live[game_id] = chess if chess is not None else Chess()
+        self.enforce_budget(game_id)
+        return game_id
+
+    def get(self, game_id):
+        """
+        Gets a game as a live Chess object, reviving it if it was packed or spilled.
+
+        Parameters:
+            game_id (int): The game's id.
+
+        Returns:
+            Chess: The game. It may be packed again by later calls, so hold
+            it (see hold) to keep using it across them.
+
+        Raises:
+            KeyError: If there is no such game.
+        """
+        chess = self.live.get(game_id)
+        if chess is not None:
+            self.live.move_to_end(game_id)
+            return chess
+        chess = unpack_game(self.take_record(game_id))
+        self.live[game_id] = chess
+        self.enforce_budget(game_id)
+        return chess
+
+    def move(self, game_id, from_input, to_input):
+        """
+        Plays a move in a game, reviving it first if needed.
+
+        Parameters:
+            game_id (int): The game's id.
+            from_input (str): The starting square, as Chess.move reads it.
+            to_input (str): The destination square.
+
+        Returns:
+            bool or str: What Chess.move returns.
+
+        Raises:
+            KeyError: If there is no such game.
+            ChessInvalid: If the move is not valid (see Chess.move).
+        """
+        return self.get(game_id).move(from_input, to_input)
+
+    @contextmanager
+    def hold(self, game_id):
+        """
+        Keeps a game live while the block runs, e.g. during a search in another thread.
+
+        Parameters:
+            game_id (int): The game's id.
+
+        Yields:
+            Chess: The game.
+        """
+        chess = self.get(game_id)
+        self.holds[game_id] += 1
+        try:
+            yield chess
+        finally:
+            self.holds[game_id] -= 1
+            if not self.holds[game_id]:
+                del self.holds[game_id]
+                # Games kept over the budget by the hold are packed now
+                self.enforce_budget()
+
+    def remove(self, game_id):
+        """
+        Deletes a game, and its spill file if it has one.
+
+        Parameters:
+            game_id (int): The game's id.
+
+        Raises:
+            KeyError: If there is no such game.
+        """
+        if self.live.pop(game_id, None) is None:
+            self.take_record(game_id)
+
+    def evict(self, game_id):
+        """
+        Packs a live game now, unless it is held.
+
+        Parameters:
+            game_id (int): The game's id.
+
+        Returns:
+            bool: True if the game was packed.
+        """
+        if game_id not in self.live or game_id in self.holds:
+            return False
+        record = pack_game(self.live.pop(game_id))
+        self.packed[game_id] = record
+        self.packed_bytes += len(record)
+        self.spill()
+        return True
+
+    def enforce_budget(self, keep=None):
+        """
+        Packs the least recently used live games until the rest fit in the budget.
+
+        Parameters:
+            keep (int): The id of the game being used, which stays live; None for none.
+        """
+        candidates = (game_id for game_id in list(self.live) if game_id != keep)
+        while len(self.live) > self.max_live:
+            game_id = next(candidates, None)
+            if game_id is None:
+                # Every other live game is held
+                break
+            self.evict(game_id)
+
+    def spill(self):
+        """
+        Writes the least recently used packed games to disk until the rest fit in 'packed_budget'.
+        """
+        if self.packed_budget is None:
+            return
+        while self.packed_bytes > self.packed_budget:
+            game_id, record = self.packed.popitem(last=False)
+            self.packed_bytes -= len(record)
+            with open(self.spill_path(game_id), "wb") as f:
+                f.write(record)
+            self.spilled.add(game_id)
+
+    def take_record(self, game_id):
+        """
+        Removes a packed or spilled game from the store and returns its record.
+
+        Parameters:
+            game_id (int): The game's id.
+
+        Returns:
+            bytes: The record written by pack_game.
+
+        Raises:
+            KeyError: If the game is neither packed nor spilled.
+        """
+        record = self.packed.pop(game_id, None)
+        if record is not None:
+            self.packed_bytes -= len(record)
+            return record
+        if game_id not in self.spilled:
+            raise KeyError(game_id)
+        path = self.spill_path(game_id)
+        with open(path, "rb") as f:
+            record = f.read()
+        os.remove(path)
+        self.spilled.discard(game_id)
+        return record
+
+    def spill_path(self, game_id):
+        """
+        Gets the file a game is spilled to.
+
+        Parameters:
+            game_id (int): The game's id.
+
+        Returns:
+            str: The path.
+        """
+        return os.path.join(self.spill_dir, f"{game_id}.game")
+
+    def stats(self):
+        """
+        Counts the games in each state.
+
+        Returns:
+            dict: 'live', 'packed' and 'spilled' game counts, and 'packed_bytes'.
+        """
+        return {"live": len(self.live), "packed": len(self.packed),
+                "spilled": len(self.spilled), "packed_bytes": self.packed_bytes}
+
+    def close(self):
+        """
+        Deletes every game, including the spill files.
+        """
+        for game_id in list(self.spilled):
+            os.remove(self.spill_path(game_id))
+        self.spilled.clear()
+        self.packed.clear()
+        self.packed_bytes = 0
+        self.live.clear()
+        self.holds.clear()
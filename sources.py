@@ -0,0 +1,48 @@
+# sources.py
+
+"""
+Line-by-line input shared by the file readers (fen.py, pgn.py, batch.py).
+
+A source is a file path, '-' for standard input, or an open text stream.
+iter_lines reads it lazily, so files of any size are handled in constant
+memory, and closes any file it opened once the lines are consumed.
+"""
+
+import os
+import sys
+
+
+def iter_lines(source, errors="strict"):
+    """
+    Yields the lines of a source one at a time.
+
+    Parameters:
+        source (str or file): A file path, '-' for standard input, or an open text stream.
+        errors (str): How undecodable bytes in a file are handled, as for open().
+
+    Yields:
+        str: The next line, with its line break.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if source == "-":
+            yield from sys.stdin
+        else:
+            with open(os.fspath(source), encoding="utf-8", errors=errors) as stream:
+                yield from stream
+    else:
+        yield from source
+
+
+def source_name(source):
+    """
+    Gets a short name for a source, for messages and identifiers.
+
+    Parameters:
+        source (str or file): A file path, '-' for standard input, or an open text stream.
+
+    Returns:
+        str: "stdin", the file's base name, or the stream's name ("stream" if it has none).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return "stdin" if source == "-" else os.path.basename(os.fspath(source))
+    return getattr(source, "name", "stream")
@@ -0,0 +1,79 @@
+import unittest
+from attacks import (
+    KNIGHT_ATTACKS, KNIGHT_TARGETS, KING_ATTACKS, KING_TARGETS,
+    BETWEEN, BETWEEN_SQUARES, rook_attacks, bishop_attacks, queen_attacks
+)
+from bitboard import square_index, square_bit, popcount
+from knight import Knight
+from king import King
+from rook import Rook
+from board import Board
+from piece import WHITE
+
+class TestStepTables(unittest.TestCase):
+    def test_knight_table_sizes(self):
+        # Un caballo en la esquina ataca 2 casillas y en el centro 8
+        self.assertEqual(popcount(KNIGHT_ATTACKS[square_index(0, 0)]), 2)
+        self.assertEqual(popcount(KNIGHT_ATTACKS[square_index(4, 4)]), 8)
+        self.assertEqual(sorted(KNIGHT_TARGETS[square_index(0, 0)]), [(1, 2), (2, 1)])
+
+    def test_king_table_sizes(self):
+        self.assertEqual(popcount(KING_ATTACKS[square_index(0, 0)]), 3)
+        self.assertEqual(popcount(KING_ATTACKS[square_index(3, 3)]), 8)
+        self.assertEqual(popcount(KING_ATTACKS[square_index(0, 3)]), 5)
+
+    def test_masks_match_targets(self):
+        for table, targets in ((KNIGHT_ATTACKS, KNIGHT_TARGETS), (KING_ATTACKS, KING_TARGETS)):
+            for square in range(64):
+                with self.subTest(square=square):
+                    mask = sum(square_bit(row, col) for row, col in targets[square])
+                    self.assertEqual(table[square], mask)
+
+    def test_piece_attacks_use_tables(self):
+        self.assertEqual(Knight(WHITE, (4, 4)).attacks(0), KNIGHT_ATTACKS[36])
+        self.assertEqual(King(WHITE, (7, 4)).attacks(0), KING_ATTACKS[60])
+
+class TestSliderTables(unittest.TestCase):
+    def test_rook_attacks_empty_board(self):
+        # Una torre en un tablero vacío ataca siempre 14 casillas
+        for square in range(64):
+            with self.subTest(square=square):
+                self.assertEqual(popcount(rook_attacks(square, 0)), 14)
+
+    def test_rook_attacks_stop_at_blockers(self):
+        occupied = square_bit(3, 5) | square_bit(1, 3)
+        attacks = rook_attacks(square_index(3, 3), occupied)
+        # El bloqueador se incluye, las casillas detrás de él no
+        self.assertTrue(attacks & square_bit(3, 5))
+        self.assertFalse(attacks & square_bit(3, 6))
+        self.assertTrue(attacks & square_bit(1, 3))
+        self.assertFalse(attacks & square_bit(0, 3))
+        self.assertTrue(attacks & square_bit(7, 3))
+
+    def test_bishop_and_queen_attacks(self):
+        occupied = square_bit(5, 5)
+        bishop = bishop_attacks(square_index(3, 3), occupied)
+        self.assertTrue(bishop & square_bit(5, 5))
+        self.assertFalse(bishop & square_bit(6, 6))
+        self.assertTrue(bishop & square_bit(0, 0))
+        self.assertEqual(queen_attacks(27, occupied), bishop | rook_attacks(27, occupied))
+
+    def test_between_tables(self):
+        self.assertEqual(BETWEEN_SQUARES[square_index(0, 0)][square_index(0, 3)], ((0, 1), (0, 2)))
+        self.assertEqual(BETWEEN[square_index(0, 0)][square_index(2, 2)], square_bit(1, 1))
+        # Casillas no alineadas no tienen camino
+        self.assertIsNone(BETWEEN_SQUARES[square_index(0, 0)][square_index(1, 2)])
+        self.assertEqual(BETWEEN[square_index(0, 0)][square_index(1, 2)], 0)
+
+    def test_board_validation_uses_occupancy(self):
+        board = Board(for_test=True)
+        rook = Rook(WHITE, (4, 0))
+        board.set_piece_on_board(4, 0, rook)
+        board.set_piece_on_board(4, 3, Rook(WHITE, (4, 3)))
+        self.assertTrue(board.can_reach(rook, (4, 2)))
+        self.assertFalse(board.can_reach(rook, (4, 3)))
+        self.assertFalse(board.can_reach(rook, (4, 5)))
+        self.assertFalse(board.can_reach(rook, (4, 8)))
+
+if __name__ == '__main__':
+    unittest.main()
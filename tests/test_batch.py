@@ -0,0 +1,42 @@
+import io
+import os
+import tempfile
+import unittest
+from batch import iter_games, analyze_game, analyze_games
+
+class TestBatch(unittest.TestCase):
+    def test_iter_games_skips_blank_and_comment_lines(self):
+        stream = io.StringIO("E7E5 B2B4\n\n# comentario\nA7-A5\n")
+        games = list(iter_games(stream))
+        self.assertEqual(games, [("stream:1", ["E7E5", "B2B4"]), ("stream:4", ["A7-A5"])])
+
+    def test_iter_games_reads_directory_in_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name, text in (("b.txt", "A7A5\n"), ("a.txt", "E7E5\n"), ("notas.md", "E7E5\n")):
+                with open(os.path.join(directory, name), "w") as f:
+                    f.write(text)
+            ids = [game_id for game_id, _ in iter_games(directory)]
+        self.assertEqual(ids, ["a.txt:1", "b.txt:1"])
+
+    def test_analyze_game(self):
+        record = analyze_game("g", ["E7E5", "B2B4", "E5E4"])
+        self.assertEqual(record["moves"], 3)
+        self.assertIsNone(record["error"])
+        self.assertEqual(record["turn"], "BLACK")
+        # Material igual; las tablas de casillas premian el peón blanco avanzado
+        self.assertEqual(record["evaluation"], 55)
+
+    def test_analyze_game_stops_at_invalid_move(self):
+        record = analyze_game("g", ["E7E5", "E7E5", "B2B4"])
+        self.assertEqual(record["moves"], 1)
+        self.assertIn("move 2", record["error"])
+
+    def test_analyze_games_in_pool(self):
+        games = [(f"g{i}", ["E7E5", "B2B4"]) for i in range(10)]
+        records = list(analyze_games(games, workers=2, chunk_size=3, max_pending=2, depth=1))
+        # Los resultados llegan en orden de finalización, pero están todos
+        self.assertEqual(sorted(r["id"] for r in records), sorted(g for g, _ in games))
+        self.assertTrue(all(r["best_move"] is not None for r in records))
+
+if __name__ == '__main__':
+    unittest.main()
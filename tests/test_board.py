@@ -0,0 +1,278 @@
+import unittest
+from board import Board
+from pawn import Pawn
+from rook import Rook
+from king import King
+from piece import WHITE, BLACK
+from bitboard import square_bit, popcount
+from moves import MoveError, MovePieceInvalid, KingError, CheckError
+
+class TestBoard(unittest.TestCase):
+    def setUp(self):
+        # Tablero con la posición inicial
+        self.board = Board()
+        # Tablero vacío
+        self.empty_board = Board(for_test=True)
+
+    def test_initial_bitboards(self):
+        # Cada bando empieza con 16 piezas en sus dos primeras filas
+        self.assertEqual(self.board.occupancy[BLACK], (1 << 16) - 1)
+        self.assertEqual(self.board.occupancy[WHITE], ((1 << 16) - 1) << 48)
+        self.assertEqual(self.board.occupied, self.board.occupancy[WHITE] | self.board.occupancy[BLACK])
+        self.assertEqual(popcount(self.board.bitboards[(WHITE, "p")]), 8)
+        self.assertEqual(self.board.bitboards[(BLACK, "k")], square_bit(0, 4))
+
+    def test_pieces_on_board(self):
+        self.assertEqual(self.board.pieces_on_board(), (16, 16))
+        self.assertEqual(self.empty_board.pieces_on_board(), (0, 0))
+
+    def test_set_piece_on_board_updates_bitboards(self):
+        rook = Rook(WHITE, (3, 3))
+        self.empty_board.set_piece_on_board(3, 3, rook)
+        self.assertEqual(self.empty_board.occupied, square_bit(3, 3))
+        self.assertIs(self.empty_board.get_piece(3, 3), rook)
+
+        # Reemplazar la pieza actualiza los bitboards de ambos colores
+        self.empty_board.set_piece_on_board(3, 3, Pawn(BLACK, (3, 3)))
+        self.assertEqual(self.empty_board.bitboards[(WHITE, "r")], 0)
+        self.assertEqual(self.empty_board.occupancy[BLACK], square_bit(3, 3))
+
+        self.empty_board.set_piece_on_board(3, 3, None)
+        self.assertEqual(self.empty_board.occupied, 0)
+
+    def test_move_with_capture(self):
+        rook = Rook(WHITE, (4, 0))
+        pawn = Pawn(BLACK, (4, 5))
+        self.empty_board.set_piece_on_board(4, 0, rook)
+        self.empty_board.set_piece_on_board(4, 5, pawn)
+
+        self.assertTrue(self.empty_board.move(rook, (4, 5)))
+        self.assertIs(self.empty_board.get_piece(4, 5), rook)
+        self.assertIsNone(self.empty_board.get_piece(4, 0))
+        self.assertIsNone(pawn.position)
+        self.assertEqual(self.empty_board.occupied, square_bit(4, 5))
+        self.assertEqual(self.empty_board.pieces_on_board(), (1, 0))
+
+    def test_invalid_moves(self):
+        white_rook = self.board.get_piece(7, 0)
+        with self.assertRaises(MovePieceInvalid):
+            self.board.move(white_rook, (5, 0))
+
+        rook = Rook(WHITE, (4, 4))
+        self.board.set_piece_on_board(4, 4, rook)
+        with self.assertRaises(MoveError):
+            self.board.move(rook, (6, 4))
+
+    def test_cannot_capture_king(self):
+        rook = Rook(WHITE, (0, 0))
+        king = King(BLACK, (0, 4))
+        self.empty_board.set_piece_on_board(0, 0, rook)
+        self.empty_board.set_piece_on_board(0, 4, king)
+        with self.assertRaises(KingError):
+            self.empty_board.move(rook, (0, 4))
+
+    def test_find_piece_uses_index(self):
+        knight = self.board.get_piece(7, 1)
+        self.assertEqual(self.board.find_piece(knight), (7, 1))
+        self.board.move(knight, (5, 2))
+        self.assertEqual(self.board.find_piece(knight), (5, 2))
+        # Una pieza que no está en el tablero no se encuentra
+        self.assertIsNone(self.board.find_piece(Rook(WHITE, (3, 3))))
+
+    def test_piece_lists(self):
+        self.assertEqual(len(self.board.pieces(WHITE)), 16)
+        self.assertEqual(len(self.board.pieces(BLACK, "p")), 8)
+        self.assertEqual(self.board.pieces(WHITE, "k"), [self.board.get_piece(7, 4)])
+
+        # Una captura saca a la pieza de las listas
+        rook = Rook(WHITE, (2, 0))
+        self.board.set_piece_on_board(2, 0, rook)
+        captured = self.board.get_piece(1, 0)
+        self.board.execute_move(rook, (1, 0))
+        self.assertNotIn(captured, self.board.pieces(BLACK, "p"))
+        self.assertIsNone(self.board.find_piece(captured))
+
+    def test_material_counts(self):
+        self.assertEqual(self.board.material(WHITE), {"r": 2, "n": 2, "b": 2, "q": 1, "k": 1, "p": 8})
+        self.assertEqual(self.board.count_pieces(BLACK), 16)
+        self.assertEqual(self.board.count_pieces(BLACK, "n"), 2)
+
+        # La captura descuenta la pieza capturada
+        rook = Rook(WHITE, (2, 0))
+        self.board.set_piece_on_board(2, 0, rook)
+        self.board.execute_move(rook, (1, 0))
+        self.assertEqual(self.board.count_pieces(BLACK, "p"), 7)
+        self.assertEqual(self.board.count_pieces(WHITE, "r"), 3)
+        self.assertEqual(self.board.pieces_on_board(), (17, 15))
+
+        # set_piece_on_board sobre una casilla ocupada reemplaza la pieza
+        self.board.set_piece_on_board(1, 0, Pawn(BLACK, (1, 0)))
+        self.assertEqual(self.board.pieces_on_board(), (16, 16))
+
+    def test_legal_moves_initial_position(self):
+        # En la posición inicial cada bando tiene 20 movimientos
+        self.assertEqual(len(list(self.board.legal_moves(WHITE))), 20)
+        self.assertEqual(len(list(self.board.legal_moves(BLACK))), 20)
+
+    def test_legal_moves_match_validate_move(self):
+        rook = Rook(WHITE, (4, 4))
+        self.board.set_piece_on_board(4, 4, rook)
+        generated = set(rook.generate_moves(self.board))
+        probed = set()
+        for row in range(8):
+            for col in range(8):
+                try:
+                    self.board.validate_move(rook, (row, col))
+                    probed.add((row, col))
+                except (MoveError, KingError):
+                    pass
+        self.assertEqual(generated, probed)
+        # Puede capturar el peón negro de (1, 4) pero no seguir detrás de él
+        self.assertIn((1, 4), generated)
+        self.assertNotIn((0, 4), generated)
+
+    def test_generate_moves_never_captures_king(self):
+        rook = Rook(WHITE, (0, 0))
+        self.empty_board.set_piece_on_board(0, 0, rook)
+        self.empty_board.set_piece_on_board(0, 4, King(BLACK, (0, 4)))
+        moves = set(rook.generate_moves(self.empty_board))
+        self.assertNotIn((0, 4), moves)
+        self.assertIn((0, 3), moves)
+
+    def test_pawn_generate_moves(self):
+        pawn = self.board.get_piece(6, 3)
+        self.assertEqual(set(pawn.generate_moves(self.board)), {(5, 3), (4, 3)})
+        self.board.set_piece_on_board(5, 4, Pawn(BLACK, (5, 4)))
+        self.assertEqual(set(pawn.generate_moves(self.board)), {(5, 3), (4, 3), (5, 4)})
+
+    def test_push_and_pop(self):
+        knight = self.board.get_piece(7, 1)
+        self.board.push((knight, (5, 2)))
+        self.assertIs(self.board.get_piece(5, 2), knight)
+        self.assertEqual(knight.position, (5, 2))
+
+        self.assertEqual(self.board.pop(), (knight, (5, 2)))
+        self.assertIs(self.board.get_piece(7, 1), knight)
+        self.assertIsNone(self.board.get_piece(5, 2))
+        self.assertEqual(knight.position, (7, 1))
+
+    def test_pop_restores_captured_piece(self):
+        occupied = self.board.occupied
+        rook = Rook(WHITE, (2, 0))
+        self.board.set_piece_on_board(2, 0, rook)
+        captured = self.board.get_piece(1, 0)
+
+        self.board.push((rook, (1, 0)))
+        self.assertIsNone(captured.position)
+        self.assertEqual(self.board.count_pieces(BLACK), 15)
+
+        self.board.pop()
+        self.assertIs(self.board.get_piece(1, 0), captured)
+        self.assertEqual(captured.position, (1, 0))
+        self.assertEqual(rook.position, (2, 0))
+        self.assertEqual(self.board.count_pieces(BLACK), 16)
+        self.assertEqual(self.board.find_piece(captured), (1, 0))
+        self.assertEqual(self.board.occupied, occupied | square_bit(2, 0))
+
+    def test_push_pop_sequence_restores_position(self):
+        before = [row[:] for row in self.board.positions]
+        bitboards = dict(self.board.bitboards)
+        for _ in range(4):
+            color = WHITE if len(self.board.move_stack) % 2 == 0 else BLACK
+            self.board.push(next(self.board.legal_moves(color)))
+        while self.board.move_stack:
+            self.board.pop()
+        self.assertEqual(self.board.positions, before)
+        self.assertEqual(self.board.bitboards, bitboards)
+
+    def test_pop_empty_stack(self):
+        with self.assertRaises(MoveError):
+            self.board.pop()
+
+    def test_clean_board(self):
+        self.board.clean_board()
+        self.assertEqual(self.board.occupied, 0)
+        self.assertEqual(self.board.pieces_on_board(), (0, 0))
+        self.assertEqual(self.board.pieces(WHITE), [])
+        self.assertEqual(self.board.material(BLACK), {})
+
+    def test_checkers_and_in_check(self):
+        board = Board.from_fen("4k3/8/8/8/8/8/8/4R2K b")
+        self.assertTrue(board.in_check(BLACK))
+        self.assertFalse(board.in_check(WHITE))
+        self.assertEqual(board.checkers(BLACK), square_bit(7, 4))
+        # El caché se invalida al mover una pieza
+        board.set_piece_on_board(4, 4, Pawn(BLACK, (4, 4)))
+        self.assertFalse(board.in_check(BLACK))
+
+    def test_pinned_piece_moves_along_the_pin(self):
+        # Alfil negro clavado por la torre blanca en la columna del rey
+        board = Board.from_fen("4k3/4b3/8/8/8/8/8/4R2K b")
+        bishop = board.get_piece(1, 4)
+        self.assertEqual(board.pins(BLACK), {1 * 8 + 4: sum(square_bit(row, 4) for row in range(1, 8))})
+        self.assertEqual(list(bishop.generate_moves(board)), [])
+        with self.assertRaises(CheckError):
+            board.validate_move(bishop, (2, 3))
+        # Una torre clavada puede moverse sobre la línea de la clavada
+        board = Board.from_fen("4k3/4r3/8/8/8/8/8/4R2K b")
+        rook = board.get_piece(1, 4)
+        self.assertEqual(sorted(rook.generate_moves(board)), [(row, 4) for row in range(2, 8)])
+
+    def test_check_must_be_answered(self):
+        # Torre blanca da jaque: el alfil negro sólo puede interponerse y el rey no puede quedarse en la columna
+        board = Board.from_fen("4k3/8/2b5/8/8/8/8/4R2K b")
+        moves = {(piece.position, destination) for piece, destination in board.legal_moves(BLACK)}
+        self.assertEqual(moves, {((2, 2), (4, 4)), ((0, 4), (0, 3)), ((0, 4), (0, 5)),
+                                 ((0, 4), (1, 3)), ((0, 4), (1, 5))})
+
+    def test_king_cannot_move_into_check(self):
+        board = Board.from_fen("4k3/8/8/8/8/8/8/3R3K b")
+        king = board.get_piece(0, 4)
+        with self.assertRaises(CheckError):
+            board.validate_move(king, (0, 3))
+        board.validate_move(king, (0, 5))
+
+    def test_replacing_a_piece_keeps_the_index(self):
+        # Colocar la pieza en el destino y después vaciar el origen
+        pawn = self.board.get_piece(6, 4)
+        self.board.set_piece_on_board(4, 4, pawn)
+        self.board.set_piece_on_board(6, 4, None)
+        self.assertEqual(self.board.find_piece(pawn), (4, 4))
+        self.assertEqual(pawn.position, (4, 4))
+        self.assertIs(self.board.get_piece(4, 4), pawn)
+        # Las jugadas salen de la casilla nueva: el peón no puede volver atrás
+        moves = [destination for piece, destination in self.board.legal_moves(WHITE) if piece is pawn]
+        self.assertEqual(moves, [(3, 4)])
+        with self.assertRaises(MoveError):
+            self.board.move(pawn, (5, 4))
+        self.assertEqual(self.board.pieces(WHITE, "p").count(pawn), 1)
+        self.assertEqual(popcount(self.board.occupied), 32)
+
+    def test_checkmate_and_stalemate(self):
+        # Mate de pasillo: la torre da jaque y el rey blanco cubre las casillas de escape
+        board = Board.from_fen("R6k/8/6K1/8/8/8/8/8 b")
+        self.assertTrue(board.is_checkmate(BLACK))
+        self.assertFalse(board.is_stalemate(BLACK))
+        # Ahogado: sin jaque y sin jugadas
+        board = Board.from_fen("7k/5Q2/6K1/8/8/8/8/8 b")
+        self.assertFalse(board.is_checkmate(BLACK))
+        self.assertTrue(board.is_stalemate(BLACK))
+        self.assertFalse(board.is_stalemate(WHITE))
+
+    def test_move_list_is_cached_per_position(self):
+        board = Board()
+        moves = board.move_list(WHITE)
+        self.assertEqual(len(moves), 20)
+        self.assertIs(board.move_list(WHITE), moves)
+        board.move(board.get_piece(6, 4), (4, 4))
+        self.assertIsNot(board.move_list(WHITE), moves)
+
+    def test_pieces_have_no_instance_dict(self):
+        # Las piezas usan __slots__, así que no se les pueden agregar atributos
+        for piece in self.board.pieces(WHITE) + self.board.pieces(BLACK):
+            self.assertFalse(hasattr(piece, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.board.get_piece(7, 0).moved = True
+
+if __name__ == '__main__':
+    unittest.main()
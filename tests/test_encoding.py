@@ -0,0 +1,73 @@
+import unittest
+from board import Board
+from pawn import Pawn
+from king import King
+from piece import WHITE, BLACK
+from encoding import Snapshot, CODES, signed, piece_code, decode_piece
+
+class TestEncoding(unittest.TestCase):
+    def test_codes_are_signed_bytes(self):
+        self.assertEqual(CODES[(WHITE, "p")], 1)
+        self.assertEqual(CODES[(WHITE, "k")], 6)
+        self.assertEqual(signed(CODES[(BLACK, "p")]), -1)
+        self.assertEqual(signed(CODES[(BLACK, "k")]), -6)
+
+    def test_decode_piece(self):
+        piece = decode_piece(piece_code(King(BLACK, (0, 4))), (3, 3))
+        self.assertIsInstance(piece, King)
+        self.assertEqual(piece.color, BLACK)
+        self.assertEqual(piece.position, (3, 3))
+        self.assertIsNone(decode_piece(0, (0, 0)))
+        with self.assertRaises(ValueError):
+            decode_piece(7, (0, 0))
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.board = Board()
+
+    def test_initial_snapshot(self):
+        snapshot = self.board.snapshot()
+        self.assertEqual(len(snapshot.squares), 64)
+        self.assertEqual(snapshot.side, WHITE)
+        # Fila 0: piezas negras (torre = -4), fila 7: piezas blancas (rey = 6 en la columna 4)
+        self.assertEqual(signed(snapshot.squares[0]), -4)
+        self.assertEqual(snapshot.squares[7 * 8 + 4], 6)
+        self.assertEqual(snapshot.squares[4 * 8:5 * 8], bytes(8))
+
+    def test_snapshots_compare_by_value(self):
+        first = self.board.snapshot()
+        self.assertEqual(first, Board().snapshot())
+        self.assertEqual(len({first, Board().snapshot()}), 1)
+        self.board.push((self.board.get_piece(6, 4), (4, 4)))
+        second = self.board.snapshot()
+        self.assertNotEqual(first, second)
+        self.assertEqual(second.side, BLACK)
+        cache = {first: "inicial", second: "e4"}
+        self.assertEqual(cache[Board().snapshot()], "inicial")
+
+    def test_restore(self):
+        initial = self.board.snapshot()
+        key = self.board.zobrist_key
+        self.board.push((self.board.get_piece(6, 4), (4, 4)))
+        self.board.push((self.board.get_piece(1, 3), (3, 3)))
+        self.board.restore(initial)
+        self.assertEqual(self.board.snapshot(), initial)
+        self.assertEqual(self.board.zobrist_key, key)
+        self.assertEqual(self.board.move_stack, [])
+        self.assertIsInstance(self.board.get_piece(6, 4), Pawn)
+        self.assertEqual(self.board.get_piece(6, 4).position, (6, 4))
+
+    def test_from_snapshot(self):
+        self.board.push((self.board.get_piece(6, 4), (4, 4)))
+        copy = Board.from_snapshot(self.board.snapshot())
+        self.assertEqual(copy.zobrist_key, self.board.zobrist_key)
+        self.assertEqual(copy.bitboards, self.board.bitboards)
+        self.assertEqual(copy.side_to_move, BLACK)
+        self.assertEqual(copy.pieces_on_board(), (16, 16))
+
+    def test_invalid_snapshot(self):
+        with self.assertRaises(ValueError):
+            Board.from_snapshot(Snapshot(bytes([9]) + bytes(63), WHITE))
+
+if __name__ == '__main__':
+    unittest.main()
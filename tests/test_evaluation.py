@@ -0,0 +1,62 @@
+import unittest
+from board import Board
+from knight import Knight
+from piece import WHITE, BLACK
+import random
+from evaluation import PIECE_VALUES, KNIGHT_TABLE, piece_score, score_board, evaluate, compute_scores
+
+class TestEvaluation(unittest.TestCase):
+    def test_initial_position_is_balanced(self):
+        self.assertEqual(score_board(Board()), 0)
+        self.assertEqual(evaluate(Board()), 0)
+
+    def test_tables_are_mirrored_for_black(self):
+        # La fila 0 del tablero es la octava fila de las tablas
+        self.assertEqual(piece_score(WHITE, "n", 7, 1), PIECE_VALUES["n"] + KNIGHT_TABLE[7 * 8 + 1])
+        self.assertEqual(piece_score(BLACK, "n", 0, 1), -piece_score(WHITE, "n", 7, 1))
+        self.assertEqual(piece_score(BLACK, "p", 3, 3), -piece_score(WHITE, "p", 4, 3))
+
+    def test_central_knight_is_better(self):
+        board = Board(for_test=True)
+        board.set_piece_on_board(4, 4, Knight(WHITE, (4, 4)))
+        board.set_piece_on_board(0, 0, Knight(BLACK, (0, 0)))
+        self.assertEqual(score_board(board), 340 - 270)
+
+    def test_evaluate_is_from_side_to_move(self):
+        board = Board.from_fen("8/8/8/8/4P3/8/8/8 b")
+        self.assertEqual(score_board(board), 120)
+        self.assertEqual(evaluate(board), -120)
+        board.set_side_to_move(WHITE)
+        self.assertEqual(evaluate(board), 120)
+
+    def test_advancing_pawns_scores(self):
+        board = Board()
+        before = score_board(board)
+        board.push((board.get_piece(6, 4), (4, 4)))
+        # e2-e4: de -20 a +20 en la tabla de peones
+        self.assertEqual(score_board(board) - before, 40)
+
+    def test_scores_are_incremental(self):
+        # Los puntajes acumulados del tablero coinciden con el cálculo completo tras mover y deshacer
+        rng = random.Random(5)
+        board = Board()
+        initial = dict(board.scores)
+        for _ in range(60):
+            moves = list(board.legal_moves(board.side_to_move))
+            board.push(rng.choice(moves))
+            self.assertEqual(board.scores, compute_scores(board))
+        while board.move_stack:
+            board.pop()
+        self.assertEqual(board.scores, initial)
+
+    def test_captures_update_scores(self):
+        board = Board.from_fen("4k3/8/8/3p4/4P3/8/8/4K3 w")
+        white, black = board.scores["white"], board.scores["black"]
+        board.push((board.get_piece(4, 4), (3, 3)))
+        self.assertEqual(board.scores["black"], black - piece_score(WHITE, "p", 4, 3))
+        self.assertGreater(board.scores["white"], white)
+        board.clean_board()
+        self.assertEqual(board.scores, {WHITE: 0, BLACK: 0})
+
+if __name__ == '__main__':
+    unittest.main()
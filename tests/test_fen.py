@@ -0,0 +1,66 @@
+import io
+import os
+import tempfile
+import unittest
+from board import Board
+from chess import Chess
+from king import King
+from piece import WHITE, BLACK
+from fen import START_FEN, parse_fen, format_fen, iter_fens
+
+class TestFen(unittest.TestCase):
+    def test_start_fen_is_initial_setup(self):
+        board = Board.from_fen(START_FEN)
+        self.assertEqual(board.snapshot(), Board().snapshot())
+        self.assertEqual(board.zobrist_key, Board().zobrist_key)
+        self.assertEqual(Board().to_fen(), START_FEN)
+
+    def test_round_trip(self):
+        fen = "4k3/8/8/3p4/4P3/8/8/R3K2R b - - 0 1"
+        board = Board.from_fen(fen)
+        self.assertEqual(board.to_fen(), fen)
+        self.assertEqual(board.side_to_move, BLACK)
+        # La primera fila del FEN es la fila 0 del tablero
+        self.assertIsInstance(board.get_piece(0, 4), King)
+        self.assertEqual(board.get_piece(0, 4).color, BLACK)
+        self.assertEqual(board.get_piece(7, 0).color, WHITE)
+        self.assertEqual(board.pieces_on_board(), (4, 2))
+
+    def test_placement_only(self):
+        snapshot = parse_fen("8/8/8/8/8/8/8/4K3")
+        self.assertEqual(snapshot.side, WHITE)
+        self.assertEqual(format_fen(snapshot), "8/8/8/8/8/8/8/4K3 w - - 0 1")
+
+    def test_invalid_fens(self):
+        for fen in ("", "8/8/8/8/8/8/8", "9/8/8/8/8/8/8/8", "8/8/8/8/8/8/8/7X",
+                    "8/8/8/8/8/8/8/ppppppppp", "8/8/8/8/8/8/8/8 x"):
+            with self.subTest(fen=fen):
+                with self.assertRaises(ValueError):
+                    parse_fen(fen)
+
+    def test_iter_fens_is_lazy(self):
+        stream = io.StringIO(START_FEN + "\n\n# comentario\n8/8/8/8/8/8/8/4K3 b\nmal\n")
+        positions = iter_fens(stream)
+        self.assertEqual(next(positions), Board().snapshot())
+        self.assertEqual(next(positions).side, BLACK)
+        with self.assertRaisesRegex(ValueError, "Line 5"):
+            next(positions)
+
+    def test_load_fens_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "posiciones.fen")
+            with open(path, "w") as f:
+                f.write(START_FEN + "\n" + "4k3/8/8/8/8/8/8/4K3 b\n")
+            boards = list(Board.load_fens(path))
+        self.assertEqual(len(boards), 2)
+        self.assertEqual(boards[1].pieces_on_board(), (1, 1))
+
+    def test_chess_from_fen_sets_turn(self):
+        chess = Chess.from_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b - - 0 1")
+        self.assertEqual(chess.turn, "BLACK")
+        self.assertTrue(chess.move("E2", "E4"))
+        self.assertEqual(chess.turn, "WHITE")
+        self.assertEqual(chess.to_fen(), "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w - - 0 1")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from board import Board
+from piece import WHITE, BLACK
+from bitboard import ALL_SQUARES, square_bit, square_index
+from legality import (
+    king_square, find_checkers, find_pins, find_king_danger, find_evasions, legal_destinations
+)
+
+class TestLegality(unittest.TestCase):
+    def test_king_square(self):
+        board = Board()
+        self.assertEqual(king_square(board, WHITE), square_index(7, 4))
+        self.assertIsNone(king_square(Board(for_test=True), BLACK))
+
+    def test_double_check_only_king_moves(self):
+        # Torre en la columna y caballo en d6 dan jaque doble al rey negro
+        board = Board.from_fen("4k3/8/3N4/8/8/8/8/4R2K b")
+        self.assertEqual(find_checkers(board, BLACK), square_bit(7, 4) | square_bit(2, 3))
+        self.assertEqual(find_evasions(board, BLACK), 0)
+        # El rey no puede retroceder sobre la línea de la torre
+        self.assertTrue(find_king_danger(board, BLACK) & square_bit(0, 4))
+
+    def test_pinned_piece_destinations(self):
+        board = Board.from_fen("4k3/4r3/8/8/8/8/8/4R2K b")
+        rook = board.get_piece(1, 4)
+        line = sum(square_bit(row, 4) for row in range(1, 8))
+        self.assertEqual(find_pins(board, BLACK), {square_index(1, 4): line})
+        self.assertEqual(legal_destinations(board, rook), line)
+
+    def test_results_are_cached_on_the_board(self):
+        board = Board()
+        self.assertEqual(board.checkers(WHITE), 0)
+        self.assertIn(("checkers", WHITE), board.cache)
+        self.assertEqual(legal_destinations(board, board.get_piece(6, 0)), ALL_SQUARES)
+        board.set_piece_on_board(6, 0, None)
+        self.assertEqual(board.cache, {})
+
+if __name__ == '__main__':
+    unittest.main()
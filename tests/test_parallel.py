@@ -0,0 +1,37 @@
+import unittest
+from chess import Chess
+from board import Board
+from parallel import ParallelSearch, parallel_search
+
+class TestParallelSearch(unittest.TestCase):
+    def test_parallel_search_finds_legal_move(self):
+        chess = Chess()
+        result = parallel_search(chess, workers=2, depth=2, size_mb=1)
+        legal = {(piece.position, destination) for piece, destination in chess.board.legal_moves("white")}
+        self.assertIn(result.move, legal)
+        self.assertEqual(result.depth, 2)
+        self.assertGreater(result.nodes, 0)
+        # La búsqueda en otros procesos no modifica el tablero local
+        self.assertEqual(chess.board.zobrist_key, Board().zobrist_key)
+
+    def test_depth_limit_is_kept(self):
+        # Los ayudantes impares buscan un ply más, pero el resultado no pasa del límite
+        with ParallelSearch(workers=4, size_mb=1) as engine:
+            for depth in (1, 2):
+                for _ in range(3):
+                    self.assertEqual(engine.search(Chess(), depth=depth).depth, depth)
+
+    def test_pool_is_reused_between_searches(self):
+        with ParallelSearch(workers=2, size_mb=1) as engine:
+            first = engine.search(Chess(), depth=2)
+            second = engine.search(Chess(), time_ms=100)
+        self.assertIsNotNone(first.move)
+        self.assertIsNotNone(second.move)
+
+    def test_requires_limit(self):
+        with ParallelSearch(workers=1, size_mb=1) as engine:
+            with self.assertRaises(ValueError):
+                engine.search(Chess())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from board import Board
+from rook import Rook
+from king import King
+from piece import WHITE, BLACK
+from perft import perft, divide, run_perft
+
+class TestPerft(unittest.TestCase):
+    def test_initial_position_counts(self):
+        # Conteos conocidos desde la posición inicial
+        board = Board()
+        for depth, nodes in ((0, 1), (1, 20), (2, 400), (3, 8902), (4, 197281)):
+            with self.subTest(depth=depth):
+                self.assertEqual(perft(board, depth), nodes)
+
+    def test_perft_leaves_board_unchanged(self):
+        board = Board()
+        key = board.zobrist_key
+        perft(board, 3)
+        self.assertEqual(board.zobrist_key, key)
+        self.assertEqual(board.move_stack, [])
+
+    def test_divide_sums_to_perft(self):
+        board = Board()
+        counts = divide(board, 2)
+        self.assertEqual(len(counts), 20)
+        self.assertEqual(counts["E7E5"], 20)
+        self.assertEqual(sum(counts.values()), 400)
+
+    def test_supplied_position(self):
+        # Torre y rey contra rey
+        board = Board(for_test=True)
+        board.set_piece_on_board(7, 0, Rook(WHITE, (7, 0)))
+        board.set_piece_on_board(7, 4, King(WHITE, (7, 4)))
+        board.set_piece_on_board(0, 4, King(BLACK, (0, 4)))
+        self.assertEqual(perft(board, 1), 10 + 5)
+
+    def test_run_perft_reports_speed(self):
+        result = run_perft(2, split=True)
+        self.assertEqual(result["nodes"], 400)
+        self.assertGreater(result["nps"], 0)
+        self.assertEqual(sum(result["divide"].values()), 400)
+
+if __name__ == '__main__':
+    unittest.main()
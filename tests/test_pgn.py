@@ -0,0 +1,101 @@
+import io
+import unittest
+from board import Board
+from knight import Knight
+from pawn import Pawn
+from piece import WHITE, BLACK
+from pgn import (
+    iter_games, resolve_san, format_san, replay_game, replay_games,
+    parse_square, format_square
+)
+
+PGN = """[Event "Partida de prueba"]
+[White "Blancas"]
+[Black "Negras"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 {desarrolla el caballo} Nc6 3. Bb5 a6 (3... Nf6 4. d3)
+4. Bxc6 dxc6 $1 5. Nxe5 Qd4 ; comentario hasta el final de la línea
+6. Nf3 Qxe4+ 7. Qe2 Qxe2+ 8. Kxe2 1-0
+
+[Event "Enroque"]
+[Result "*"]
+
+1. e4 e5 2. Nf3 Nc6 3. Bc4 Bc5 4. O-O *
+"""
+
+class TestPgnReader(unittest.TestCase):
+    def test_iter_games(self):
+        games = list(iter_games(io.StringIO(PGN)))
+        self.assertEqual(len(games), 2)
+        first = games[0]
+        self.assertEqual(first.tags["White"], "Blancas")
+        self.assertEqual(first.result, "1-0")
+        # Sin comentarios, variantes, números de jugada ni NAGs
+        self.assertEqual(first.moves[:6], ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6"])
+        self.assertEqual(len(first.moves), 15)
+        self.assertEqual(games[1].moves[-1], "O-O")
+
+    def test_game_without_result_ends_at_next_tags(self):
+        text = '[Event "a"]\n\n1. e4 e5\n\n[Event "b"]\n\n1. d4 *\n'
+        games = list(iter_games(io.StringIO(text)))
+        self.assertEqual([game.moves for game in games], [["e4", "e5"], ["d4"]])
+        self.assertIsNone(games[0].result)
+
+    def test_squares(self):
+        self.assertEqual(parse_square("e4"), (4, 4))
+        self.assertEqual(parse_square("a8"), (0, 0))
+        self.assertEqual(format_square((7, 7)), "h1")
+
+class TestSan(unittest.TestCase):
+    def test_resolve_pawn_and_knight(self):
+        board = Board()
+        piece, destination = resolve_san(board, "e4", WHITE)
+        self.assertIsInstance(piece, Pawn)
+        self.assertEqual((piece.position, destination), ((6, 4), (4, 4)))
+        piece, destination = resolve_san(board, "Nf6", BLACK)
+        self.assertIsInstance(piece, Knight)
+        self.assertEqual(piece.position, (0, 6))
+
+    def test_disambiguation(self):
+        board = Board(for_test=True)
+        board.set_piece_on_board(7, 1, Knight(WHITE, (7, 1)))
+        board.set_piece_on_board(7, 5, Knight(WHITE, (7, 5)))
+        with self.assertRaises(ValueError):
+            resolve_san(board, "Nd2", WHITE)
+        piece, _ = resolve_san(board, "Nfd2", WHITE)
+        self.assertEqual(piece.position, (7, 5))
+        self.assertEqual(format_san(board, piece, (6, 3)), "Nfd2")
+
+    def test_unsupported_and_invalid(self):
+        board = Board()
+        for san in ("O-O", "e8=Q", "Zz9", "e5"):
+            with self.subTest(san=san):
+                with self.assertRaises(ValueError):
+                    resolve_san(board, san, WHITE)
+
+    def test_format_round_trip(self):
+        board = Board()
+        for piece, destination in board.legal_moves(WHITE):
+            san = format_san(board, piece, destination)
+            self.assertEqual(resolve_san(board, san, WHITE), (piece, destination))
+
+class TestReplay(unittest.TestCase):
+    def test_replay_games(self):
+        results = list(replay_games(io.StringIO(PGN)))
+        game, chess, error = results[0]
+        self.assertIsNone(error)
+        self.assertEqual(chess.turn, "BLACK")
+        self.assertEqual(chess.board.get_piece(6, 4).symbol, "k")
+        _, chess, error = results[1]
+        self.assertIsNone(chess)
+        self.assertIn("4. O-O", error)
+        self.assertIn("Castling", error)
+
+    def test_replay_game_reports_bad_move(self):
+        game = next(iter_games(io.StringIO("1. e4 e5 2. Nc3 Nf3 *")))
+        with self.assertRaisesRegex(ValueError, r"2\.\.\. Nf3"):
+            replay_game(game)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from board import Board
+from fen import START_FEN
+from piece import WHITE, BLACK
+from posdb import (
+    PositionDB, PositionWriter, RECORD, HEADER,
+    pack_squares, unpack_squares, write_positions, build_index
+)
+
+POSITIONS = (
+    START_FEN,
+    "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b",
+    "4k3/8/8/3p4/4P3/8/8/R3K2R w",
+    START_FEN,
+)
+
+class TestPacking(unittest.TestCase):
+    def test_record_size(self):
+        self.assertEqual(RECORD.size, 56)
+        self.assertEqual(HEADER.size, 16)
+
+    def test_pack_round_trip(self):
+        squares = Board().snapshot().squares
+        packed = pack_squares(squares)
+        self.assertEqual(len(packed), 32)
+        self.assertEqual(unpack_squares(packed), squares)
+
+class TestPositionDB(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "posiciones.pdb")
+        self.index_path = os.path.join(self.directory.name, "posiciones.idx")
+        self.boards = [Board.from_fen(fen) for fen in POSITIONS]
+        write_positions(self.path, self.boards, metas=range(100, 104))
+        build_index(self.path, self.index_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_file_size(self):
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 4 * RECORD.size)
+
+    def test_read_records(self):
+        with PositionDB(self.path) as db:
+            self.assertEqual(len(db), 4)
+            key, _, side, meta = db.record(1)
+            self.assertEqual(key, self.boards[1].zobrist_key)
+            self.assertEqual(side, BLACK)
+            self.assertEqual(meta, 101)
+            self.assertEqual(db.meta(-1), 103)
+            board = db.board(2)
+            self.assertEqual(board.to_fen(), "4k3/8/8/3p4/4P3/8/8/R3K2R w - - 0 1")
+            self.assertEqual(board.zobrist_key, self.boards[2].zobrist_key)
+            with self.assertRaises(IndexError):
+                db.record(4)
+
+    def test_scan(self):
+        with PositionDB(self.path) as db:
+            self.assertEqual(db.keys(), [board.zobrist_key for board in self.boards])
+            self.assertEqual([side for _, _, side, _ in db], [WHITE, BLACK, WHITE, WHITE])
+
+    def test_index_lookup(self):
+        with PositionDB(self.path, self.index_path) as db:
+            self.assertEqual(db.lookup(Board().zobrist_key), [0, 3])
+            self.assertEqual(db.lookup(self.boards[2].zobrist_key), [2])
+            self.assertEqual(db.lookup(12345), [])
+            found = db.find(self.boards[1].zobrist_key)
+            self.assertEqual([board.snapshot() for board in found], [self.boards[1].snapshot()])
+
+    def test_lookup_needs_index(self):
+        with PositionDB(self.path) as db:
+            with self.assertRaises(ValueError):
+                db.lookup(Board().zobrist_key)
+
+    def test_writer_returns_record_numbers(self):
+        path = os.path.join(self.directory.name, "otra.pdb")
+        with PositionWriter(path) as writer:
+            self.assertEqual(writer.add(Board()), 0)
+            self.assertEqual(writer.add(Board(), meta=7), 1)
+        with PositionDB(path) as db:
+            self.assertEqual(db.meta(1), 7)
+
+    def test_rejects_other_files(self):
+        path = os.path.join(self.directory.name, "texto.pdb")
+        with open(path, "w") as f:
+            f.write(START_FEN)
+        with self.assertRaises(ValueError):
+            PositionDB(path)
+
+    def test_rejects_empty_file(self):
+        path = os.path.join(self.directory.name, "vacio.pdb")
+        open(path, "wb").close()
+        with self.assertRaisesRegex(ValueError, "is not a position database"):
+            PositionDB(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import time
+import unittest
+from chess import Chess
+from board import Board
+from rook import Rook
+from queen import Queen
+from king import King
+from piece import WHITE, BLACK
+from search import search, Searcher, evaluate, MATE
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        self.chess = Chess()
+        self.chess.board.clean_board()
+        board = self.chess.board
+        board.set_piece_on_board(7, 4, King(WHITE, (7, 4)))
+        board.set_piece_on_board(0, 4, King(BLACK, (0, 4)))
+
+    def test_evaluate_material(self):
+        self.assertEqual(evaluate(Board()), 0)
+        self.chess.board.set_piece_on_board(4, 4, Queen(BLACK, (4, 4)))
+        # Dama (900) más 5 por la casilla central; los reyes en su casilla inicial suman 0
+        self.assertEqual(evaluate(self.chess.board), -905)
+
+    def test_captures_hanging_queen(self):
+        # La torre blanca puede capturar la dama negra sin defensa
+        board = self.chess.board
+        board.set_piece_on_board(4, 0, Rook(WHITE, (4, 0)))
+        board.set_piece_on_board(4, 6, Queen(BLACK, (4, 6)))
+        result = search(self.chess, depth=2)
+        self.assertEqual(result.move, ((4, 0), (4, 6)))
+        self.assertEqual(result.depth, 2)
+        self.assertGreater(result.nodes, 0)
+
+    def test_search_leaves_board_unchanged(self):
+        chess = Chess()
+        key = chess.board.zobrist_key
+        search(chess, depth=3)
+        self.assertEqual(chess.board.zobrist_key, key)
+        self.assertEqual(chess.board.move_stack, [])
+
+    def test_time_limit(self):
+        chess = Chess()
+        start = time.perf_counter()
+        result = search(chess, time_ms=100)
+        elapsed = time.perf_counter() - start
+        self.assertIsNotNone(result.move)
+        self.assertLess(elapsed, 1.0)
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertGreater(result.nps, 0)
+        self.assertEqual(chess.board.move_stack, [])
+
+    def test_time_out_before_first_move_still_plays(self):
+        # Posición con muchas capturas: con 1 ms no termina ni la primera jugada de profundidad 1
+        chess = Chess.from_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w")
+        result = search(chess, time_ms=1)
+        legal = {(piece.position, destination) for piece, destination in chess.board.legal_moves(WHITE)}
+        self.assertIn(result.move, legal)
+
+    def test_fallback_move_orders_captures_first(self):
+        # Sin nada buscado se elige la mejor captura por MVV/LVA: alfil por alfil en a6
+        chess = Chess.from_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w")
+        self.assertEqual(Searcher(chess.board).fallback_move(), ((6, 4), (2, 0)))
+
+    def test_search_for_black(self):
+        board = self.chess.board
+        board.set_piece_on_board(4, 0, Rook(BLACK, (4, 0)))
+        board.set_piece_on_board(4, 6, Queen(WHITE, (4, 6)))
+        self.chess.move("E8", "E7")
+        result = search(self.chess, depth=2)
+        self.assertEqual(result.move, ((4, 0), (4, 6)))
+
+    def test_finds_mate_in_one(self):
+        chess = Chess.from_fen("7k/8/6K1/8/8/8/8/R7 w")
+        result = search(chess, depth=4)
+        self.assertEqual(result.move, ((7, 0), (0, 0)))
+        self.assertEqual(result.score, MATE - 1)
+        self.assertEqual(result.mate, 1)
+        # Con el mate encontrado no hace falta seguir profundizando
+        self.assertLess(result.depth, 4)
+
+    def test_mated_and_stalemated_roots(self):
+        result = search(Chess.from_fen("R6k/8/6K1/8/8/8/8/8 b"), depth=2)
+        self.assertIsNone(result.move)
+        self.assertEqual(result.score, -MATE)
+        result = search(Chess.from_fen("7k/5Q2/6K1/8/8/8/8/8 b"), depth=2)
+        self.assertIsNone(result.move)
+        self.assertEqual(result.score, 0)
+
+    def test_game_ends_in_checkmate_or_stalemate(self):
+        chess = Chess.from_fen("7k/8/6K1/8/8/8/8/R7 w")
+        self.assertEqual(chess.move("A8", "A1"), "White wins")
+        chess = Chess.from_fen("7k/8/6K1/8/5Q2/8/8/8 w")
+        self.assertEqual(chess.move("F5", "F2"), "Draw")
+
+    def test_requires_limit(self):
+        with self.assertRaises(ValueError):
+            Searcher(Board()).search()
+
+if __name__ == '__main__':
+    unittest.main()
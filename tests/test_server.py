@@ -0,0 +1,151 @@
+import asyncio
+import unittest
+from server import ChessServer, GameSession, MAX_LINE
+from sessions import SessionStore, GAME_BYTES
+from fen import START_FEN
+
+class TestGameSession(unittest.IsolatedAsyncioTestCase):
+    async def test_commands(self):
+        session = GameSession()
+        self.assertEqual(await session.execute("TURN"), "OK WHITE")
+        self.assertEqual(await session.execute("move e7 e5"), "OK")
+        self.assertEqual(await session.execute("TURN"), "OK BLACK")
+        self.assertEqual(await session.execute("BOARD"),
+                         "OK rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b - - 0 1")
+
+    async def test_errors(self):
+        session = GameSession()
+        self.assertEqual(await session.execute("JUMP"), "ERROR Unknown command: JUMP")
+        self.assertEqual(await session.execute("MOVE E7"), "ERROR MOVE takes 2 arguments")
+        self.assertEqual(await session.execute(""), "ERROR Empty command")
+        # Los errores de Chess.move llegan como texto y el juego sigue
+        self.assertTrue((await session.execute("MOVE E2 E4")).startswith("ERROR"))
+        self.assertEqual(await session.execute("TURN"), "OK WHITE")
+
+    async def test_draw_and_resign(self):
+        session = GameSession()
+        self.assertTrue((await session.execute("ACCEPT")).startswith("ERROR"))
+        self.assertEqual(await session.execute("DRAW"), "OK")
+        self.assertEqual(await session.execute("REJECT"), "OK")
+        self.assertEqual(await session.execute("RESIGN"), "OK Black wins")
+        self.assertEqual(await session.execute("MOVE E7 E5"), "ERROR The game is over: Black wins")
+        self.assertEqual(await session.execute("NEW"), "OK")
+        self.assertEqual(await session.execute("DRAW"), "OK")
+        self.assertEqual(await session.execute("ACCEPT"), "OK Draw")
+
+    async def test_computer_move(self):
+        session = GameSession(engine_time_ms=50)
+        reply = (await session.execute("COMPUTER")).split()
+        self.assertEqual(reply[0], "OK")
+        self.assertEqual(len(reply), 3)
+        self.assertEqual(await session.execute("TURN"), "OK BLACK")
+
+class TestChessServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = ChessServer(port=0, engine_time_ms=50)
+        self.port = await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def connect(self):
+        return await asyncio.open_connection("127.0.0.1", self.port)
+
+    async def close(self, writer):
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_pipelined_commands(self):
+        reader, writer = await self.connect()
+        # Todos los comandos se envían antes de leer la primera respuesta
+        writer.write(b"MOVE E7 E5\nMOVE B2 B4\nTURN\nBOARD\nQUIT\n")
+        await writer.drain()
+        replies = [(await reader.readline()).decode().strip() for _ in range(5)]
+        self.assertEqual(replies[:3], ["OK", "OK", "OK WHITE"])
+        self.assertEqual(replies[3], "OK rnbqkbnr/p1pppppp/8/1p6/4P3/8/PPPP1PPP/RNBQKBNR w - - 0 1")
+        self.assertEqual(replies[4], "OK")
+        # Después de QUIT el servidor cierra la conexión
+        self.assertEqual(await reader.read(), b"")
+        await self.close(writer)
+
+    async def test_sessions_are_independent(self):
+        first_reader, first_writer = await self.connect()
+        second_reader, second_writer = await self.connect()
+        first_writer.write(b"MOVE E7 E5\nTURN\n")
+        second_writer.write(b"TURN\nBOARD\n")
+        self.assertEqual(await first_reader.readline(), b"OK\n")
+        self.assertEqual(await first_reader.readline(), b"OK BLACK\n")
+        self.assertEqual(await second_reader.readline(), b"OK WHITE\n")
+        self.assertEqual(await second_reader.readline(), f"OK {START_FEN}\n".encode())
+        await self.close(first_writer)
+        await self.close(second_writer)
+
+    async def test_many_concurrent_games(self):
+        async def play():
+            reader, writer = await self.connect()
+            writer.write(b"MOVE E7 E5\nMOVE E2 E4\nTURN\n")
+            replies = [await reader.readline() for _ in range(3)]
+            await self.close(writer)
+            return replies
+
+        clients = 200
+        results = await asyncio.gather(*(play() for _ in range(clients)))
+        self.assertEqual(results, [[b"OK\n", b"OK\n", b"OK WHITE\n"]] * clients)
+
+    async def test_computer_does_not_block_other_games(self):
+        thinking_reader, thinking_writer = await self.connect()
+        other_reader, other_writer = await self.connect()
+        thinking_writer.write(b"COMPUTER\n")
+        await asyncio.sleep(0.01)
+        other_writer.write(b"TURN\n")
+        self.assertEqual(await other_reader.readline(), b"OK WHITE\n")
+        self.assertTrue((await thinking_reader.readline()).startswith(b"OK "))
+        await self.close(thinking_writer)
+        await self.close(other_writer)
+
+    async def test_line_too_long(self):
+        reader, writer = await self.connect()
+        writer.write(b"M" * (MAX_LINE + 1) + b"\n")
+        self.assertEqual(await reader.readline(), b"ERROR Line too long\n")
+        self.assertEqual(await reader.read(), b"")
+        await self.close(writer)
+
+    async def test_disconnect_removes_session(self):
+        reader, writer = await self.connect()
+        writer.write(b"TURN\n")
+        await reader.readline()
+        self.assertEqual(len(self.server.clients), 1)
+        await self.close(writer)
+        for _ in range(100):
+            if not self.server.clients:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(self.server.clients, {})
+
+    async def test_idle_games_are_packed(self):
+        self.server.store = SessionStore(memory_budget=GAME_BYTES)
+        first_reader, first_writer = await self.connect()
+        second_reader, second_writer = await self.connect()
+        first_writer.write(b"MOVE E7 E5\n")
+        self.assertEqual(await first_reader.readline(), b"OK\n")
+        second_writer.write(b"TURN\n")
+        self.assertEqual(await second_reader.readline(), b"OK WHITE\n")
+        # Sólo cabe una partida viva: la primera se empaquetó y revive con su siguiente comando
+        self.assertEqual(len(self.server.store.packed), 1)
+        first_writer.write(b"MOVE B2 B4\nTURN\n")
+        self.assertEqual(await first_reader.readline(), b"OK\n")
+        self.assertEqual(await first_reader.readline(), b"OK WHITE\n")
+        await self.close(first_writer)
+        await self.close(second_writer)
+
+    async def test_close_ends_open_connections(self):
+        reader, writer = await self.connect()
+        writer.write(b"TURN\n")
+        await reader.readline()
+        await self.server.close()
+        self.assertEqual(self.server.clients, {})
+        self.assertEqual(await reader.read(), b"")
+        await self.close(writer)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from chess import Chess
+from sessions import SessionStore, pack_game, unpack_game, GAME_BYTES, HEADER
+
+class TestPacking(unittest.TestCase):
+    def test_history_is_recorded(self):
+        chess = Chess()
+        chess.move("e7", "e5")
+        chess.move("B2", "B4")
+        self.assertEqual(chess.history, [("E7", "E5"), ("B2", "B4")])
+
+    def test_pack_round_trip(self):
+        chess = Chess()
+        chess.move("E7", "E5")
+        chess.move("B2", "B4")
+        chess.move("D8", "H4")
+        record = pack_game(chess)
+        # 35 bytes de cabecera y 2 por jugada
+        self.assertEqual(len(record), HEADER.size + 2 * 3)
+        revived = unpack_game(record)
+        self.assertEqual(revived.turn, "BLACK")
+        self.assertEqual(revived.history, chess.history)
+        self.assertEqual(revived.to_fen(), chess.to_fen())
+        self.assertEqual(revived.board.zobrist_key, chess.board.zobrist_key)
+        # La partida revivida sigue jugando
+        self.assertTrue(revived.move("B4", "B5"))
+
+    def test_rejects_malformed_records(self):
+        record = pack_game(Chess())
+        with self.assertRaises(ValueError):
+            unpack_game(record[:10])
+        with self.assertRaises(ValueError):
+            unpack_game(record + b"\x00")
+
+class TestSessionStore(unittest.TestCase):
+    def test_lru_eviction(self):
+        store = SessionStore(memory_budget=2 * GAME_BYTES)
+        first, second, third = store.create(), store.create(), store.create()
+        # Sólo entran dos partidas vivas: la menos usada se empaqueta
+        self.assertEqual(list(store.live), [second, third])
+        self.assertEqual(list(store.packed), [first])
+        store.get(second)
+        store.get(first)
+        self.assertEqual(list(store.live), [second, first])
+        self.assertEqual(list(store.packed), [third])
+        self.assertEqual(len(store), 3)
+
+    def test_move_revives_game(self):
+        store = SessionStore(memory_budget=GAME_BYTES)
+        game = store.create()
+        self.assertTrue(store.move(game, "E7", "E5"))
+        store.create()
+        self.assertIn(game, store.packed)
+        self.assertTrue(store.move(game, "B2", "B4"))
+        chess = store.get(game)
+        self.assertEqual(chess.history, [("E7", "E5"), ("B2", "B4")])
+        self.assertEqual(chess.turn, "WHITE")
+
+    def test_held_game_stays_live(self):
+        store = SessionStore(memory_budget=GAME_BYTES)
+        game = store.create()
+        with store.hold(game) as chess:
+            other = store.create()
+            self.assertIs(store.get(game), chess)
+            self.assertEqual(set(store.live), {game, other})
+        store.get(other)
+        self.assertIn(game, store.packed)
+
+    def test_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = SessionStore(memory_budget=GAME_BYTES, packed_budget=HEADER.size, spill_dir=directory)
+            games = [store.create() for _ in range(4)]
+            self.assertEqual(store.stats(), {"live": 1, "packed": 1, "spilled": 2,
+                                             "packed_bytes": HEADER.size})
+            self.assertEqual(sorted(os.listdir(directory)), ["0.game", "1.game"])
+            # Revivir una partida del disco borra su archivo
+            self.assertTrue(store.move(games[0], "E7", "E5"))
+            self.assertNotIn("0.game", os.listdir(directory))
+            store.remove(games[1])
+            store.close()
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_unknown_game(self):
+        store = SessionStore()
+        with self.assertRaises(KeyError):
+            store.get(7)
+        with self.assertRaises(KeyError):
+            store.remove(7)
+
+    def test_spill_needs_directory(self):
+        with self.assertRaises(ValueError):
+            SessionStore(packed_budget=0)
+
+if __name__ == '__main__':
+    unittest.main()
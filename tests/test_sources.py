@@ -0,0 +1,35 @@
+import io
+import os
+import tempfile
+import unittest
+from sources import iter_lines, source_name
+
+class TestSources(unittest.TestCase):
+    def test_stream(self):
+        stream = io.StringIO("uno\ndos\n")
+        self.assertEqual(list(iter_lines(stream)), ["uno\n", "dos\n"])
+        self.assertEqual(source_name(stream), "stream")
+
+    def test_path_is_read_lazily_and_closed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "partidas.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("uno\ndos\n")
+            lines = iter_lines(path)
+            # El archivo se abre recién al pedir la primera línea
+            self.assertEqual(next(lines), "uno\n")
+            self.assertEqual(list(lines), ["dos\n"])
+            self.assertEqual(source_name(path), "partidas.txt")
+        self.assertEqual(source_name("-"), "stdin")
+
+    def test_undecodable_bytes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "roto.pgn")
+            with open(path, "wb") as f:
+                f.write(b"e4 \xff\n")
+            with self.assertRaises(UnicodeDecodeError):
+                list(iter_lines(path))
+            self.assertEqual(list(iter_lines(path, errors="replace")), ["e4 �\n"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from tt import (
+    TranspositionTable, EXACT, LOWER, UPPER,
+    ALWAYS_REPLACE, DEPTH_PREFERRED, TWO_TIER, ENTRY_SIZE
+)
+from board import Board
+
+class TestTranspositionTable(unittest.TestCase):
+    def setUp(self):
+        self.table = TranspositionTable(size_mb=1)
+        self.key = Board().zobrist_key
+
+    def test_size_follows_memory_cap(self):
+        self.assertEqual(self.table.size, 1024 * 1024 // ENTRY_SIZE)
+        self.assertEqual(len(self.table.table) * self.table.table.itemsize, 1024 * 1024)
+
+    def test_store_and_probe(self):
+        move = ((6, 4), (4, 4))
+        self.assertIsNone(self.table.probe(self.key))
+        self.assertTrue(self.table.store(self.key, 5, -123, LOWER, move))
+        self.assertEqual(self.table.probe(self.key), (-123, 5, LOWER, move))
+
+    def test_score_is_clamped(self):
+        self.table.store(self.key, 1, 100000, EXACT)
+        self.assertEqual(self.table.probe(self.key), (32767, 1, EXACT, None))
+
+    def test_colliding_key_is_not_confused(self):
+        # Misma casilla de la tabla pero distinta verificación de clave
+        other = self.key ^ (1 << 60)
+        self.table.store(self.key, 3, 10, EXACT)
+        self.assertIsNone(self.table.probe(other))
+        self.assertEqual(self.table.collisions, 1)
+
+    def test_depth_preferred_keeps_deeper_entry(self):
+        other = self.key ^ (1 << 60)
+        self.table.store(self.key, 6, 10, EXACT)
+        self.assertFalse(self.table.store(other, 2, 20, EXACT))
+        self.assertEqual(self.table.probe(self.key)[1], 6)
+        self.assertTrue(self.table.store(other, 7, 20, UPPER))
+        self.assertIsNone(self.table.probe(self.key))
+
+    def test_always_replace(self):
+        table = TranspositionTable(size_mb=1, policy=ALWAYS_REPLACE)
+        other = self.key ^ (1 << 60)
+        table.store(self.key, 6, 10, EXACT)
+        self.assertTrue(table.store(other, 1, 20, EXACT))
+        self.assertIsNone(table.probe(self.key))
+        self.assertEqual(table.overwrites, 1)
+
+    def test_two_tier_keeps_both(self):
+        table = TranspositionTable(size_mb=1, policy=TWO_TIER)
+        other = self.key ^ (1 << 60)
+        table.store(self.key, 6, 10, EXACT)
+        table.store(other, 1, 20, LOWER)
+        self.assertEqual(table.probe(self.key)[0], 10)
+        self.assertEqual(table.probe(other)[0], 20)
+
+    def test_stats(self):
+        self.table.store(self.key, 1, 0, EXACT)
+        self.table.probe(self.key)
+        self.table.probe(self.key ^ 1)
+        stats = self.table.stats()
+        self.assertEqual(stats["probes"], 2)
+        self.assertEqual(stats["hits"], 1)
+        self.assertAlmostEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["stores"], 1)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            TranspositionTable(size_mb=1, policy="random")
+
+if __name__ == '__main__':
+    unittest.main()
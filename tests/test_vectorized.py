@@ -0,0 +1,104 @@
+import random
+import unittest
+import numpy as np
+from board import Board
+from moves import ChessInvalid
+from evaluation import score_board
+from vectorized import encode_boards, validate_moves, evaluate_batch
+
+def square(name):
+    # Casillas como las lee Chess.translate_input: 'A2' -> fila 1, columna 0
+    return (int(name[1]) - 1) * 8 + "ABCDEFGH".index(name[0])
+
+class TestValidateMoves(unittest.TestCase):
+    def test_encode_boards(self):
+        boards = encode_boards([Board(), Board().snapshot()])
+        self.assertEqual(boards.shape, (2, 64))
+        self.assertEqual(boards.dtype, np.int8)
+        self.assertEqual(boards[0, 0], -4)
+        self.assertEqual(boards[1, 60], 6)
+
+    def test_initial_position(self):
+        moves = [("E7", "E5", True), ("E7", "E6", True), ("E7", "E4", False),
+                 ("B8", "C6", True), ("B8", "D7", False), ("A8", "A6", False),
+                 ("D8", "D4", False), ("E5", "E4", False), ("E2", "E4", True)]
+        boards = encode_boards([Board()] * len(moves))
+        origins = [square(origin) for origin, _, _ in moves]
+        destinations = [square(destination) for _, destination, _ in moves]
+        result = validate_moves(boards, origins, destinations)
+        self.assertEqual(result.tolist(), [expected for _, _, expected in moves])
+
+    def test_sides(self):
+        boards = encode_boards([Board(), Board()])
+        result = validate_moves(boards, [square("E7"), square("E2")], [square("E5"), square("E4")], sides=[1, 1])
+        self.assertEqual(result.tolist(), [True, False])
+
+    def test_king_cannot_be_captured(self):
+        board = Board.from_fen("4k3/8/8/8/8/8/8/4R2K w")
+        result = validate_moves(encode_boards([board, board]), [60, 60], [4, 12])
+        self.assertEqual(result.tolist(), [False, True])
+
+    def test_king_safety(self):
+        # Alfil clavado, rey que entraría en jaque y torre que tapa el jaque
+        pinned = Board.from_fen("4k3/4b3/8/8/8/8/8/4R2K b")
+        check = Board.from_fen("4k3/8/2b5/8/8/8/8/4R2K b")
+        boards = encode_boards([pinned, check, check, check])
+        result = validate_moves(boards, [12, 4, 4, 18], [19, 12, 3, 36])
+        self.assertEqual(result.tolist(), [False, False, True, True])
+
+    def test_matches_validate_move(self):
+        rng = random.Random(7)
+        boards = []
+        for _ in range(5):
+            board = Board()
+            for _ in range(rng.randrange(30)):
+                board.push(rng.choice(list(board.legal_moves(board.side_to_move))))
+            boards.append(board)
+
+        indexes, origins, destinations, expected = [], [], [], []
+        for index, board in enumerate(boards):
+            for origin in range(64):
+                piece = board.get_piece(*divmod(origin, 8))
+                for destination in range(64):
+                    try:
+                        if piece is None:
+                            raise ChessInvalid()
+                        board.validate_move(piece, divmod(destination, 8))
+                        valid = True
+                    except ChessInvalid:
+                        valid = False
+                    indexes.append(index)
+                    origins.append(origin)
+                    destinations.append(destination)
+                    expected.append(valid)
+        result = validate_moves(encode_boards(boards)[indexes], origins, destinations)
+        self.assertEqual(result.tolist(), expected)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            validate_moves(np.zeros((2, 64)), [0], [1])
+        with self.assertRaises(ValueError):
+            validate_moves(np.zeros((1, 64)), [0], [64])
+
+class TestEvaluateBatch(unittest.TestCase):
+    def test_matches_score_board(self):
+        rng = random.Random(11)
+        board = Board()
+        boards = []
+        for _ in range(40):
+            board.push(rng.choice(list(board.legal_moves(board.side_to_move))))
+            boards.append(Board.from_snapshot(board.snapshot()))
+        scores = evaluate_batch(encode_boards(boards))
+        self.assertEqual(scores.tolist(), [score_board(board) for board in boards])
+
+    def test_sides(self):
+        board = Board.from_fen("8/8/8/8/4P3/8/8/8 b")
+        scores = evaluate_batch(encode_boards([board, board]), sides=[1, -1])
+        self.assertEqual(scores.tolist(), [120, -120])
+
+    def test_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            evaluate_batch(np.zeros((3, 63)))
+
+if __name__ == '__main__':
+    unittest.main()
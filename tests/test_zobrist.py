@@ -0,0 +1,74 @@
+import random
+import unittest
+from board import Board
+from chess import Chess
+from rook import Rook
+from piece import WHITE, BLACK
+from zobrist import hash_board, SIDE_KEY
+
+class TestZobrist(unittest.TestCase):
+    def setUp(self):
+        self.board = Board()
+
+    def test_initial_key_matches_full_hash(self):
+        self.assertNotEqual(self.board.zobrist_key, 0)
+        self.assertEqual(self.board.zobrist_key, hash_board(self.board))
+        self.assertEqual(Board(for_test=True).zobrist_key, 0)
+
+    def test_incremental_key_during_random_game(self):
+        # Después de cada jugada la clave incremental coincide con la calculada desde cero
+        rng = random.Random(7)
+        keys = [self.board.zobrist_key]
+        for _ in range(40):
+            moves = list(self.board.legal_moves(self.board.side_to_move))
+            self.board.push(rng.choice(moves))
+            self.assertEqual(self.board.zobrist_key, hash_board(self.board))
+            keys.append(self.board.zobrist_key)
+
+        # pop recupera exactamente las claves anteriores
+        keys.pop()
+        while self.board.move_stack:
+            self.board.pop()
+            self.assertEqual(self.board.zobrist_key, keys.pop())
+
+    def test_transposition_same_key(self):
+        other = Board()
+        for board, order in ((self.board, ((7, 1), (7, 6))), (other, ((7, 6), (7, 1)))):
+            for origin in order:
+                knight = board.get_piece(*origin)
+                board.push((knight, (5, origin[1] + 1)))
+                board.push(next(board.legal_moves(BLACK)))
+        self.assertEqual(self.board.zobrist_key, other.zobrist_key)
+
+    def test_side_to_move_changes_key(self):
+        key = self.board.zobrist_key
+        self.board.set_side_to_move(BLACK)
+        self.assertEqual(self.board.zobrist_key, key ^ SIDE_KEY)
+        self.board.set_side_to_move(WHITE)
+        self.assertEqual(self.board.zobrist_key, key)
+
+    def test_set_piece_and_clean_board(self):
+        key = self.board.zobrist_key
+        self.board.set_piece_on_board(4, 4, Rook(WHITE, (4, 4)))
+        self.assertNotEqual(self.board.zobrist_key, key)
+        self.board.set_piece_on_board(4, 4, None)
+        self.assertEqual(self.board.zobrist_key, key)
+        self.board.clean_board()
+        self.assertEqual(self.board.zobrist_key, 0)
+        # Vaciar el tablero conserva el turno y su parte de la clave
+        chess = Chess()
+        chess.move("E7", "E5")
+        chess.board.clean_board()
+        self.assertEqual(chess.turn, "BLACK")
+        self.assertEqual(chess.board.side_to_move, BLACK)
+        self.assertEqual(chess.board.zobrist_key, SIDE_KEY)
+        self.assertEqual(chess.board.zobrist_key, hash_board(chess.board))
+
+    def test_chess_turn_is_hashed(self):
+        chess = Chess()
+        chess.move("E7", "E5")
+        self.assertEqual(chess.board.side_to_move, BLACK)
+        self.assertEqual(chess.board.zobrist_key, hash_board(chess.board))
+
+if __name__ == '__main__':
+    unittest.main()
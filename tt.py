@@ -0,0 +1,255 @@
+# tt.py
+
+"""
+Fixed-size transposition table for caching search results by position.
+
+Positions are keyed by Board.zobrist_key, which already covers the side to
+move. Each slot is a single 64-bit word in a flat array('Q'), so the table
+costs 8 bytes per entry and a 256 MB table holds over 33 million entries.
+A word packs, from the low bits up:
+
+    bound     2 bits   (0 marks an empty slot)
+    depth     8 bits
+    score    16 bits   (stored with an offset of 32768)
+    move     12 bits   (origin square << 6 | destination square)
+    check    26 bits   (top bits of the key, to tell positions apart)
+
+The slot is chosen from the low bits of the key and verified with the top
+bits, so two positions only get confused when both agree. Because an entry
+is one aligned word, processes sharing a table (see parallel.py) can read
+and write it without locks: a reader sees either the old or the new entry.
+"""
+
+from array import array
+
+EXACT = 1
+LOWER = 2
+UPPER = 3
+
+ALWAYS_REPLACE = "always"
+DEPTH_PREFERRED = "depth"
+TWO_TIER = "two-tier"
+
+POLICIES = (ALWAYS_REPLACE, DEPTH_PREFERRED, TWO_TIER)
+
+ENTRY_SIZE = 8
+MAX_SCORE = 32767
+
+_CHECK_SHIFT = 38
+_MOVE_SHIFT = 26
+_SCORE_SHIFT = 10
+_DEPTH_SHIFT = 2
+
+
+def encode_move(move):
+    """
+    Packs a move given as squares into 12 bits.
+
+    Parameters:
+        move (tuple or None): The move as ((row, col), (row, col)), or None.
+
+    Returns:
+        int: The packed move, 0 when there is none.
+    """
+    if move is None:
+        return 0
+    (from_row, from_col), (to_row, to_col) = move
+    return (from_row * 8 + from_col) << 6 | (to_row * 8 + to_col)
+
+
+def decode_move(packed):
+    """
+    Unpacks a move packed with encode_move.
+
+    Parameters:
+        packed (int): The packed move.
+
+    Returns:
+        tuple or None: The move as ((row, col), (row, col)), or None.
+    """
+    if not packed:
+        return None
+    return divmod(packed >> 6, 8), divmod(packed & 63, 8)
+
+
+class TranspositionTable:
+    """
+    A bounded hash table of search results with a configurable replacement policy.
+    """
+
+    def __init__(self, size_mb=16, policy=DEPTH_PREFERRED, buffer=None):
+        """
+        Allocates the table.
+
+        Parameters:
+            size_mb (float): Hard memory cap for the entries, in megabytes.
+            policy (str): "always" (always replace), "depth" (keep the deeper
+                entry) or "two-tier" (buckets of a depth-preferred slot plus
+                an always-replace slot).
+            buffer (object): Optional writable buffer of at least size_mb
+                megabytes (e.g. SharedMemory.buf) to keep the entries in
+                instead of a private array, so several processes can share them.
+
+        Raises:
+            ValueError: If the policy is unknown or the table would be empty.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown replacement policy: {policy}")
+        entries = int(size_mb * 1024 * 1024) // ENTRY_SIZE
+        if policy == TWO_TIER:
+            entries -= entries % 2
+        if entries <= 0:
+            raise ValueError("The table must hold at least one bucket.")
+
+        self.policy = policy
+        self.size = entries
+        if buffer is None:
+            self.table = array("Q", [0]) * entries
+        else:
+            self.table = memoryview(buffer)[:entries * ENTRY_SIZE].cast("Q")
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Resets the probe and store counters.
+        """
+        self.probes = 0
+        self.hits = 0
+        self.collisions = 0
+        self.stores = 0
+        self.overwrites = 0
+        self.rejected = 0
+
+    def clear(self):
+        """
+        Empties every slot and resets the statistics.
+        """
+        self.table[:] = array("Q", [0]) * self.size
+        self.reset_stats()
+
+    def release(self):
+        """
+        Releases the view of an external buffer so its owner can close it.
+        """
+        if isinstance(self.table, memoryview):
+            self.table.release()
+
+    def _slots(self, key):
+        """
+        Returns the slot indexes a key may live in.
+
+        Parameters:
+            key (int): The position key.
+
+        Returns:
+            tuple: One index, or two for the two-tier policy.
+        """
+        if self.policy == TWO_TIER:
+            first = key % (self.size // 2) * 2
+            return (first, first + 1)
+        return (key % self.size,)
+
+    def probe(self, key):
+        """
+        Looks up a position.
+
+        Parameters:
+            key (int): The position key (Board.zobrist_key).
+
+        Returns:
+            tuple or None: (score, depth, bound, move) if the position is stored, else None.
+        """
+        self.probes += 1
+        check = key >> _CHECK_SHIFT
+        occupied = False
+        for slot in self._slots(key):
+            word = self.table[slot]
+            if not word & 3:
+                continue
+            if word >> _CHECK_SHIFT == check:
+                self.hits += 1
+                return (
+                    (word >> _SCORE_SHIFT & 0xFFFF) - 32768,
+                    word >> _DEPTH_SHIFT & 0xFF,
+                    word & 3,
+                    decode_move(word >> _MOVE_SHIFT & 0xFFF),
+                )
+            occupied = True
+        if occupied:
+            self.collisions += 1
+        return None
+
+    def store(self, key, depth, score, bound, move=None):
+        """
+        Stores a search result, subject to the replacement policy.
+
+        Parameters:
+            key (int): The position key (Board.zobrist_key).
+            depth (int): The remaining search depth of the result (0-255).
+            score (int): The score, clamped to +/-32767.
+            bound (int): EXACT, LOWER or UPPER.
+            move (tuple or None): The best move as ((row, col), (row, col)).
+
+        Returns:
+            bool: True if the entry was written, False if the policy kept the old one.
+        """
+        depth = min(max(depth, 0), 255)
+        score = min(max(score, -MAX_SCORE), MAX_SCORE)
+        check = key >> _CHECK_SHIFT
+        word = (check << _CHECK_SHIFT | encode_move(move) << _MOVE_SHIFT
+                | (score + 32768) << _SCORE_SHIFT | depth << _DEPTH_SHIFT | bound)
+
+        slots = self._slots(key)
+        slot = slots[0]
+        old = self.table[slot]
+        same_position = old & 3 and old >> _CHECK_SHIFT == check
+        if self.policy != ALWAYS_REPLACE and old & 3 and not same_position:
+            if depth < (old >> _DEPTH_SHIFT & 0xFF):
+                if self.policy == DEPTH_PREFERRED:
+                    self.rejected += 1
+                    return False
+                # Two-tier: the shallower entry goes to the always-replace slot
+                slot = slots[1]
+                old = self.table[slot]
+                same_position = old & 3 and old >> _CHECK_SHIFT == check
+
+        if old & 3 and not same_position:
+            self.overwrites += 1
+        self.table[slot] = word
+        self.stores += 1
+        return True
+
+    def usage(self, sample=1000):
+        """
+        Estimates how full the table is from its first slots.
+
+        Parameters:
+            sample (int): How many slots to look at.
+
+        Returns:
+            float: The fraction of sampled slots in use (0.0 to 1.0).
+        """
+        sample = min(sample, self.size)
+        used = sum(1 for slot in range(sample) if self.table[slot] & 3)
+        return used / sample
+
+    def stats(self):
+        """
+        Reports the table's counters.
+
+        Returns:
+            dict: Entries, probes, hits, hit rate, collisions (probes that found
+            another position in the slot), stores, overwrites of other positions,
+            rejected stores and the sampled usage.
+        """
+        return {
+            "entries": self.size,
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.probes if self.probes else 0.0,
+            "collisions": self.collisions,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "rejected": self.rejected,
+            "usage": self.usage(),
+        }
@@ -0,0 +1,218 @@
+# vectorized.py
+
+"""
+NumPy operations over many positions at once.
+
+Positions are rows of an (N, 64) int8 array holding the signed piece codes
+of encoding.py (1 to 6 for white pawn to king, -1 to -6 for black, 0 for
+empty), indexed by square (row * 8 + col). encode_boards builds one from
+boards or snapshots.
+
+The rule tables from attacks.py are unpacked into arrays once at import,
+as are the piece-square scores of evaluation.py, so a batch is answered
+with array gathers, comparisons and sums, without a Python loop over the
+positions.
+"""
+
+import numpy as np
+from attacks import (
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS,
+    ROOK_MOVES, BISHOP_MOVES, QUEEN_MOVES, BETWEEN_SQUARES
+)
+from bitboard import square_index
+from encoding import CODES, signed
+from evaluation import SQUARE_SCORES
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(1, 7)
+
+# Padding square: boards get a 65th, always empty column for the gathers below
+_OFF_BOARD = 64
+_MAX_BETWEEN = 6
+
+
+def _mask_rows(masks):
+    """
+    Unpacks 64 bitboards into a (64, 64) boolean array.
+
+    Parameters:
+        masks (tuple): One bitboard per square.
+
+    Returns:
+        ndarray: Row s holds the squares set in masks[s].
+    """
+    return np.array([[bool(mask >> square & 1) for square in range(64)] for mask in masks])
+
+
+# PATTERNS[piece, origin, destination]: the piece's movement on an empty board (pawns apart)
+PATTERNS = np.zeros((7, 64, 64), dtype=bool)
+PATTERNS[KNIGHT] = _mask_rows(KNIGHT_ATTACKS)
+PATTERNS[BISHOP] = _mask_rows(BISHOP_MOVES)
+PATTERNS[ROOK] = _mask_rows(ROOK_MOVES)
+PATTERNS[QUEEN] = _mask_rows(QUEEN_MOVES)
+PATTERNS[KING] = _mask_rows(KING_ATTACKS)
+
+# PAWN_CAPTURES[0] for white pawns, [1] for black pawns
+PAWN_CAPTURES = np.stack([_mask_rows(PAWN_ATTACKS[-1]), _mask_rows(PAWN_ATTACKS[1])])
+
+# BETWEEN_INDEX[origin, destination]: the squares in between, padded with _OFF_BOARD
+BETWEEN_INDEX = np.full((64, 64, _MAX_BETWEEN), _OFF_BOARD, dtype=np.int8)
+for _origin in range(64):
+    for _destination in range(64):
+        _squares = BETWEEN_SQUARES[_origin][_destination] or ()
+        BETWEEN_INDEX[_origin, _destination, :len(_squares)] = [square_index(*s) for s in _squares]
+
+
+# SCORES[code + 6, square]: the evaluation.py score of the piece with that signed code there
+SCORES = np.zeros((13, 64), dtype=np.int32)
+for _key, _code in CODES.items():
+    SCORES[signed(_code) + 6] = SQUARE_SCORES[_key]
+
+
+def encode_boards(positions):
+    """
+    Builds the (N, 64) array of a batch of positions.
+
+    Parameters:
+        positions (iterable): Boards or snapshots (see Board.snapshot).
+
+    Returns:
+        ndarray: An (N, 64) int8 array of signed piece codes.
+    """
+    squares = b"".join(getattr(position, "squares", None) or position.snapshot().squares
+                       for position in positions)
+    return np.frombuffer(squares, dtype=np.int8).reshape(-1, 64)
+
+
+def validate_moves(boards, origins, destinations, sides=None):
+    """
+    Checks a batch of moves the way Board.validate_move does, without raising.
+
+    Move i is played on boards[i]. It is valid if there is a piece on its
+    origin, the piece's movement allows the destination (a clear path for
+    sliders; pushes onto empty squares and diagonal captures for pawns),
+    the destination holds neither a piece of the same color nor a king,
+    and the mover's king (if it has one) is not attacked after the move.
+
+    Parameters:
+        boards (array): An (N, 64) array of signed piece codes.
+        origins (array): N origin squares (row * 8 + col).
+        destinations (array): N destination squares.
+        sides (array): Optional N colors to move, 1 for white and -1 for black;
+            moves of a piece of the other color are then invalid.
+
+    Returns:
+        ndarray: N booleans, True where the move is valid.
+
+    Raises:
+        ValueError: If the shapes do not match or a square is not between 0 and 63.
+    """
+    boards = np.asarray(boards, dtype=np.int8)
+    origins = np.asarray(origins, dtype=np.intp)
+    destinations = np.asarray(destinations, dtype=np.intp)
+    count = len(boards)
+    if boards.shape != (count, 64) or origins.shape != (count,) or destinations.shape != (count,):
+        raise ValueError("Expected boards of shape (N, 64) and N origins and destinations.")
+    if count and (min(origins.min(), destinations.min()) < 0 or max(origins.max(), destinations.max()) > 63):
+        raise ValueError("Squares must be between 0 and 63.")
+
+    rows = np.arange(count)
+    pieces = boards[rows, origins]
+    targets = boards[rows, destinations]
+    kinds = np.abs(pieces)
+    colors = np.sign(pieces)
+
+    path_clear = _path_clear(boards, origins[:, None], destinations[:, None])[:, 0]
+
+    # Pawns: one step onto an empty square, two from the initial row, or a diagonal capture
+    step = np.where(colors > 0, -8, 8)
+    initial_row = np.where(colors > 0, 6, 1)
+    delta = destinations - origins
+    empty = targets == 0
+    pawn_moves = (
+        (delta == step) & empty
+        | (delta == 2 * step) & (origins // 8 == initial_row) & empty & path_clear
+        | PAWN_CAPTURES[(colors < 0).astype(np.intp), origins, destinations] & (colors * targets < 0)
+    )
+    piece_moves = PATTERNS[kinds, origins, destinations] & path_clear
+
+    valid = np.where(kinds == PAWN, pawn_moves, piece_moves)
+    valid &= pieces != 0
+    valid &= colors * targets <= 0
+    valid &= np.abs(targets) != KING
+    if sides is not None:
+        valid &= colors == np.asarray(sides)
+
+    # Play the remaining moves on a copy and look for attacks on the mover's king
+    kings = boards == (KING * colors)[:, None]
+    moves = np.flatnonzero(valid & kings.any(axis=1))
+    king_squares = np.where(kinds == KING, destinations, kings.argmax(axis=1))[moves]
+    after = boards[moves]
+    after[np.arange(len(moves)), destinations[moves]] = pieces[moves]
+    after[np.arange(len(moves)), origins[moves]] = 0
+    valid[moves] &= ~_attacked(after, king_squares, -colors[moves])
+    return valid
+
+
+def _path_clear(boards, origins, destinations):
+    """
+    Tells whether the squares strictly between pairs of squares are empty.
+
+    Parameters:
+        boards (ndarray): An (N, 64) array of signed piece codes.
+        origins (ndarray): (N, M) origin squares.
+        destinations (ndarray): (N, M) destination squares (broadcast against origins).
+
+    Returns:
+        ndarray: (N, M) booleans; True for squares that are not aligned.
+    """
+    padded = np.zeros((len(boards), 65), dtype=np.int8)
+    padded[:, :64] = boards
+    between = BETWEEN_INDEX[origins, destinations]
+    rows = np.arange(len(boards)).reshape(-1, 1, 1)
+    return ~padded[rows, between].any(axis=2)
+
+
+def _attacked(boards, squares, attackers):
+    """
+    Tells whether a square of each board is attacked by one side.
+
+    Parameters:
+        boards (ndarray): An (N, 64) array of signed piece codes.
+        squares (ndarray): N squares to look at.
+        attackers (ndarray): N attacking colors, 1 for white and -1 for black.
+
+    Returns:
+        ndarray: N booleans, True where some piece of the attacking color attacks the square.
+    """
+    origins = np.arange(64)[None, :]
+    targets = squares[:, None]
+    kinds = np.abs(boards).astype(np.intp)
+    enemy = boards * attackers[:, None].astype(np.int8) > 0
+    pawn_hits = PAWN_CAPTURES[(attackers < 0).astype(np.intp)[:, None], origins, targets]
+    piece_hits = PATTERNS[kinds, origins, targets] & _path_clear(boards, origins, targets)
+    return (enemy & np.where(kinds == PAWN, pawn_hits, piece_hits)).any(axis=1)
+
+
+def evaluate_batch(boards, sides=None):
+    """
+    Scores a batch of positions with the tables of evaluation.py.
+
+    Parameters:
+        boards (array): An (N, 64) array of signed piece codes.
+        sides (array): Optional N colors to move, 1 for white and -1 for black,
+            to score each position from its side to move's point of view.
+
+    Returns:
+        ndarray: N int32 scores in centipawns, from white's point of view
+        unless 'sides' is given.
+
+    Raises:
+        ValueError: If the boards are not an (N, 64) array.
+    """
+    boards = np.asarray(boards, dtype=np.int8)
+    if boards.ndim != 2 or boards.shape[1] != 64:
+        raise ValueError("Expected boards of shape (N, 64).")
+    scores = SCORES[boards.astype(np.intp) + 6, np.arange(64)].sum(axis=1, dtype=np.int32)
+    if sides is not None:
+        scores *= np.asarray(sides, dtype=np.int32)
+    return scores
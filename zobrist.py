@@ -0,0 +1,45 @@
+# zobrist.py
+
+"""
+Zobrist keys for hashing board positions.
+
+A position's key is the XOR of one random 64-bit number per (color, piece
+symbol, square) on the board, plus SIDE_KEY when black is to move. Adding or
+removing a piece is a single XOR, so Board keeps its key up to date as pieces
+move. The numbers come from a fixed seed so keys are stable across runs and
+processes.
+"""
+
+import random
+from piece import WHITE, BLACK
+
+SEED = 0x5A0B1257
+
+_random = random.Random(SEED)
+
+PIECE_KEYS = {
+    (color, symbol): tuple(_random.getrandbits(64) for _ in range(64))
+    for color in (WHITE, BLACK)
+    for symbol in "pnbrqk?"
+}
+
+SIDE_KEY = _random.getrandbits(64)
+
+
+def hash_board(board):
+    """
+    Computes a board's Zobrist key from scratch.
+
+    Board keeps its key incrementally in 'zobrist_key'; this is the reference
+    used to check it.
+
+    Parameters:
+        board (Board): The board to hash.
+
+    Returns:
+        int: The 64-bit position key.
+    """
+    key = SIDE_KEY if board.side_to_move == BLACK else 0
+    for piece, (row, col) in board.piece_squares.items():
+        key ^= PIECE_KEYS[(piece.color, piece.symbol)][row * 8 + col]
+    return key